@@ -0,0 +1,116 @@
+"""
+Durée de l'import en masse de clients depuis un fichier CSV et JSONL, puis de
+contrats et d'événements avec et sans pool de processus de validation.
+
+Usage : python -m benchmarks.bulk_import [nb_lignes]
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import seed_database
+from controllers.import_controller import (
+    import_clients,
+    import_contracts,
+    import_events,
+)
+
+FIELDS = ["nom_complet", "email", "telephone", "nom_entreprise", "date_de_creation"]
+
+
+def _write_files(directory: str, count: int) -> dict:
+    rows = [
+        {
+            "nom_complet": f"Import {i:07d}",
+            "email": f"import{i}@example.com",
+            "telephone": f"+33 7{i:08d}",
+            "nom_entreprise": f"Société {i % 1000}",
+            "date_de_creation": "2025-06-01T10:00:00",
+        }
+        for i in range(count)
+    ]
+    rows[count // 2]["email"] = ""  # une ligne invalide, signalée sans tout annuler
+    paths = {"csv": os.path.join(directory, "clients.csv")}
+    with open(paths["csv"], "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    paths["jsonl"] = os.path.join(directory, "clients.jsonl")
+    with open(paths["jsonl"], "w", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row) + "\n")
+    return paths
+
+
+def _write_jsonl(path: str, rows: list) -> str:
+    with open(path, "w", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row) + "\n")
+    return path
+
+
+def _report(name: str, report, elapsed: float) -> None:
+    print(
+        f"{name:>22} : {report.inserted} lignes en {elapsed:.2f} s "
+        f"({report.inserted / elapsed:.0f}/s), {len(report.errors)} erreur(s)"
+    )
+
+
+def run_contracts_and_events(directory: str, count: int) -> None:
+    # seed_database crée les clients 1..count, nommés « Client 0000001 »...
+    contracts = [
+        {
+            "client_id": i % count + 1,
+            "contact_commercial": "Service achats",
+            "montant_total": 1000 + i,
+            "statut_contrat": "signé",
+        }
+        for i in range(count)
+    ]
+    # Un client inexistant, en dernière ligne pour que le contrat i reste celui
+    # du client i.
+    contracts[-1]["client_id"] = count + 10
+    events = [
+        {
+            "contract_id": i % count + 1,
+            "client_name": f"Client {i % count + 1:07d}",
+            "date_debut": "2026-03-01",
+            "date_fin": "2026-03-02",
+            "lieu": "Paris",
+            "participants": 50,
+        }
+        for i in range(count)
+    ]
+    events[1]["client_name"] = "Client 0000003"  # ne correspond pas au contrat 2
+    # Le même support aux mêmes dates : la seconde ligne est rejetée.
+    events[2]["collaborateur_id"] = events[3]["collaborateur_id"] = 2
+    contracts_path = _write_jsonl(os.path.join(directory, "contracts.jsonl"), contracts)
+    events_path = _write_jsonl(os.path.join(directory, "events.jsonl"), events)
+    for workers in (1, max(2, os.cpu_count() or 1)):
+        seed_database(count, commerciaux=10)
+        start = time.perf_counter()
+        report = import_contracts(contracts_path, workers=workers)
+        _report(f"contrats ({workers} proc.)", report, time.perf_counter() - start)
+        start = time.perf_counter()
+        report = import_events(events_path, workers=workers)
+        _report(f"événements ({workers} proc.)", report, time.perf_counter() - start)
+
+
+def run(count: int = 100000) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_files(directory, count)
+        for name, path in paths.items():
+            seed_database(0, commerciaux=1)
+            start = time.perf_counter()
+            report = import_clients(path, collaborateur_id=1)
+            _report(f"clients {name}", report, time.perf_counter() - start)
+        run_contracts_and_events(directory, count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
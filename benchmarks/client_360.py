@@ -0,0 +1,51 @@
+"""
+Nombre de requêtes de la fiche complète d'un client (option 19 du menu) selon
+le nombre de contrats et d'événements du client.
+
+La fiche doit tenir en trois requêtes au plus, quelle que soit sa taille ; le
+script échoue sinon.
+
+Usage : python -m benchmarks.client_360
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.common import count_queries, seed_database, silent_console
+from controllers.client_controller import get_client_360
+from views.client_view import display_client_360
+
+MAX_QUERIES = 3
+# (contrats par client, événements par contrat)
+SIZES = ((0, 0), (1, 1), (10, 5), (100, 10))
+
+
+def run() -> int:
+    status = 0
+    for contracts, events in SIZES:
+        seed_database(3, contracts_per_client=contracts, events_per_contract=events)
+        start = time.perf_counter()
+        with count_queries() as counter:
+            client = get_client_360(2)
+        with silent_console(), contextlib.redirect_stdout(io.StringIO()):
+            # Affichage après fermeture de la session : aucune requête ne doit
+            # partir des relations.
+            with count_queries() as display_counter:
+                display_client_360(client)
+        elapsed = (time.perf_counter() - start) * 1000
+        queries = counter.count + display_counter.count
+        print(
+            f"{len(client.contracts):>4} contrats, {len(client.events):>5} événements : "
+            f"{queries} requête(s), {elapsed:.1f} ms"
+        )
+        if queries > MAX_QUERIES:
+            status = 1
+    if status:
+        print(f"La fiche client dépasse {MAX_QUERIES} requêtes.")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,106 @@
+"""
+Recherche approximative d'un client (options 4, 5 et 6 du menu) : chargement de
+l'index de trigrammes, mémoire occupée, durée d'une recherche avec fautes de
+frappe, comparée à la lecture de la liste complète qu'elle remplace.
+
+Le script vérifie aussi que l'index suit les créations, modifications et
+suppressions de clients, et échoue sinon.
+
+Usage : python -m benchmarks.client_lookup [nb_clients]
+"""
+
+import datetime
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+from benchmarks.common import seed_database
+from controllers import client_controller
+from database.db_config import session_scope
+from database.trigram import TrigramIndex
+from models.client import Client
+from controllers.client_controller import (
+    create_client,
+    delete_client,
+    find_clients,
+    get_clients_with_commercial,
+    update_client,
+)
+
+# (saisie, identifiant attendu en tête des candidats)
+QUERIES = (
+    ("Clinet 0004242", 4242),
+    ("client4242@exmple.com", 4242),
+    ("clent 0012345", 12345),
+    ("Entreprize 996", None),
+)
+REPEAT = 20
+
+
+def _timed(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def _first_id(query: str):
+    candidates = find_clients(query)
+    return candidates[0][0].id if candidates else None
+
+
+def run(clients: int = 50000) -> int:
+    seed_database(clients)
+    client_controller.invalidate_client_index()
+    start = time.perf_counter()
+    find_clients("chargement")
+    load_ms = (time.perf_counter() - start) * 1000
+    with session_scope() as session:
+        rows = session.execute(
+            select(Client.id, Client.nom_complet, Client.nom_entreprise, Client.email)
+        ).all()
+    tracemalloc.start()
+    index = TrigramIndex()
+    index.load((row[0], row[1:]) for row in rows)
+    memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    print(
+        f"Index de {clients} clients chargé en {load_ms:.0f} ms, "
+        f"{memory:.1f} Mo ({index!r})"
+    )
+    print(
+        f"Liste complète (ancien affichage) : "
+        f"{_timed(get_clients_with_commercial) :8.2f} ms"
+    )
+    status = 0
+    for query, expected in QUERIES:
+        candidates = find_clients(query)
+        best = candidates[0] if candidates else None
+        print(
+            f"{query!r:>26} : {_timed(find_clients, query):6.2f} ms, "
+            f"{len(candidates)} candidat(s), meilleur "
+            f"{best[0].nom_complet if best else '-'} ({best[2] if best else 0})"
+        )
+        if expected is not None and (best is None or best[0].id != expected):
+            print(f"    attendu : client {expected}")
+            status = 1
+
+    today = datetime.date.today()
+    client = create_client(
+        "Hélène Dévèloppe", "helene@acme.fr", "0600000000", "Acmé", today, today, 1
+    )
+    checks = {"création": _first_id("helene developpe") == client.id}
+    update_client(client.id, {"nom_entreprise": "Initech"})
+    checks["modification"] = _first_id("initek") == client.id
+    delete_client(client.id)
+    checks["suppression"] = _first_id("helene developpe") != client.id
+    for name, ok in checks.items():
+        print(f"Index à jour après {name} : {'oui' if ok else 'NON'}")
+        status |= not ok
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,198 @@
+import datetime
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+# Les scripts de benchmark tournent sur une base SQLite jetable sauf si
+# DATABASE_URL est déjà défini (MySQL par exemple).
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.gettempdir(), 'epicevents_bench.db')}",
+)
+
+from sqlalchemy import event, insert  # noqa: E402
+from database import db_config  # noqa: E402
+from database.migrations import migrate, schema_metadata  # noqa: E402
+from database.rollups import reconcile_rollups  # noqa: E402
+from models.base import Base  # noqa: E402
+from models.client import Client  # noqa: E402
+from models.collaborateur import Collaborateur  # noqa: E402
+from models.contract import Contract  # noqa: E402
+from models.event import Events  # noqa: E402
+
+
+def reset_database() -> None:
+    """
+    Supprime toutes les tables de la base de benchmark puis rejoue les migrations.
+    """
+    db_config.ScopedSession.remove()
+    # Les connexions ouvertes par d'autres threads garderaient en mémoire
+    # l'ancien schéma SQLite, que les PRAGMA de l'inspecteur relisent.
+    db_config.engine.dispose()
+    Base.metadata.drop_all(db_config.engine)
+    schema_metadata.drop_all(db_config.engine)
+    migrate()
+
+
+def seed_database(
+    clients: int,
+    contracts_per_client: int = 0,
+    events_per_contract: int = 0,
+    commerciaux: int = 10,
+    batch_size: int = 5000,
+) -> Dict[str, int]:
+    """
+    Remplit une base vide avec des données factices, par lots.
+
+    Args:
+        clients (int): Le nombre de clients à créer.
+        contracts_per_client (int): Le nombre de contrats par client.
+        events_per_contract (int): Le nombre d'évènements par contrat.
+        commerciaux (int): Le nombre de commerciaux (autant de supports sont créés).
+        batch_size (int): Le nombre de lignes par INSERT groupé.
+
+    Returns:
+        dict: Le nombre de lignes créées par table.
+    """
+    reset_database()
+    now = datetime.datetime(2026, 1, 1)
+    counts = {"collaborateurs": 0, "client": 0, "contract": 0, "events": 0}
+
+    def flush(connection, model, rows):
+        if rows:
+            connection.execute(insert(model), rows)
+            counts[model.__tablename__] += len(rows)
+            rows.clear()
+
+    with db_config.engine.begin() as connection:
+        rows = []
+        for i in range(commerciaux):
+            for role in ("commercial", "support"):
+                rows.append(
+                    {
+                        "nom_utilisateur": f"{role}-{i}",
+                        "mot_de_passe": "x" * 64,
+                        "salt": "0" * 16,
+                        "role": role,
+                        "is_connected": False,
+                    }
+                )
+        flush(connection, Collaborateur, rows)
+
+        client_rows, contract_rows, event_rows = [], [], []
+        contract_id = 0
+        for client_id in range(1, clients + 1):
+            commercial_id = (client_id % commerciaux) * 2 + 1
+            support_id = commercial_id + 1
+            nom_complet = f"Client {client_id:07d}"
+            client_rows.append(
+                {
+                    "id": client_id,
+                    "nom_complet": nom_complet,
+                    "email": f"client{client_id}@example.com",
+                    "telephone": f"+33 6{client_id:08d}",
+                    "nom_entreprise": f"Entreprise {client_id % 997}",
+                    "date_de_creation": now - datetime.timedelta(days=client_id % 730),
+                    "derniere_maj_contact": now,
+                    "collaborateur_id": commercial_id,
+                }
+            )
+            for c in range(contracts_per_client):
+                contract_id += 1
+                montant = 1000 + (contract_id * 37) % 50000
+                contract_rows.append(
+                    {
+                        "id": contract_id,
+                        "client_id": client_id,
+                        "contact_commercial": f"commercial-{commercial_id}",
+                        "collaborateur_id": commercial_id,
+                        "montant_total": montant,
+                        "montant_restant_a_payer": montant // (1 + c % 3),
+                        "statut_contrat": "terminé" if c % 2 else "en cours",
+                    }
+                )
+                for e in range(events_per_contract):
+                    debut = now + datetime.timedelta(
+                        days=(contract_id * 7 + e) % 730 - 365
+                    )
+                    event_rows.append(
+                        {
+                            "contract_id": contract_id,
+                            "client_id": client_id,
+                            "client_name": nom_complet,
+                            "collaborateur_id": support_id,
+                            "date_debut": debut.date(),
+                            "date_fin": (debut + datetime.timedelta(days=1)).date(),
+                            "contact_support": f"support-{support_id}",
+                            "lieu": f"Salle {e} - Paris",
+                            "participants": 10 + e,
+                            "notes": f"Évènement {e} du contrat {contract_id}",
+                        }
+                    )
+            if len(client_rows) >= batch_size:
+                flush(connection, Client, client_rows)
+            if len(contract_rows) >= batch_size:
+                flush(connection, Client, client_rows)
+                flush(connection, Contract, contract_rows)
+            if len(event_rows) >= batch_size:
+                flush(connection, Client, client_rows)
+                flush(connection, Contract, contract_rows)
+                flush(connection, Events, event_rows)
+        flush(connection, Client, client_rows)
+        flush(connection, Contract, contract_rows)
+        flush(connection, Events, event_rows)
+        # Les lignes sont insérées sans passer par les contrôleurs.
+        reconcile_rollups(connection)
+    return counts
+
+
+class QueryCounter:
+    """
+    Compte les requêtes SQL envoyées au moteur pendant un bloc.
+
+    Attributes:
+        count (int): Le nombre de requêtes.
+        statements (list): Les couples (requête, paramètres) exécutés.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append((statement, parameters))
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Compte les requêtes exécutées dans le bloc.
+
+    Yields:
+        QueryCounter: Le compteur, dont l'attribut count est à jour en sortie.
+    """
+    counter = QueryCounter()
+    engine = db_config.engine
+    event.listen(engine, "before_cursor_execute", counter._on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._on_execute)
+
+
+@contextmanager
+def silent_console() -> Iterator[None]:
+    """
+    Redirige l'affichage Rich des vues vers un tampon le temps du bloc.
+    """
+    from views.main_view import console
+
+    original = console.file
+    console.file = io.StringIO()
+    try:
+        yield
+    finally:
+        console.file = original
@@ -0,0 +1,108 @@
+"""
+Conflits de planning des supports : temps d'une vérification de chevauchement
+(find_conflicts) et d'une requête « événements entre deux dates »
+(get_events_between) sur une base de plusieurs centaines de milliers
+d'événements, avec le plan d'exécution de chaque requête.
+
+La vérification lit l'index (collaborateur_id, date_fin, date_debut) à partir
+de la date de début demandée : l'historique du support n'est pas parcouru. Cas
+le plus défavorable : une période libre au milieu d'un planning très chargé,
+où tous les événements futurs du support sont lus dans l'index.
+
+Le script échoue si une période libre est signalée en conflit ou si une période
+occupée ne l'est pas.
+
+Usage : python -m benchmarks.event_conflicts [nb_clients]
+"""
+
+import datetime
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+
+from benchmarks.common import seed_database
+from controllers.event_controller import find_conflicts, get_events_between
+from database.db_config import session_scope
+
+CHECKS = 2000
+SUPPORT_ID = 2
+
+
+def _timed(function, runs: int) -> float:
+    with session_scope() as session:
+        durations = []
+        for i in range(runs):
+            start = time.perf_counter()
+            function(session, i)
+            durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def _plan(session, sql: str, **params) -> None:
+    for row in session.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params):
+        print(f"    {row[-1]}")
+
+
+def run(clients: int = 125000) -> int:
+    counts = seed_database(clients, contracts_per_client=2, events_per_contract=2)
+    print(f"{counts['events']} événements")
+    # Les événements factices s'étalent sur un an autour du 2026-01-01.
+    free = datetime.date(2027, 6, 1)
+    busy = datetime.date(2026, 3, 1)
+
+    with session_scope() as session:
+        if find_conflicts(SUPPORT_ID, free, free, session=session):
+            print("Une période libre est signalée en conflit.")
+            return 1
+        if not find_conflicts(SUPPORT_ID, busy, busy, session=session):
+            print("Une période occupée n'est pas signalée en conflit.")
+            return 1
+        print("Plan de la vérification de conflit :")
+        _plan(
+            session,
+            "SELECT id FROM events WHERE collaborateur_id = :c "
+            "AND date_fin >= :d AND date_debut <= :f",
+            c=SUPPORT_ID,
+            d=free,
+            f=free,
+        )
+        print("Plan de la recherche entre deux dates :")
+        _plan(
+            session,
+            "SELECT * FROM events WHERE id IN (SELECT id FROM events "
+            "WHERE date_fin >= :d AND date_debut <= :f) ORDER BY date_debut, id",
+            d=busy,
+            f=busy,
+        )
+
+    elapsed = _timed(
+        lambda session, i: find_conflicts(
+            SUPPORT_ID + 2 * (i % 10), free, free, session=session
+        ),
+        CHECKS,
+    )
+    print(f"Vérification, période libre    : {elapsed:8.3f} ms (médiane)")
+    elapsed = _timed(
+        lambda session, i: find_conflicts(
+            SUPPORT_ID + 2 * (i % 10),
+            busy + datetime.timedelta(days=i % 30),
+            busy + datetime.timedelta(days=i % 30),
+            session=session,
+        ),
+        CHECKS // 10,
+    )
+    print(f"Vérification, période occupée  : {elapsed:8.3f} ms (médiane)")
+    elapsed = _timed(
+        lambda session, i: get_events_between(
+            busy, busy + datetime.timedelta(days=1), session=session
+        ),
+        20,
+    )
+    print(f"Événements sur deux jours      : {elapsed:8.3f} ms (médiane)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,59 @@
+"""
+Durée d'une recherche sur les notes et lieux des événements : index plein texte
+(FTS5 sous SQLite, FULLTEXT sous MySQL) contre un filtre LIKE '%...%'.
+
+Le classement (bm25) porte sur toutes les lignes correspondantes avant de garder
+les meilleures : une recherche sélective répond en quelques millisecondes, alors
+qu'un mot présent dans presque toutes les lignes (« Paris ») reste le pire cas.
+
+Usage : python -m benchmarks.fulltext_search [nb_evenements]
+"""
+
+import sys
+import time
+
+from sqlalchemy import or_, select
+
+from benchmarks.common import seed_database
+from database.db_config import session_scope
+from controllers.search_controller import search_events
+from models.event import Events
+
+QUERIES = ("contrat 4242", "Paris", "Salle 3", "inexistant")
+REPEAT = 5
+
+
+def _like(query: str):
+    conditions = [
+        or_(Events.notes.like(f"%{term}%"), Events.lieu.like(f"%{term}%"))
+        for term in query.split()
+    ]
+    with session_scope() as session:
+        return session.scalars(select(Events).where(*conditions).limit(20)).all()
+
+
+def _timed(function, query: str) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function(query)
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def run(events: int = 1000000) -> int:
+    contracts = max(1, events // 5)
+    start = time.perf_counter()
+    seed_database(max(1, contracts // 2), contracts_per_client=2, events_per_contract=5)
+    print(
+        f"{events} événements créés et indexés en {time.perf_counter() - start:.1f} s"
+    )
+    for query in QUERIES:
+        found = len(search_events(query))
+        print(
+            f"{query!r:>16} : {found:>2} résultat(s), plein texte "
+            f"{_timed(search_events, query):8.2f} ms, LIKE {_timed(_like, query):8.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
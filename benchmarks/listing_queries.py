@@ -0,0 +1,54 @@
+"""
+Nombre de requêtes des listes de clients et de contrats selon le nombre de lignes.
+
+Avant : une requête par ligne pour retrouver le nom du commercial ou du support
+(N+1). Après : une seule requête jointe, quel que soit le nombre de lignes.
+
+Usage : python -m benchmarks.listing_queries
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.common import count_queries, seed_database, silent_console
+from controllers.client_controller import get_clients_with_commercial
+from controllers.contract_controller import get_contracts_filter_by_price
+from views.client_view import display_list_of_clients
+from views.contract_view import display_list_of_contracts
+
+SIZES = (10, 100, 1000)
+
+LISTINGS = {
+    "clients (menu 12)": lambda: display_list_of_clients(get_clients_with_commercial()),
+    "contrats (menu 14)": lambda: display_list_of_contracts(
+        get_contracts_filter_by_price()
+    ),
+}
+
+
+def run() -> int:
+    status = 0
+    for name, listing in LISTINGS.items():
+        results = []
+        for size in SIZES:
+            seed_database(size, contracts_per_client=1)
+            start = time.perf_counter()
+            with count_queries() as counter, silent_console():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    listing()
+            elapsed = time.perf_counter() - start
+            results.append(counter.count)
+            print(
+                f"{name} - {size:>5} lignes : {counter.count} requête(s), "
+                f"{elapsed * 1000:.1f} ms"
+            )
+        if len(set(results)) != 1:
+            print(f"ERREUR: le nombre de requêtes de {name} dépend du nombre de lignes")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,103 @@
+"""
+Connexions simultanées (prise de poste : 200 collaborateurs en même temps) :
+connexions par seconde et latence selon le coût scrypt des mots de passe, et
+pour la première connexion d'un compte à l'ancien hachage sha3_256, qui
+inclut le recalcul au coût courant.
+
+Chaque connexion passe par authenticate_collaborateur ; les vérifications sont
+réparties sur le pool PASSWORD_WORKERS, dont la taille borne aussi la mémoire
+scrypt utilisée simultanément (128 * n * r octets par vérification).
+
+Usage : python -m benchmarks.login_throughput [nb_collaborateurs]
+"""
+
+import hashlib
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import insert
+
+from benchmarks.common import reset_database
+from controllers import collaborateur_controlleur
+from controllers.collaborateur_controlleur import (
+    PASSWORD_WORKERS,
+    authenticate_collaborateur,
+    hash_password,
+)
+from database import db_config
+from models.collaborateur import Collaborateur
+
+PASSWORD = "mot-de-passe-de-test"
+COSTS = [(2**12, 8, 1), (2**14, 8, 1), (2**15, 8, 1), (2**16, 8, 1)]
+
+
+def _seed(staff: int, hashed_password: str, salt: str) -> None:
+    reset_database()
+    with db_config.engine.begin() as connection:
+        connection.execute(
+            insert(Collaborateur),
+            [
+                {
+                    "nom_utilisateur": f"collaborateur-{i}",
+                    "mot_de_passe": hashed_password,
+                    "salt": salt,
+                    "role": "support",
+                    "is_connected": False,
+                }
+                for i in range(staff)
+            ],
+        )
+
+
+def _login(i: int) -> float:
+    start = time.perf_counter()
+    try:
+        if authenticate_collaborateur(f"collaborateur-{i}", PASSWORD) is None:
+            raise AssertionError(f"connexion refusée : collaborateur-{i}")
+    finally:
+        db_config.ScopedSession.remove()
+    return (time.perf_counter() - start) * 1000
+
+
+def _burst(staff: int) -> None:
+    start = time.perf_counter()
+    # Un thread par collaborateur qui se connecte en même temps.
+    with ThreadPoolExecutor(max_workers=staff) as clients:
+        latencies = sorted(clients.map(_login, range(staff)))
+    elapsed = time.perf_counter() - start
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{staff / elapsed:10.1f} connexions/s  "
+        f"médiane {statistics.median(latencies):8.1f} ms  p95 {p95:8.1f} ms"
+    )
+
+
+def run(staff: int = 200) -> int:
+    print(
+        f"{staff} connexions simultanées, {PASSWORD_WORKERS} vérification(s) en parallèle"
+    )
+    salt = "0" * 16
+    original_cost = collaborateur_controlleur.PASSWORD_COST
+    # Comptes antérieurs à scrypt : la première connexion vérifie l'empreinte
+    # sha3_256 puis la remplace par un hachage au coût courant.
+    _seed(staff, hashlib.sha3_256((PASSWORD + salt).encode()).hexdigest(), salt)
+    print(f"{'sha3_256, 1re connexion':<34}", end="")
+    _burst(staff)
+    try:
+        for cost in COSTS:
+            n, r, p = cost
+            collaborateur_controlleur.PASSWORD_COST = cost
+            _seed(staff, *hash_password(PASSWORD, cost))
+            memory = 128 * n * r * PASSWORD_WORKERS / 2**20
+            label = f"scrypt n=2^{n.bit_length() - 1} r={r} p={p} ({memory:.0f} Mo)"
+            print(f"{label:<34}", end="")
+            _burst(staff)
+    finally:
+        collaborateur_controlleur.PASSWORD_COST = original_cost
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,121 @@
+"""
+Requêtes SQL des actions de consultation du menu, comptées comme dans
+l'application (record_queries) : nombre de requêtes, objets chargés, temps SQL
+et requêtes répétées dans une même action (motif N+1), pour deux tailles de
+base.
+
+Chaque liste affiche sa première page puis la suivante, comme browse_pages.
+Une dernière action lit des clients un par un pour vérifier que le motif N+1
+est bien signalé.
+
+Le script échoue si une action du menu répète une requête, si son nombre de
+requêtes croît avec la taille de la base, ou si le N+1 volontaire n'est pas
+signalé.
+
+Usage : python -m benchmarks.menu_queries
+"""
+
+import contextlib
+import datetime
+import io
+import sys
+from typing import Callable, Dict, List
+
+from benchmarks.common import seed_database, silent_console
+from controllers.client_controller import (
+    get_client_360,
+    get_client_by_id,
+    get_clients_page,
+)
+from controllers.collaborateur_controlleur import get_collaborateurs_page
+from controllers.contract_controller import get_contracts_by_price_page
+from controllers.event_controller import (
+    get_events_between,
+    get_events_page,
+    get_past_events_page,
+    get_upcoming_events_page,
+)
+from database.db_config import query_monitor, record_queries, session_scope
+from views.client_view import display_client_360, display_list_of_clients
+from views.collaborateur_view import display_list_of_collaborateurs
+from views.contract_view import display_list_of_contracts
+from views.event_view import (
+    display_events_future,
+    display_events_passed,
+    display_list_of_events,
+)
+
+SIZES = (200, 2000)
+
+
+def _two_pages(fetch_page, display_page) -> Callable[[], None]:
+    def browse() -> None:
+        page = fetch_page(None)
+        display_page(page.items)
+        if page.has_next:
+            display_page(fetch_page(page.next_cursor).items)
+
+    return browse
+
+
+ACTIONS: Dict[str, Callable[[], None]] = {
+    "menu.option_12": _two_pages(get_clients_page, display_list_of_clients),
+    "menu.option_13": _two_pages(
+        get_collaborateurs_page, display_list_of_collaborateurs
+    ),
+    "menu.option_14": _two_pages(
+        get_contracts_by_price_page, display_list_of_contracts
+    ),
+    "menu.option_15": _two_pages(get_events_page, display_list_of_events),
+    "menu.option_16": _two_pages(get_past_events_page, display_events_passed),
+    "menu.option_17": _two_pages(get_upcoming_events_page, display_events_future),
+    "menu.option_19": lambda: display_client_360(get_client_360(1)),
+    "menu.option_22": lambda: display_list_of_events(
+        get_events_between(datetime.date(2026, 1, 1), datetime.date(2026, 1, 7))
+    ),
+}
+
+
+def _n_plus_one() -> None:
+    for client_id in range(1, 21):
+        get_client_by_id(client_id)
+
+
+def run() -> int:
+    status = 0
+    queries: Dict[str, List[int]] = {name: [] for name in ACTIONS}
+    for size in SIZES:
+        seed_database(size, contracts_per_client=2, events_per_contract=1)
+        query_monitor.reset()
+        print(f"{size} clients :")
+        for name, action in ACTIONS.items():
+            with silent_console(), contextlib.redirect_stdout(io.StringIO()):
+                with record_queries(name) as stats, session_scope():
+                    action()
+            queries[name].append(stats.queries)
+            repeated = stats.repeated(query_monitor.repeated_statements)
+            print(
+                f"  {name:<16} {stats.queries:3d} requête(s), "
+                f"{stats.loaded:5d} objet(s), {stats.elapsed * 1000:7.1f} ms SQL"
+                + (f", {len(repeated)} requête(s) répétée(s)" if repeated else "")
+            )
+            if repeated:
+                status = 1
+
+    for name, counts in queries.items():
+        if counts[-1] > counts[0]:
+            print(f"ERREUR: le nombre de requêtes de {name} croît avec la base")
+            status = 1
+
+    with record_queries("n+1 volontaire") as stats, session_scope():
+        _n_plus_one()
+    if not stats.repeated(query_monitor.repeated_statements):
+        print("ERREUR: la lecture des clients un par un n'est pas signalée")
+        status = 1
+    else:
+        print(f"N+1 volontaire signalé : {stats.queries} requêtes")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(run())
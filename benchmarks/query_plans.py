@@ -0,0 +1,128 @@
+"""
+Plan d'exécution des requêtes filtrées des contrôleurs, sans puis avec les index
+créés par les migrations.
+
+Chaque appel de contrôleur est exécuté, ses requêtes SELECT sont capturées puis
+passées à EXPLAIN QUERY PLAN (SQLite) ou EXPLAIN (MySQL). Le script échoue si
+une requête parcourt encore une table entière une fois les index en place.
+
+Usage : python -m benchmarks.query_plans [nb_clients]
+"""
+
+import datetime
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.common import count_queries, seed_database
+from database import db_config
+from models.base import Base
+from controllers.client_controller import (
+    get_clients_filter_by_collaborateur,
+    get_clients_filtered,
+    get_clients_page,
+)
+from controllers.collaborateur_controlleur import (
+    get_all_commercial,
+    get_only_id_collaborateur,
+)
+from controllers.contract_controller import (
+    get_all_contracts_page,
+    get_contracts_by_price_page,
+    get_contracts_filter_by_collaborateur,
+)
+from controllers.event_controller import (
+    get_events_filter_by_collaborateur,
+    get_events_filter_by_date,
+    get_events_filter_by_date_future,
+    get_events_page,
+)
+
+CALLS: Dict[str, Callable[[], object]] = {
+    "clients d'un commercial": lambda: get_clients_filter_by_collaborateur(3),
+    "clients par nom": lambda: get_clients_filtered(nom_complet="Client 0000042"),
+    "page de clients d'un commercial": lambda: get_clients_page(
+        after=("Client 0000500", 500), collaborateur_id=3
+    ),
+    "contrats d'un commercial": lambda: get_contracts_filter_by_collaborateur((3,)),
+    "page de contrats par montant": lambda: get_contracts_by_price_page(
+        after=(25000, 100)
+    ),
+    "page de contrats d'un commercial": lambda: get_all_contracts_page(
+        after=(100,), collaborateur_id=3
+    ),
+    "événements d'un support": lambda: get_events_filter_by_collaborateur((4,)),
+    "événements d'une date": lambda: get_events_filter_by_date(
+        datetime.date(2026, 1, 1)
+    ),
+    "événements à venir": lambda: get_events_filter_by_date_future(),
+    "page d'événements": lambda: get_events_page(after=(datetime.date(2025, 6, 1), 10)),
+    "commerciaux": lambda: get_all_commercial(),
+    "collaborateur connecté": lambda: get_only_id_collaborateur(),
+}
+
+
+def explain(statement: str, parameters: tuple) -> Tuple[List[str], bool]:
+    """
+    Renvoie le plan d'une requête et indique s'il parcourt une table entière.
+    """
+    with db_config.engine.connect() as connection:
+        if db_config.engine.dialect.name == "sqlite":
+            rows = connection.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            ).all()
+            details = [row[-1] for row in rows]
+            full_scan = any(
+                detail.startswith("SCAN ") and "USING" not in detail
+                for detail in details
+            )
+        else:
+            rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+            rows = [row._mapping for row in rows]
+            details = [
+                f"{row['table']}: type={row['type']} key={row['key']}" for row in rows
+            ]
+            full_scan = any(row["type"] == "ALL" for row in rows)
+    return details, full_scan
+
+
+def check_plans(label: str) -> int:
+    print(f"\n=== {label} ===")
+    full_scans = 0
+    for name, call in CALLS.items():
+        start = time.perf_counter()
+        with count_queries() as counter:
+            call()
+        elapsed = (time.perf_counter() - start) * 1000
+        for statement, parameters in counter.statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            details, full_scan = explain(statement, parameters)
+            full_scans += full_scan
+            flag = "PARCOURS COMPLET" if full_scan else "index"
+            print(f"{name:<34} {elapsed:8.1f} ms  [{flag}]")
+            for detail in details:
+                print(f"    {detail}")
+    return full_scans
+
+
+def run(clients: int = 20000) -> int:
+    seed_database(clients, contracts_per_client=2, events_per_contract=1)
+    indexes = [
+        index for table in Base.metadata.sorted_tables for index in table.indexes
+    ]
+    for index in indexes:
+        index.drop(db_config.engine)
+    check_plans("Sans index")
+    for index in indexes:
+        index.create(db_config.engine)
+    full_scans = check_plans("Avec les index des migrations")
+    if full_scans:
+        print(f"\n{full_scans} requête(s) parcourent encore une table entière.")
+        return 1
+    print("\nToutes les requêtes filtrées utilisent un index.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,83 @@
+"""
+Rapport de chiffre d'affaires (option 21 du menu) : agrégation en base
+(GROUP BY / SUM / COUNT) contre le calcul en Python sur la liste complète des
+contrats renvoyée par get_contracts_filter_by_price().
+
+Le script vérifie que les deux calculs donnent les mêmes montants, et échoue
+sinon.
+
+Usage : python -m benchmarks.revenue_report [nb_clients]
+"""
+
+import datetime
+import sys
+import time
+from collections import defaultdict
+
+from benchmarks.common import count_queries, seed_database
+from controllers.contract_controller import get_contracts_filter_by_price
+from controllers.report_controller import (
+    revenue_by_client,
+    revenue_by_commercial,
+    revenue_by_statut,
+    revenue_totals,
+)
+
+
+def _in_python():
+    by_statut = defaultdict(lambda: [0, 0, 0])
+    for contract, _, _ in get_contracts_filter_by_price():
+        line = by_statut[contract.statut_contrat]
+        line[0] += 1
+        line[1] += contract.montant_total or 0
+        line[2] += contract.montant_restant_a_payer or 0
+    return {statut: tuple(line) for statut, line in by_statut.items()}
+
+
+def _in_database():
+    revenue_totals()
+    revenue_by_commercial()
+    revenue_by_client()
+    return {
+        line.key: (line.contracts, line.montant_total, line.montant_restant)
+        for line in revenue_by_statut()
+    }
+
+
+def _timed(function):
+    start = time.perf_counter()
+    with count_queries() as counter:
+        result = function()
+    return result, (time.perf_counter() - start) * 1000, counter.count
+
+
+def run(clients: int = 50000) -> int:
+    seed_database(clients, contracts_per_client=2)
+    expected, python_ms, python_queries = _timed(_in_python)
+    actual, database_ms, database_queries = _timed(_in_database)
+    print(
+        f"Calcul en Python (par statut seulement) : {python_ms:8.1f} ms, "
+        f"{python_queries} requête(s)"
+    )
+    print(
+        f"Rapport agrégé en base (4 tableaux)     : {database_ms:8.1f} ms, "
+        f"{database_queries} requête(s)"
+    )
+    start = time.perf_counter()
+    window = revenue_by_commercial(
+        datetime.date(2025, 6, 1), datetime.date(2025, 6, 30)
+    )
+    print(
+        f"Par commercial sur un mois de création   : "
+        f"{(time.perf_counter() - start) * 1000:8.1f} ms, "
+        f"{sum(line.contracts for line in window)} contrat(s)"
+    )
+    if actual != expected:
+        print(f"Écart entre les calculs : {actual} != {expected}")
+        return 1
+    print("Montants identiques.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,117 @@
+"""
+Agrégats dénormalisés des clients et des collaborateurs : lecture des colonnes
+tenues à jour contre la ré-agrégation de contract et events, surcoût d'une
+écriture, puis contrôle d'écart après une série d'écritures par les contrôleurs.
+
+Le script échoue si un agrégat a dérivé.
+
+Usage : python -m benchmarks.rollups [nb_clients]
+"""
+
+import datetime
+import sys
+import time
+
+from sqlalchemy import func, select
+
+from benchmarks.common import seed_database
+from controllers.client_controller import create_client
+from controllers.collaborateur_controlleur import create_collaborateur
+from controllers.contract_controller import (
+    create_contract,
+    delete_contract,
+    update_contract,
+)
+from controllers.event_controller import create_event, delete_event
+from database.db_config import session_scope
+from database.rollups import rollup_drift
+from models.client import Client
+from models.collaborateur import Collaborateur
+from models.contract import Contract
+from models.event import Events
+
+WRITES = 200
+
+
+def _dashboard_aggregated(session):
+    contracts = session.execute(
+        select(
+            Contract.client_id,
+            func.count(Contract.id),
+            func.sum(Contract.montant_total),
+            func.sum(Contract.montant_restant_a_payer),
+        ).group_by(Contract.client_id)
+    ).all()
+    events = session.execute(
+        select(Events.collaborateur_id, func.count(Events.id)).group_by(
+            Events.collaborateur_id
+        )
+    ).all()
+    return len(contracts) + len(events)
+
+
+def _dashboard_rollups(session):
+    clients = session.execute(
+        select(
+            Client.id,
+            Client.nb_contrats,
+            Client.montant_total_contrats,
+            Client.montant_restant_contrats,
+        )
+    ).all()
+    collaborateurs = session.execute(
+        select(Collaborateur.id, Collaborateur.nb_evenements)
+    ).all()
+    return len(clients) + len(collaborateurs)
+
+
+def _timed(function) -> float:
+    start = time.perf_counter()
+    with session_scope() as session:
+        function(session)
+    return (time.perf_counter() - start) * 1000
+
+
+def run(clients: int = 20000) -> int:
+    seed_database(clients, contracts_per_client=3, events_per_contract=2)
+    print(f"Tableau de bord ré-agrégé : {_timed(_dashboard_aggregated):8.1f} ms")
+    print(f"Tableau de bord dénormalisé : {_timed(_dashboard_rollups):8.1f} ms")
+
+    create_collaborateur("gestion-bench", "x", "gestion")
+    today = datetime.date.today()
+    start = time.perf_counter()
+    for i in range(WRITES):
+        client = create_client(
+            f"Bench {i}", f"bench{i}@example.com", "", "", today, today, 1
+        )
+        contract = create_contract(
+            client.id, "bench", None, 1000 + i, 500, "en cours", "gestion-bench"
+        )
+        update_contract(contract.id, {"montant_restant_a_payer": str(i)})
+        # Un jour distinct par événement, après les événements factices, pour
+        # ne pas créer de conflit de planning.
+        day = datetime.date(2030, 1, 1) + datetime.timedelta(days=i)
+        event = create_event(contract.id, "", day, day, "support", "Paris", 10, "", 2)
+        if i % 2:
+            delete_event(event.id)
+        if i % 3 == 0:
+            delete_event(event.id)
+            delete_contract(contract.id)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"{WRITES} séries d'écritures avec agrégats : {elapsed / WRITES:.2f} ms/série"
+    )
+
+    with session_scope() as session:
+        drift = rollup_drift(session)
+    for column, count in drift.items():
+        print(f"    {column:<34} {count} écart(s)")
+    if any(drift.values()):
+        print("Des agrégats ont dérivé.")
+        return 1
+    print("Aucun écart.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
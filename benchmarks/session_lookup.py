@@ -0,0 +1,117 @@
+"""
+Sessions de connexion : temps de résolution d'un jeton (identité du
+collaborateur connecté) selon le nombre de sessions ouvertes, depuis le cache
+du magasin de sessions puis depuis la base, et temps de purge des sessions
+expirées.
+
+Un jeton se résout par la clé primaire de la table `sessions` : le temps ne
+doit pas dépendre du nombre de sessions, contrairement à l'ancienne recherche
+du premier collaborateur marqué `is_connected`.
+
+Le script échoue si un jeton valide n'est pas résolu, si un jeton expiré l'est,
+ou si la purge laisse des sessions expirées.
+
+Usage : python -m benchmarks.session_lookup [nb_sessions]
+"""
+
+import datetime
+import statistics
+import sys
+import time
+
+from sqlalchemy import func, insert, select
+
+from benchmarks.common import reset_database
+from database import db_config
+from database.db_config import session_scope
+from database.session_store import SessionStore, hash_token
+from models.collaborateur import Collaborateur
+from models.collaborateur_session import CollaborateurSession
+
+STAFF = 200
+LOOKUPS = 5000
+
+
+def _seed(sessions: int) -> None:
+    """
+    Crée STAFF collaborateurs et `sessions` sessions, dont une sur deux expirée.
+    Le jeton de la session i est « jeton-i ».
+    """
+    reset_database()
+    now = datetime.datetime.now()
+    with db_config.engine.begin() as connection:
+        connection.execute(
+            insert(Collaborateur),
+            [
+                {
+                    "nom_utilisateur": f"collaborateur-{i}",
+                    "mot_de_passe": "-",
+                    "salt": "-",
+                    "role": "support",
+                    "is_connected": False,
+                }
+                for i in range(STAFF)
+            ],
+        )
+        for offset in range(0, sessions, 10000):
+            connection.execute(
+                insert(CollaborateurSession),
+                [
+                    {
+                        "token_hash": hash_token(f"jeton-{i}"),
+                        "collaborateur_id": i % STAFF + 1,
+                        "created_at": now,
+                        "expires_at": now
+                        + datetime.timedelta(hours=1 if i % 2 else -1),
+                    }
+                    for i in range(offset, min(offset + 10000, sessions))
+                ],
+            )
+
+
+def _timed(store: SessionStore, sessions: int) -> float:
+    durations = []
+    with session_scope() as session:
+        for i in range(LOOKUPS):
+            token = f"jeton-{(2 * i + 1) % sessions}"
+            start = time.perf_counter()
+            identity = store.resolve(token, session=session)
+            durations.append((time.perf_counter() - start) * 1000)
+            if identity is None:
+                raise AssertionError(f"session valide non résolue : {token}")
+    return statistics.median(durations)
+
+
+def run(sessions: int = 200000) -> int:
+    _seed(sessions)
+    print(f"{sessions} sessions, dont {sessions // 2} expirées")
+    store = SessionStore()
+    if store.resolve("jeton-0") is not None:
+        print("Une session expirée est résolue.")
+        return 1
+
+    # Cache désactivé : chaque résolution lit la base.
+    elapsed = _timed(SessionStore(cache_ttl=0.0), sessions)
+    print(f"Résolution depuis la base : {elapsed:8.4f} ms (médiane)")
+    _timed(store, sessions)
+    elapsed = _timed(store, sessions)
+    print(f"Résolution depuis le cache: {elapsed:8.4f} ms (médiane)")
+
+    start = time.perf_counter()
+    removed = store.sweep()
+    elapsed = time.perf_counter() - start
+    print(f"Purge : {removed} sessions expirées en {elapsed:.2f} s")
+    with session_scope() as session:
+        left = session.scalar(
+            select(func.count()).where(
+                CollaborateurSession.expires_at <= datetime.datetime.now()
+            )
+        )
+    if left:
+        print(f"{left} sessions expirées restent après la purge.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
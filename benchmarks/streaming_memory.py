@@ -0,0 +1,64 @@
+"""
+Pic de mémoire (RSS) d'une lecture complète de la table client selon sa taille.
+
+Chaque mesure est faite dans un processus neuf, après le remplissage de la base,
+pour que le pic mesuré ne concerne que la lecture. Le mode « stream » doit
+garder un pic constant, le mode « liste » (get_clients) grandit avec la table.
+
+Usage : python -m benchmarks.streaming_memory
+"""
+
+import resource
+import subprocess
+import sys
+
+SIZES = (10000, 50000, 200000)
+TOLERANCE = 1.25
+
+
+def _measure(mode: str) -> int:
+    from controllers import client_controller
+
+    if mode == "stream":
+        count = sum(1 for _ in client_controller.stream_clients(batch_size=1000))
+    else:
+        count = len(client_controller.get_clients())
+    assert count > 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure_in_subprocess(mode: str) -> int:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.streaming_memory", "--measure", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return int(output.strip().splitlines()[-1])
+
+
+def run() -> int:
+    from benchmarks.common import seed_database
+
+    peaks = {"stream": [], "liste": []}
+    for size in SIZES:
+        seed_database(size)
+        for mode in peaks:
+            peaks[mode].append(_measure_in_subprocess(mode))
+        print(
+            f"{size:>7} clients : stream {peaks['stream'][-1] / 1024:.1f} Mo, "
+            f"liste {peaks['liste'][-1] / 1024:.1f} Mo"
+        )
+    if max(peaks["stream"]) > min(peaks["stream"]) * TOLERANCE:
+        print("ERREUR: le pic mémoire du mode stream dépend de la taille de la table")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        import benchmarks.common  # noqa: F401  configure la base de benchmark
+
+        print(_measure(sys.argv[2]))
+        sys.exit(0)
+    sys.exit(run())
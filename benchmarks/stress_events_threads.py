@@ -0,0 +1,70 @@
+"""
+Test de charge : opérations concurrentes sur les évènements depuis un pool de threads.
+
+La base contient un client et un contrat par tâche. Chaque tâche crée un
+évènement sur son contrat, le relit, le modifie avec une valeur qui lui est
+propre, vérifie qu'elle relit bien sa propre valeur puis le supprime. Toute
+divergence signale un partage de session entre threads.
+
+Usage : python -m benchmarks.stress_events_threads [nb_taches] [nb_threads]
+"""
+
+import datetime
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import seed_database
+from controllers.event_controller import (
+    create_event,
+    delete_event,
+    get_event_by_id,
+    update_event,
+)
+
+
+def _scenario(task_id: int) -> None:
+    # seed_database numérote les contrats à partir de 1, un par client.
+    event = create_event(
+        contract_id=task_id + 1,
+        client_name=f"Client {task_id + 1:07d}",
+        date_debut=datetime.date(2026, 1, 1),
+        date_fin=datetime.date(2026, 1, 2),
+        contact_support="support",
+        lieu="Paris",
+        participants=task_id,
+        notes="initial",
+        collaborateur_id=None,
+    )
+    event_id = event.id
+    update_event(event_id, {"notes": f"tache-{task_id}", "participants": task_id})
+    reloaded = get_event_by_id(event_id)
+    if reloaded.notes != f"tache-{task_id}" or reloaded.participants != task_id:
+        raise AssertionError(
+            f"tâche {task_id}: lu {reloaded.notes!r}/{reloaded.participants!r}"
+        )
+    delete_event(event_id)
+    # SQLite peut réattribuer l'identifiant à l'évènement d'une autre tâche.
+    deleted = get_event_by_id(event_id)
+    if deleted is not None and deleted.notes == f"tache-{task_id}":
+        raise AssertionError(f"tâche {task_id}: évènement {event_id} non supprimé")
+
+
+def run(tasks: int = 500, workers: int = 8) -> int:
+    seed_database(tasks, contracts_per_client=1)
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_scenario, task_id) for task_id in range(tasks)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(e)
+    for error in errors[:10]:
+        print(f"ERREUR: {error}")
+    print(f"{tasks} tâches sur {workers} threads, {len(errors)} erreur(s)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    sys.exit(run(*args))
@@ -0,0 +1,748 @@
+"""
+Banc d'essai de tous les contrôleurs (clients, contrats, événements,
+collaborateurs) sur une base remplie à l'échelle choisie.
+
+Pour chaque fonction publique des quatre contrôleurs, le script mesure le temps
+d'un appel (médiane sur plusieurs appels), le nombre de requêtes SQL d'un appel
+et la mémoire Python allouée au plus haut d'un appel (tracemalloc). Chaque
+appel se fait dans sa propre session, annulée ensuite : les écritures ne
+modifient pas la base d'un appel à l'autre.
+
+Les résultats sont comparés à une référence JSON (benchmarks/baselines/, une
+par moteur et par échelle) ; le script échoue si une fonction est plus lente ou
+consomme plus de mémoire que la référence au-delà du seuil, ou si elle exécute
+plus de requêtes. --update-baseline enregistre la mesure comme nouvelle
+référence. Le script échoue aussi si la référence de l'échelle n'existe pas
+(sauf avec --update-baseline), ou si une fonction publique d'un contrôleur n'a
+pas de cas de mesure.
+
+La base est celle des autres benchmarks (SQLite jetable, ou DATABASE_URL pour
+MySQL) ; elle n'est remplie à nouveau que si elle ne contient pas déjà
+l'échelle demandée.
+
+Usage : python -m benchmarks.suite [1k|100k|1m ...] [--update-baseline]
+        [--threshold 0.25] [--only event_controller.] [--output résultats.json]
+"""
+
+import argparse
+import contextlib
+import datetime
+import inspect
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import sqlalchemy
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session as DbSession
+
+from benchmarks.common import seed_database, silent_console
+from controllers import (
+    client_controller,
+    collaborateur_controlleur,
+    contract_controller,
+    event_controller,
+)
+from database import db_config
+from database.db_config import record_queries
+from models.client import Client
+from models.collaborateur import Collaborateur
+from models.contract import Contract
+from models.event import Events
+
+# Nombre de clients par échelle ; chaque client a deux contrats et chaque
+# contrat un événement, soit environ cinq lignes par client.
+SCALES = {"1k": 200, "100k": 20_000, "1m": 200_000}
+CONTRACTS_PER_CLIENT = 2
+EVENTS_PER_CONTRACT = 1
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+CONTROLLERS = (
+    client_controller,
+    contract_controller,
+    event_controller,
+    collaborateur_controlleur,
+)
+# Temps de mesure visé par fonction, et bornes du nombre d'appels.
+MIN_TIME = 0.2
+MIN_CALLS = 3
+MAX_CALLS = 200
+# Seuil de régression relatif par défaut, et écarts absolus en deçà desquels
+# une différence de temps (ms) ou de mémoire (Kio) est tenue pour du bruit.
+THRESHOLD = 0.25
+TIME_FLOOR_MS = 0.2
+MEMORY_FLOOR_KIB = 64
+BENCHMARK_USER = "benchmark"
+BENCHMARK_PASSWORD = "mot-de-passe-de-benchmark"
+
+
+class Fixture(NamedTuple):
+    """
+    Identifiants des lignes utilisées par les cas de mesure, au milieu de la base.
+
+    Les suppressions portent sur un client sans contrat et un contrat sans
+    événement, ajoutés après les données factices : un client ou un contrat
+    qui a des lignes dépendantes ne peut pas être supprimé.
+    """
+
+    client_id: int
+    contract_id: int
+    spare_client_id: int
+    spare_contract_id: int
+    event_id: int
+    commercial_id: int
+    commercial_name: str
+    support_id: int
+    busy_date: datetime.date
+    free_date: datetime.date
+
+
+def fixture_for(clients: int) -> Fixture:
+    middle = max(1, clients // 2)
+    return Fixture(
+        client_id=middle,
+        contract_id=middle * CONTRACTS_PER_CLIENT,
+        spare_client_id=clients + 1,
+        spare_contract_id=clients * CONTRACTS_PER_CLIENT + 1,
+        event_id=middle * CONTRACTS_PER_CLIENT * EVENTS_PER_CONTRACT,
+        commercial_id=3,
+        commercial_name="commercial-1",
+        support_id=4,
+        # Les événements factices s'étalent sur un an autour du 2026-01-01.
+        busy_date=datetime.date(2026, 3, 1),
+        free_date=datetime.date(2030, 6, 1),
+    )
+
+
+Case = Callable[[Fixture, DbSession], Any]
+
+# Hachage du mot de passe du compte de benchmark, calculé une fois.
+_benchmark_hash = collaborateur_controlleur.hash_password(BENCHMARK_PASSWORD)
+
+
+def _week(start: datetime.date) -> datetime.date:
+    return start + datetime.timedelta(days=7)
+
+
+CASES: Dict[str, Case] = {
+    # Clients.
+    "client_controller.invalidate_client_index": lambda f, s: (
+        client_controller.invalidate_client_index()
+    ),
+    "client_controller.create_client": lambda f, s: client_controller.create_client(
+        "Client Benchmark",
+        "benchmark@example.com",
+        "+33 600000000",
+        "Benchmark SA",
+        datetime.datetime(2026, 1, 1),
+        datetime.datetime(2026, 1, 1),
+        f.commercial_id,
+        session=s,
+    ),
+    "client_controller.get_client_by_id": lambda f, s: (
+        client_controller.get_client_by_id(f.client_id, session=s)
+    ),
+    "client_controller.get_client_360": lambda f, s: (
+        client_controller.get_client_360(f.client_id, session=s)
+    ),
+    "client_controller.update_client": lambda f, s: client_controller.update_client(
+        f.client_id, {"telephone": "+33 611111111"}, session=s
+    ),
+    "client_controller.update_clients": lambda f, s: client_controller.update_clients(
+        {f.client_id + i: {"telephone": "+33 611111111"} for i in range(20)},
+        session=s,
+    ),
+    "client_controller.delete_client": lambda f, s: client_controller.delete_client(
+        f.spare_client_id, session=s
+    ),
+    "client_controller.get_clients_filtered": lambda f, s: (
+        client_controller.get_clients_filtered(
+            nom_complet=f"Client {f.client_id:07d}", session=s
+        )
+    ),
+    "client_controller.get_clients_filter_by_collaborateur": lambda f, s: (
+        client_controller.get_clients_filter_by_collaborateur(
+            f.commercial_id, session=s
+        )
+    ),
+    "client_controller.get_clients": lambda f, s: client_controller.get_clients(
+        session=s
+    ),
+    "client_controller.get_clients_with_commercial": lambda f, s: (
+        client_controller.get_clients_with_commercial(session=s)
+    ),
+    "client_controller.get_clients_page": lambda f, s: (
+        client_controller.get_clients_page(
+            after=(f"Client {f.client_id:07d}", f.client_id), session=s
+        )
+    ),
+    "client_controller.stream_clients": lambda f, s: sum(
+        1 for _ in client_controller.stream_clients(session=s)
+    ),
+    "client_controller.find_clients": lambda f, s: client_controller.find_clients(
+        f"Client {f.client_id:07d}", session=s
+    ),
+    # Contrats.
+    "contract_controller.create_contract": lambda f, s: (
+        contract_controller.create_contract(
+            f.client_id,
+            f.commercial_name,
+            f.commercial_id,
+            1000,
+            500,
+            "en cours",
+            f.commercial_name,
+            session=s,
+        )
+    ),
+    "contract_controller.get_contract_by_id": lambda f, s: (
+        contract_controller.get_contract_by_id(f.contract_id, session=s)
+    ),
+    "contract_controller.update_contract": lambda f, s: (
+        contract_controller.update_contract(
+            f.contract_id, {"montant_restant_a_payer": "0"}, session=s
+        )
+    ),
+    "contract_controller.update_contracts": lambda f, s: (
+        contract_controller.update_contracts(
+            {f.contract_id + i: {"montant_restant_a_payer": 0} for i in range(20)},
+            session=s,
+        )
+    ),
+    "contract_controller.delete_contract": lambda f, s: (
+        contract_controller.delete_contract(f.spare_contract_id, session=s)
+    ),
+    "contract_controller.get_contracts_filter_by_price": lambda f, s: (
+        contract_controller.get_contracts_filter_by_price(session=s)
+    ),
+    "contract_controller.get_contracts_filter_by_collaborateur": lambda f, s: (
+        contract_controller.get_contracts_filter_by_collaborateur(
+            (f.commercial_id,), session=s
+        )
+    ),
+    "contract_controller.get_all_contracts": lambda f, s: (
+        contract_controller.get_all_contracts(session=s)
+    ),
+    "contract_controller.get_contracts_by_price_page": lambda f, s: (
+        contract_controller.get_contracts_by_price_page(
+            after=(25000, f.contract_id), session=s
+        )
+    ),
+    "contract_controller.get_all_contracts_page": lambda f, s: (
+        contract_controller.get_all_contracts_page(
+            after=(f.contract_id,), collaborateur_id=f.commercial_id, session=s
+        )
+    ),
+    "contract_controller.stream_contracts": lambda f, s: sum(
+        1 for _ in contract_controller.stream_contracts(session=s)
+    ),
+    # Événements.
+    "event_controller.invalidate_upcoming_events": lambda f, s: (
+        event_controller.invalidate_upcoming_events()
+    ),
+    "event_controller.create_event": lambda f, s: event_controller.create_event(
+        f.contract_id,
+        "",
+        f.free_date,
+        f.free_date,
+        "support-1",
+        "Salle Benchmark",
+        50,
+        "",
+        f.support_id,
+        session=s,
+    ),
+    "event_controller.find_conflicts": lambda f, s: event_controller.find_conflicts(
+        f.support_id, f.busy_date, f.busy_date, session=s
+    ),
+    "event_controller.check_schedule": lambda f, s: event_controller.check_schedule(
+        f.support_id, f.free_date, f.free_date, session=s
+    ),
+    "event_controller.get_events_between": lambda f, s: (
+        event_controller.get_events_between(f.busy_date, _week(f.busy_date), session=s)
+    ),
+    "event_controller.get_event_by_id": lambda f, s: (
+        event_controller.get_event_by_id(f.event_id, session=s)
+    ),
+    "event_controller.update_event": lambda f, s: event_controller.update_event(
+        f.event_id, {"lieu": "Salle Benchmark"}, session=s
+    ),
+    "event_controller.update_events": lambda f, s: event_controller.update_events(
+        {f.event_id + i: {"participants": 42} for i in range(20)}, session=s
+    ),
+    "event_controller.delete_event": lambda f, s: event_controller.delete_event(
+        f.event_id, session=s
+    ),
+    "event_controller.get_events_filter_by_collaborateur": lambda f, s: (
+        event_controller.get_events_filter_by_collaborateur((f.support_id,), session=s)
+    ),
+    "event_controller.get_all_events": lambda f, s: (
+        event_controller.get_all_events(session=s)
+    ),
+    "event_controller.get_events_filter_by_date": lambda f, s: (
+        event_controller.get_events_filter_by_date(f.busy_date, session=s)
+    ),
+    "event_controller.get_events_filter_by_date_passed": lambda f, s: (
+        event_controller.get_events_filter_by_date_passed(session=s)
+    ),
+    "event_controller.get_events_filter_by_date_future": lambda f, s: (
+        event_controller.get_events_filter_by_date_future(session=s)
+    ),
+    "event_controller.get_upcoming_events_page": lambda f, s: (
+        event_controller.get_upcoming_events_page(session=s)
+    ),
+    "event_controller.get_past_events_page": lambda f, s: (
+        event_controller.get_past_events_page(session=s)
+    ),
+    "event_controller.get_events_page": lambda f, s: (
+        event_controller.get_events_page(after=(f.busy_date, f.event_id), session=s)
+    ),
+    "event_controller.stream_events": lambda f, s: sum(
+        1 for _ in event_controller.stream_events(session=s)
+    ),
+    # Collaborateurs.
+    "collaborateur_controlleur.get_current_token": lambda f, s: (
+        collaborateur_controlleur.get_current_token()
+    ),
+    "collaborateur_controlleur.get_collaborateur_connecte": lambda f, s: (
+        collaborateur_controlleur.get_collaborateur_connecte("jeton-inconnu", session=s)
+    ),
+    "collaborateur_controlleur.invalidate_collaborateur_connecte": lambda f, s: (
+        collaborateur_controlleur.invalidate_collaborateur_connecte()
+    ),
+    "collaborateur_controlleur.sweep_expired_sessions": lambda f, s: (
+        collaborateur_controlleur.sweep_expired_sessions()
+    ),
+    "collaborateur_controlleur.hash_password": lambda f, s: (
+        collaborateur_controlleur.hash_password(BENCHMARK_PASSWORD)
+    ),
+    "collaborateur_controlleur.verify_password": lambda f, s: (
+        collaborateur_controlleur.verify_password(BENCHMARK_PASSWORD, *_benchmark_hash)
+    ),
+    "collaborateur_controlleur.needs_rehash": lambda f, s: (
+        collaborateur_controlleur.needs_rehash(_benchmark_hash[0])
+    ),
+    "collaborateur_controlleur.create_collaborateur": lambda f, s: (
+        collaborateur_controlleur.create_collaborateur(
+            "benchmark-nouveau", BENCHMARK_PASSWORD, "support", session=s
+        )
+    ),
+    "collaborateur_controlleur.get_support_name": lambda f, s: (
+        collaborateur_controlleur.get_support_name(f.support_id, session=s)
+    ),
+    "collaborateur_controlleur.authenticate_collaborateur": lambda f, s: (
+        collaborateur_controlleur.authenticate_collaborateur(
+            BENCHMARK_USER, BENCHMARK_PASSWORD, session=s
+        )
+    ),
+    "collaborateur_controlleur.get_collaborateur_by_id": lambda f, s: (
+        collaborateur_controlleur.get_collaborateur_by_id(f.commercial_id, session=s)
+    ),
+    "collaborateur_controlleur.get_collaborateur_id_connected": lambda f, s: (
+        collaborateur_controlleur.get_collaborateur_id_connected(
+            f.commercial_name, session=s
+        )
+    ),
+    "collaborateur_controlleur.get_only_id_collaborateur": lambda f, s: (
+        collaborateur_controlleur.get_only_id_collaborateur(
+            session=s, token="jeton-inconnu"
+        )
+    ),
+    "collaborateur_controlleur.update_collaborateur": lambda f, s: (
+        collaborateur_controlleur.update_collaborateur(
+            f.commercial_id, {"nom_utilisateur": "commercial-renomme"}, session=s
+        )
+    ),
+    "collaborateur_controlleur.update_collaborateurs": lambda f, s: (
+        collaborateur_controlleur.update_collaborateurs(
+            {
+                f.commercial_id: {"role": "commercial"},
+                f.support_id: {"role": "support"},
+            },
+            session=s,
+        )
+    ),
+    "collaborateur_controlleur.get_collaborateur_name_by_id": lambda f, s: (
+        collaborateur_controlleur.get_collaborateur_name_by_id(
+            f.commercial_id, session=s
+        )
+    ),
+    "collaborateur_controlleur.get_all_commercial": lambda f, s: (
+        collaborateur_controlleur.get_all_commercial(session=s)
+    ),
+    "collaborateur_controlleur.delete_collaborateur": lambda f, s: (
+        collaborateur_controlleur.delete_collaborateur(BENCHMARK_USER, session=s)
+    ),
+    "collaborateur_controlleur.get_all_collaborateurs": lambda f, s: (
+        collaborateur_controlleur.get_all_collaborateurs(session=s)
+    ),
+    "collaborateur_controlleur.get_collaborateurs_filtered": lambda f, s: (
+        collaborateur_controlleur.get_collaborateurs_filtered(
+            nom_utilisateur=f.commercial_name, session=s
+        )
+    ),
+    "collaborateur_controlleur.get_collaborateurs_page": lambda f, s: (
+        collaborateur_controlleur.get_collaborateurs_page(session=s)
+    ),
+    "collaborateur_controlleur.stream_collaborateurs": lambda f, s: sum(
+        1 for _ in collaborateur_controlleur.stream_collaborateurs(session=s)
+    ),
+    "collaborateur_controlleur.disconnection_collaborateur": lambda f, s: (
+        collaborateur_controlleur.disconnection_collaborateur(
+            session=s, token="jeton-inconnu"
+        )
+    ),
+}
+
+
+def controller_functions() -> List[str]:
+    """
+    Renvoie le nom « module.fonction » de chaque fonction publique des contrôleurs.
+    """
+    names = []
+    for module in CONTROLLERS:
+        short = module.__name__.rsplit(".", 1)[-1]
+        for name, value in vars(module).items():
+            if (
+                not name.startswith("_")
+                and inspect.isfunction(value)
+                and value.__module__ == module.__name__
+            ):
+                names.append(f"{short}.{name}")
+    return names
+
+
+def _expected_counts(clients: int) -> Dict[str, int]:
+    contracts = clients * CONTRACTS_PER_CLIENT
+    return {
+        "client": clients + 1,
+        "contract": contracts + 1,
+        "events": contracts * EVENTS_PER_CONTRACT,
+    }
+
+
+def _current_counts() -> Dict[str, int]:
+    with db_config.Session() as session:
+        return {
+            model.__tablename__: session.scalar(select(func.count()).select_from(model))
+            for model in (Client, Contract, Events)
+        }
+
+
+def prepare_database(clients: int, reseed: bool = False) -> Dict[str, int]:
+    """
+    Remplit la base à l'échelle demandée, sauf si elle la contient déjà, et y
+    ajoute le compte de benchmark, le client sans contrat et le contrat sans
+    événement.
+
+    Returns:
+        dict: Le nombre de lignes par table.
+    """
+    expected = _expected_counts(clients)
+    try:
+        seeded = not reseed and _current_counts() == expected
+    except sqlalchemy.exc.DBAPIError:
+        seeded = False
+    if seeded:
+        with db_config.Session() as session:
+            seeded = session.scalar(
+                select(func.count()).where(
+                    Collaborateur.nom_utilisateur == BENCHMARK_USER
+                )
+            )
+    if seeded:
+        print("Base déjà remplie à cette échelle.")
+        return expected
+    start = time.perf_counter()
+    seed_database(
+        clients,
+        contracts_per_client=CONTRACTS_PER_CLIENT,
+        events_per_contract=EVENTS_PER_CONTRACT,
+    )
+    hashed_password, salt = _benchmark_hash
+    with db_config.engine.begin() as connection:
+        connection.execute(
+            insert(Collaborateur),
+            [
+                {
+                    "nom_utilisateur": BENCHMARK_USER,
+                    "mot_de_passe": hashed_password,
+                    "salt": salt,
+                    "role": "gestion",
+                    "is_connected": False,
+                }
+            ],
+        )
+    fixture = fixture_for(clients)
+    with db_config.session_scope() as session:
+        spare_client = client_controller.create_client(
+            "Client sans contrat",
+            "sans-contrat@example.com",
+            "+33 600000000",
+            "Benchmark SA",
+            datetime.datetime(2026, 1, 1),
+            datetime.datetime(2026, 1, 1),
+            fixture.commercial_id,
+            session=session,
+        )
+        spare_contract = contract_controller.create_contract(
+            fixture.client_id,
+            fixture.commercial_name,
+            fixture.commercial_id,
+            1000,
+            1000,
+            "en cours",
+            fixture.commercial_name,
+            session=session,
+        )
+        spare_ids = (spare_client.id, spare_contract.id)
+    if spare_ids != (fixture.spare_client_id, fixture.spare_contract_id):
+        raise RuntimeError(
+            f"identifiants inattendus pour les lignes de test : {spare_ids}"
+        )
+    print(f"Base remplie en {time.perf_counter() - start:.1f} s.")
+    return expected
+
+
+def _call(case: Case, fixture: Fixture) -> float:
+    """
+    Exécute un cas dans une session annulée ensuite ; renvoie sa durée (s).
+    """
+    session = db_config.Session()
+    try:
+        start = time.perf_counter()
+        case(fixture, session)
+        return time.perf_counter() - start
+    finally:
+        session.rollback()
+        session.close()
+
+
+def measure(name: str, case: Case, fixture: Fixture, min_time: float) -> Dict:
+    """
+    Mesure un cas : durée médiane et minimale, requêtes d'un appel et pic de
+    mémoire d'un appel.
+    """
+    warmup = _call(case, fixture)
+    calls = max(MIN_CALLS, min(MAX_CALLS, int(min_time / max(warmup, 1e-6))))
+    durations = [_call(case, fixture) * 1000 for _ in range(calls)]
+
+    with record_queries(name) as stats:
+        _call(case, fixture)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _call(case, fixture)
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(durations), 4),
+        "min_ms": round(min(durations), 4),
+        "calls": calls,
+        "queries": stats.queries,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """
+    Compare une mesure à la référence.
+
+    Returns:
+        list: Les régressions constatées, une ligne par fonction et grandeur.
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        slower = current["median_ms"] - reference["median_ms"]
+        if (
+            current["median_ms"] > reference["median_ms"] * (1 + threshold)
+            and slower > TIME_FLOOR_MS
+        ):
+            regressions.append(
+                f"{name} : {reference['median_ms']:.3f} -> "
+                f"{current['median_ms']:.3f} ms"
+            )
+        if current["queries"] > reference["queries"]:
+            regressions.append(
+                f"{name} : {reference['queries']} -> {current['queries']} requêtes"
+            )
+        grown = current["peak_kib"] - reference["peak_kib"]
+        if (
+            current["peak_kib"] > reference["peak_kib"] * (1 + threshold)
+            and grown > MEMORY_FLOOR_KIB
+        ):
+            regressions.append(
+                f"{name} : {reference['peak_kib']:.0f} -> "
+                f"{current['peak_kib']:.0f} Kio au plus haut"
+            )
+    return regressions
+
+
+def baseline_path(scale: str) -> str:
+    return os.path.join(BASELINE_DIR, f"{db_config.engine.dialect.name}-{scale}.json")
+
+
+def run_scale(
+    scale: str,
+    threshold: float = THRESHOLD,
+    update_baseline: bool = False,
+    only: Optional[str] = None,
+    min_time: float = MIN_TIME,
+    reseed: bool = False,
+) -> Dict[str, Any]:
+    """
+    Mesure les contrôleurs à une échelle et compare à la référence.
+
+    Returns:
+        dict: Le rapport de la mesure, avec la liste des régressions.
+    """
+    clients = SCALES[scale]
+    print(f"Échelle {scale} ({clients} clients, {db_config.engine.dialect.name}) :")
+    counts = prepare_database(clients, reseed)
+    fixture = fixture_for(clients)
+
+    results = {}
+    for name, case in CASES.items():
+        if only and only not in name:
+            continue
+        # Les messages affichés par les contrôleurs ne sont pas mesurés.
+        with silent_console(), contextlib.redirect_stdout(io.StringIO()):
+            results[name] = result = measure(name, case, fixture, min_time)
+        print(
+            f"  {name:<58} {result['median_ms']:10.3f} ms "
+            f"{result['queries']:4d} req. {result['peak_kib']:10.1f} Kio"
+        )
+
+    report = {
+        "scale": scale,
+        "dialect": db_config.engine.dialect.name,
+        "rows": counts,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "results": results,
+        "regressions": [],
+        "baseline": None,
+    }
+    path = baseline_path(scale)
+    if update_baseline:
+        baseline = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as previous:
+                baseline = json.load(previous)["results"]
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as output:
+            # Une mesure partielle (--only) ne remplace que ses fonctions.
+            saved = {key: value for key, value in report.items() if key != "baseline"}
+            json.dump(
+                {**saved, "results": {**baseline, **results}, "regressions": []},
+                output,
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+        print(f"Référence enregistrée : {path}")
+        report["baseline"] = path
+    elif os.path.exists(path):
+        with open(path, encoding="utf-8") as reference:
+            baseline = json.load(reference)["results"]
+        report["baseline"] = path
+        report["regressions"] = compare(results, baseline, threshold)
+        for regression in report["regressions"]:
+            print(f"  RÉGRESSION {regression}")
+        if not report["regressions"]:
+            print(f"  Aucune régression par rapport à {path}")
+    else:
+        print(
+            f"  ERREUR: pas de référence {path} ; l'enregistrer avec "
+            "--update-baseline sur la machine qui exécute la comparaison."
+        )
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument(
+        "scales",
+        nargs="*",
+        metavar="échelle",
+        help=f"Échelles à mesurer parmi {', '.join(SCALES)} (1k par défaut).",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Enregistrer la mesure comme référence au lieu de comparer.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="Ralentissement ou surcroît de mémoire toléré (0.25 = 25 %%).",
+    )
+    parser.add_argument(
+        "--only", default=None, help="Ne mesurer que les fonctions contenant ce texte."
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=MIN_TIME,
+        help="Durée de mesure visée par fonction, en secondes.",
+    )
+    parser.add_argument(
+        "--reseed", action="store_true", help="Remplir à nouveau la base."
+    )
+    parser.add_argument(
+        "--output", default=None, help="Fichier JSON où écrire les rapports."
+    )
+    return parser
+
+
+def run(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    scales = args.scales or ["1k"]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"échelle inconnue : {', '.join(unknown)}")
+    missing = sorted(set(controller_functions()) - set(CASES))
+    if missing:
+        print("Fonctions de contrôleur sans cas de mesure : " + ", ".join(missing))
+        return 1
+    reports = [
+        run_scale(
+            scale,
+            threshold=args.threshold,
+            update_baseline=args.update_baseline,
+            only=args.only,
+            min_time=args.min_time,
+            reseed=args.reseed,
+        )
+        for scale in scales
+    ]
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(reports, output, ensure_ascii=False, indent=2)
+    failed = any(
+        report["regressions"] or report["baseline"] is None for report in reports
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
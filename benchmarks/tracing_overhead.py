@@ -0,0 +1,92 @@
+"""
+Coût du traçage : temps ajouté à chaque appel d'une fonction mesurée, sans
+export, avec 1 % des traces exportées et avec toutes les traces exportées, puis
+sur une lecture réelle (get_event_by_id) comparée à la fonction non mesurée.
+
+Les durées alimentent toujours les histogrammes ; seule l'écriture des spans
+dépend de l'échantillonnage. Le script affiche enfin les temps de réponse
+relevés par le traceur et ceux recalculés depuis le fichier d'export.
+
+Le script échoue si, à un échantillonnage de 100 %, le fichier d'export ne
+contient pas un span par appel.
+
+Usage : python -m benchmarks.tracing_overhead [nb_appels]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import seed_database
+from controllers.event_controller import get_event_by_id
+from database import tracing
+from database.db_config import session_scope
+from database.tracing import configure_tracing, summarize_spans, traced
+
+
+def _noop() -> None:
+    return None
+
+
+def _per_call_ns(function, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) * 1e9 / calls
+
+
+def _count_lines(path: str) -> int:
+    with open(path, encoding="utf-8") as spans:
+        return sum(1 for _ in spans)
+
+
+def run(calls: int = 200000) -> int:
+    seed_database(1000, contracts_per_client=1, events_per_contract=1)
+    measured = traced("benchmark.noop")(_noop)
+    baseline = _per_call_ns(_noop, calls)
+    path = os.path.join(tempfile.mkdtemp(), "spans.jsonl")
+
+    for label, overrides in (
+        ("sans export", {"sample_rate": 0.0, "path": None}),
+        ("export de 1 %", {"sample_rate": 0.01, "path": path}),
+        ("export de 100 %", {"sample_rate": 1.0, "path": path}),
+    ):
+        if os.path.exists(path):
+            os.remove(path)
+        configure_tracing(**overrides)
+        overhead = _per_call_ns(measured, calls) - baseline
+        tracing.tracer.flush()
+        exported = _count_lines(path) if os.path.exists(path) else 0
+        print(f"{label:<16}: +{overhead:8.0f} ns par appel, {exported} spans exportés")
+    if exported != calls:
+        print(f"{exported} spans exportés pour {calls} appels à 100 %.")
+        return 1
+
+    os.remove(path)
+    configure_tracing(sample_rate=0.01, path=path)
+    lookups = calls // 100
+    with session_scope() as session:
+        plain = _per_call_ns(
+            lambda: get_event_by_id.__wrapped__(500, session=session), lookups
+        )
+        measured_lookup = _per_call_ns(
+            lambda: get_event_by_id(500, session=session), lookups
+        )
+    print(
+        f"get_event_by_id : {plain / 1000:.1f} µs, mesuré {measured_lookup / 1000:.1f}"
+        f" µs ({(measured_lookup - plain) / plain:+.1%})"
+    )
+    tracing.tracer.flush()
+
+    print("Temps relevés par le traceur :")
+    for name, summary in tracing.get_latency_report().items():
+        print(f"  {name:<34} {summary}")
+    print("Temps recalculés depuis le fichier d'export :")
+    for name, summary in summarize_spans(path).items():
+        print(f"  {name:<34} {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
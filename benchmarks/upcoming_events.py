@@ -0,0 +1,74 @@
+"""
+Événements à venir et passés (options 17 et 16 du menu) : liste complète relue
+en base à chaque affichage, contre la première page servie par le cache de la
+fenêtre des prochains jours, et contre la première page des événements passés
+lue par curseur.
+
+Le script échoue si la première page du cache diffère de la base.
+
+Usage : python -m benchmarks.upcoming_events [nb_clients]
+"""
+
+import statistics
+import sys
+import time
+
+from benchmarks.common import count_queries, seed_database
+from controllers.event_controller import (
+    get_events_filter_by_date_future,
+    get_events_filter_by_date_passed,
+    get_past_events_page,
+    get_upcoming_events_page,
+    invalidate_upcoming_events,
+)
+
+RUNS = 50
+
+
+def _timed(function, runs: int = RUNS):
+    durations = []
+    with count_queries() as counter:
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = function()
+            durations.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(durations), counter.count / runs
+
+
+def run(clients: int = 50000) -> int:
+    counts = seed_database(clients, contracts_per_client=2, events_per_contract=2)
+    print(f"{counts['events']} événements")
+    rows = [
+        ("À venir, liste complète", get_events_filter_by_date_future, 5),
+        ("Passés, liste complète", get_events_filter_by_date_passed, 5),
+        ("Passés, première page", get_past_events_page, RUNS),
+    ]
+    for label, function, runs in rows:
+        _, elapsed, queries = _timed(function, runs)
+        print(f"{label:<34} {elapsed:9.3f} ms  {queries:4.1f} requête(s)")
+
+    invalidate_upcoming_events()
+    start = time.perf_counter()
+    get_upcoming_events_page()
+    print(
+        f"{'À venir, chargement de la fenêtre':<34} "
+        f"{(time.perf_counter() - start) * 1000:9.3f} ms"
+    )
+    page, elapsed, queries = _timed(get_upcoming_events_page)
+    print(
+        f"{'À venir, première page (cache)':<34} {elapsed:9.3f} ms  "
+        f"{queries:4.1f} requête(s)"
+    )
+
+    expected = sorted(
+        get_events_filter_by_date_future(),
+        key=lambda event: (event.date_debut, event.id),
+    )[: len(page.items)]
+    if [event.id for event in page.items] != [event.id for event in expected]:
+        print("La première page du cache diffère de la base.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*[int(arg) for arg in sys.argv[1:2]]))
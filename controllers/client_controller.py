@@ -1,8 +1,44 @@
 import datetime
-from database.db_config import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session as DbSession, joinedload, selectinload
+from database.db_config import on_commit, session_scope
+from database.streaming import stream_scalars
+from database.pagination import PAGE_SIZE, Cursor, Page, paginate
+from database.rollups import bulk_update_tracked, row_values, track_change, update_tracked
+from database.trigram import TOP_K, TrigramIndex
+from database.tracing import instrument_module
+from database.updates import Changes
+from controllers.event_controller import invalidate_upcoming_events
 from models.collaborateur import Collaborateur
 from models.client import Client
-from typing import List, Optional
+from models.event import Events
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Champs indexés pour la recherche approximative d'un client.
+CLIENT_LOOKUP_FIELDS = ("nom_complet", "nom_entreprise", "email")
+
+# Index de trigrammes des clients, chargé à la première recherche puis tenu à
+# jour par les écritures de ce module une fois leur transaction validée.
+_client_index = TrigramIndex()
+
+
+def _lookup_values(client: Client) -> Tuple[Optional[str], ...]:
+    return tuple(getattr(client, field) for field in CLIENT_LOOKUP_FIELDS)
+
+
+def _reindex_client(session: DbSession, client: Client) -> None:
+    client_id, values = client.id, _lookup_values(client)
+    on_commit(session, lambda: _client_index.add(client_id, values))
+
+
+def invalidate_client_index() -> None:
+    """
+    Vide l'index de recherche des clients, rechargé à la prochaine recherche.
+
+    À appeler après une écriture qui ne passe pas par ce module (import en masse).
+    """
+    _client_index.clear()
+
 
 def create_client(
     nom_complet: str,
@@ -12,89 +48,158 @@ def create_client(
     date_de_creation: datetime,
     derniere_maj_contact: datetime,
     collaborateur_id: int,
+    session: Optional[DbSession] = None,
 ) -> Client:
 
-    session = Session()
-    collaborateur = session.query(Collaborateur).filter_by(id=collaborateur_id).first()
-    if collaborateur:
-        if collaborateur.role == 'commercial':
-            client = Client(
-                nom_complet=nom_complet,
-                email=email,
-                telephone=telephone,
-                nom_entreprise=nom_entreprise,
-                date_de_creation=date_de_creation,
-                derniere_maj_contact=derniere_maj_contact,
-                collaborateur_id=collaborateur_id
-            )
-            session.add(client)
-            session.commit()
-            session.close()
-            
-            return client
+    with session_scope(session) as session:
+        collaborateur = session.query(Collaborateur).filter_by(id=collaborateur_id).first()
+        if collaborateur:
+            if collaborateur.role == 'commercial':
+                client = Client(
+                    nom_complet=nom_complet,
+                    email=email,
+                    telephone=telephone,
+                    nom_entreprise=nom_entreprise,
+                    date_de_creation=date_de_creation,
+                    derniere_maj_contact=derniere_maj_contact,
+                    collaborateur_id=collaborateur_id
+                )
+                session.add(client)
+                session.flush()
+                track_change(session, Client, None, row_values(client, Client))
+                _reindex_client(session, client)
+
+                return client
+            else:
+                raise ValueError("Seuls les collaborateurs avec le rôle 'commercial' sont autorisés à créer un client.")
         else:
-            raise ValueError("Seuls les collaborateurs avec le rôle 'commercial' sont autorisés à créer un client.")
-    else:
-        raise ValueError("Collaborateur not found.")
-    
+            raise ValueError("Collaborateur not found.")
+
 
-def get_client_by_id(client_id: int) -> Client:
+def get_client_by_id(client_id: int, session: Optional[DbSession] = None) -> Client:
     """
     Récupère un client à partir de son identifiant.
 
     Args:
         client_id (int): L'identifiant du client à récupérer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Client: Le client correspondant à l'identifiant donné.
     """
-    session=Session()
-    client = session.query(Client).filter_by(id=client_id).first()
-    session.close()
-    return client
+    with session_scope(session) as session:
+        return session.query(Client).filter_by(id=client_id).first()
 
 
-def update_client(client_id: int, new_values: dict) -> None:
+def get_client_360(
+    client_id: int, session: Optional[DbSession] = None
+) -> Optional[Client]:
+    """
+    Récupère un client avec son commercial, tous ses contrats et tous ses événements.
+
+    Le chargement tient en trois requêtes quel que soit le nombre de contrats et
+    d'événements : le client joint à son commercial, puis les contrats et les
+    événements (joints à leur support) chargés chacun par un SELECT ... IN.
+    Les relations sont ainsi utilisables une fois la session fermée.
+
+    Args:
+        client_id (int): L'identifiant du client.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Client: Le client, ou None s'il n'existe pas.
+    """
+    with session_scope(session) as session:
+        return (
+            session.query(Client)
+            .options(
+                joinedload(Client.collaborateur),
+                selectinload(Client.contracts),
+                selectinload(Client.events).joinedload(Events.collaborateur),
+            )
+            .filter(Client.id == client_id)
+            .first()
+        )
+
+
+def update_client(
+    client_id: int, new_values: dict, session: Optional[DbSession] = None
+) -> Optional[Changes]:
 
     """
     Met à jour les informations d'un client donné avec de nouvelles valeurs.
 
+    Seules les colonnes dont la valeur change sont écrites ; rien n'est écrit si
+    aucune valeur ne change.
+
     Args:
         client_id (int): L'identifiant du client à mettre à jour.
         new_values (dict): Un dictionnaire contenant les nouvelles valeurs à attribuer
                            aux attributs du client.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
-        None
+        dict: Les colonnes modifiées, ou None si le client n'existe pas.
+    """
+    with session_scope(session) as session:
+        changes = update_tracked(Client, client_id, new_values, session)
+        if changes and set(changes) & set(CLIENT_LOOKUP_FIELDS):
+            _reindex_client(session, session.get(Client, int(client_id)))
+        if changes and "nom_complet" in changes:
+            # Le nom du client est affiché avec les événements à venir en cache.
+            on_commit(session, invalidate_upcoming_events)
+        return changes
+
+
+def update_clients(
+    changes_by_id: Dict[int, Dict[str, Any]], session: Optional[DbSession] = None
+) -> int:
     """
-    session=Session()
-    client = session.query(Client).filter_by(id=client_id).first()
-    if client:
-        for attr in new_values:
-            setattr(client, attr, new_values[attr])
-        session.commit()
-    session.close()
+    Met à jour plusieurs clients dans la même transaction.
 
+    Args:
+        changes_by_id (dict): Les nouvelles valeurs, par identifiant de client.
+        session (Session, optional): La session de l'unité de travail en cours.
 
-def delete_client(client_id: int) -> None:
+    Returns:
+        int: Le nombre de clients effectivement modifiés.
+    """
+    with session_scope(session) as session:
+        updated = bulk_update_tracked(Client, changes_by_id, session)
+        for client_id, new_values in changes_by_id.items():
+            if set(new_values) & set(CLIENT_LOOKUP_FIELDS):
+                client = session.get(Client, int(client_id))
+                if client is not None:
+                    _reindex_client(session, client)
+        if updated and any("nom_complet" in values for values in changes_by_id.values()):
+            on_commit(session, invalidate_upcoming_events)
+        return updated
+
+
+def delete_client(client_id: int, session: Optional[DbSession] = None) -> None:
     """
     Supprime un client de la base de données.
 
     Args:
         client_id (int): L'identifiant du client à supprimer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         None
     """
-    session=Session()
-    client = session.query(Client).filter_by(id=client_id).first()
-    if client:
-        session.delete(client)
-        session.commit()
-    session.close()
+    with session_scope(session) as session:
+        client = session.query(Client).filter_by(id=client_id).first()
+        if client:
+            track_change(session, Client, row_values(client, Client), None)
+            session.delete(client)
+            session.flush()
+            on_commit(session, lambda: _client_index.remove(client.id))
+            on_commit(session, invalidate_upcoming_events)
 
 
-def get_clients_filtered(nom_complet: Optional[str] = None) -> Client:
+def get_clients_filtered(
+    nom_complet: Optional[str] = None, session: Optional[DbSession] = None
+) -> List[Client]:
     """
     Récupère une liste de clients filtrés par nom complet.
 
@@ -102,41 +207,195 @@ def get_clients_filtered(nom_complet: Optional[str] = None) -> Client:
         nom_complet (str, optional): Le nom complet du client à filtrer. Si spécifié,
                                       seuls les clients dont le nom complet correspond
                                       à cette valeur seront retournés. Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         list: Une liste de clients filtrés par nom complet.
     """
-    session=Session()
-    query = session.query(Client)
+    with session_scope(session) as session:
+        query = session.query(Client)
 
-    if nom_complet:
-        query = query.filter(Client.nom_complet == nom_complet)
-    query = query.order_by(Client.nom_complet)
-    client = query.all()
-    return client
+        if nom_complet:
+            query = query.filter(Client.nom_complet == nom_complet)
+        query = query.order_by(Client.nom_complet)
+        return query.all()
 
-def get_clients_filter_by_collaborateur(collaborateur_id: int)-> Client:
+def get_clients_filter_by_collaborateur(
+    collaborateur_id: int, session: Optional[DbSession] = None
+) -> List[Client]:
     """
     Récupère tous les clients associés à un collaborateur donné.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         list: Une liste des clients associés au collaborateur.
     """
-    session=Session()
-    client = session.query(Client).filter_by(collaborateur_id=collaborateur_id).all()
-    return client
+    with session_scope(session) as session:
+        return session.query(Client).filter_by(collaborateur_id=collaborateur_id).all()
 
-def get_clients()-> Client:
+def get_clients(session: Optional[DbSession] = None) -> List[Client]:
     """
     Récupère la liste complète des clients depuis la base de données.
 
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
         list: Liste des clients.
     """
-    session = Session()
-    clients = session.query(Client).all()
-    session.close()
-    return clients
\ No newline at end of file
+    with session_scope(session) as session:
+        return session.query(Client).all()
+
+
+def get_clients_with_commercial(
+    nom_complet: Optional[str] = None,
+    collaborateur_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> List[Tuple[Client, Optional[str]]]:
+    """
+    Récupère les clients avec le nom d'utilisateur de leur commercial en une seule requête.
+
+    Args:
+        nom_complet (str, optional): Le nom complet du client à filtrer. Par défaut, None.
+        collaborateur_id (int, optional): L'identifiant du commercial à filtrer.
+                                          Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Une liste de couples (client, nom d'utilisateur du commercial), triée par
+              nom complet. Le nom vaut None si le commercial n'existe plus.
+    """
+    with session_scope(session) as session:
+        query = session.query(Client, Collaborateur.nom_utilisateur).outerjoin(
+            Collaborateur, Client.collaborateur_id == Collaborateur.id
+        )
+        if nom_complet:
+            query = query.filter(Client.nom_complet == nom_complet)
+        if collaborateur_id:
+            query = query.filter(Client.collaborateur_id == collaborateur_id)
+        query = query.order_by(Client.nom_complet)
+        return [(client, nom_commercial) for client, nom_commercial in query.all()]
+
+
+def get_clients_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    nom_complet: Optional[str] = None,
+    collaborateur_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> Page:
+    """
+    Récupère une page de clients avec le nom de leur commercial, par ordre alphabétique.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre de clients par page.
+        nom_complet (str, optional): Le nom complet du client à filtrer. Par défaut, None.
+        collaborateur_id (int, optional): L'identifiant du commercial à filtrer.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Page: Une page de couples (client, nom d'utilisateur du commercial).
+    """
+    with session_scope(session) as session:
+        query = session.query(Client, Collaborateur.nom_utilisateur).outerjoin(
+            Collaborateur, Client.collaborateur_id == Collaborateur.id
+        )
+        if nom_complet:
+            query = query.filter(Client.nom_complet == nom_complet)
+        if collaborateur_id:
+            query = query.filter(Client.collaborateur_id == collaborateur_id)
+        page = paginate(
+            query,
+            [(Client.nom_complet, False), (Client.id, False)],
+            key=lambda row: (row[0].nom_complet, row[0].id),
+            after=after,
+            limit=limit,
+        )
+        page.items = [tuple(row) for row in page.items]
+        return page
+
+
+def stream_clients(
+    batch_size: Optional[int] = None, session: Optional[DbSession] = None
+) -> Iterator[Client]:
+    """
+    Parcourt les clients un par un sans charger toute la table en mémoire.
+
+    Args:
+        batch_size (int, optional): Le nombre de lignes lues par lot.
+        session (Session, optional): La session à utiliser.
+
+    Yields:
+        Client: Les clients, par identifiant croissant.
+    """
+    yield from stream_scalars(
+        select(Client).order_by(Client.id), batch_size=batch_size, session=session
+    )
+
+
+def _client_lookup_index(session: DbSession) -> TrigramIndex:
+    if not _client_index.ready:
+        rows = session.execute(
+            select(Client.id, *[getattr(Client, field) for field in CLIENT_LOOKUP_FIELDS])
+        )
+        _client_index.load((row[0], row[1:]) for row in rows)
+    return _client_index
+
+
+def find_clients(
+    query: str,
+    limit: int = TOP_K,
+    collaborateur_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> List[Tuple[Client, Optional[str], float]]:
+    """
+    Retrouve les clients les plus proches d'une saisie approximative.
+
+    La saisie est comparée au nom complet, au nom de l'entreprise et à l'email
+    grâce à un index de trigrammes tenu en mémoire : les fautes de frappe, les
+    accents et les mots partiels sont tolérés. Seuls les meilleurs candidats
+    sont ensuite lus en base, en une requête.
+
+    Args:
+        query (str): La saisie de l'utilisateur.
+        limit (int): Le nombre maximum de clients proposés.
+        collaborateur_id (int, optional): Restreint la recherche aux clients de ce
+                                          commercial.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Les triplets (client, nom d'utilisateur du commercial, score), du plus
+              proche au moins proche.
+    """
+    with session_scope(session) as session:
+        index = _client_lookup_index(session)
+        keys = None
+        if collaborateur_id:
+            keys = set(
+                session.scalars(
+                    select(Client.id).where(Client.collaborateur_id == collaborateur_id)
+                )
+            )
+        matches = index.search(query, limit, keys=keys)
+        if not matches:
+            return []
+        rows = (
+            session.query(Client, Collaborateur.nom_utilisateur)
+            .outerjoin(Collaborateur, Client.collaborateur_id == Collaborateur.id)
+            .filter(Client.id.in_([client_id for client_id, _ in matches]))
+            .all()
+        )
+        by_id = {client.id: (client, nom_commercial) for client, nom_commercial in rows}
+        # Un client supprimé par un autre processus est absent de la base.
+        return [
+            (*by_id[client_id], score)
+            for client_id, score in matches
+            if client_id in by_id
+        ]
+
+
+instrument_module(globals())
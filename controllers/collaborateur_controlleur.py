@@ -1,30 +1,209 @@
 import hashlib
+import hmac
+import os
 import secrets
-import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from sqlalchemy import select
+from sqlalchemy.orm import Session as DbSession
 from models.collaborateur import Collaborateur
-from database.db_config import Session
-from database.db_config import get_session
+from database.db_config import on_commit, session_scope
+from database.session_store import SessionStore
+from database.tracing import instrument_module
+from database.streaming import stream_scalars
+from database.pagination import PAGE_SIZE, Cursor, Page, paginate
+from database.updates import Changes, bulk_update, update_by_id
 from models.client import Client
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
-def hash_password(password: str) -> Tuple[str, str]:
+class CollaborateurConnecte:
     """
-    Hash le mot de passe avec un sel aléatoire.
+    Identité du collaborateur authentifié, conservée en mémoire le temps de la session CLI.
+
+    Attributes:
+        id (int): Identifiant du collaborateur.
+        nom_utilisateur (str): Nom d'utilisateur du collaborateur.
+        role (str): Rôle du collaborateur.
+    """
+
+    def __init__(self, id: int, nom_utilisateur: str, role: str) -> None:
+        self.id = id
+        self.nom_utilisateur = nom_utilisateur
+        self.role = role
+
+    def __repr__(self) -> str:
+        return (
+            f"CollaborateurConnecte(id={self.id!r}, "
+            f"nom_utilisateur={self.nom_utilisateur!r}, "
+            f"role={self.role!r})"
+        )
+
+
+# Sessions ouvertes à la connexion, et jeton de la session de ce processus CLI.
+_sessions = SessionStore()
+_current_token: Optional[str] = None
+
+
+def get_current_token() -> Optional[str]:
+    """
+    Renvoie le jeton de la session ouverte par ce processus, ou None.
+    """
+    return _current_token
+
+
+def get_collaborateur_connecte(
+    token: Optional[str] = None, session: Optional[DbSession] = None
+) -> Optional[CollaborateurConnecte]:
+    """
+    Renvoie l'identité du collaborateur d'une session.
+
+    La session est résolue par le cache du magasin de sessions, sinon par la
+    clé primaire de la table `sessions`.
+
+    Args:
+        token (str, optional): Le jeton de la session. Par défaut, celui de la
+                               session ouverte par ce processus.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        CollaborateurConnecte: Le collaborateur connecté, ou None si la session
+                               est inconnue ou expirée.
+    """
+    identity = _sessions.resolve(token or _current_token, session=session)
+    if identity is None:
+        return None
+    return CollaborateurConnecte(*identity)
+
+
+def invalidate_collaborateur_connecte(collaborateur_id: Optional[int] = None) -> None:
+    """
+    Oublie les identités mises en cache pour un collaborateur (pour tous si
+    None) ; elles sont relues en base à la prochaine demande.
+    """
+    _sessions.forget_collaborateur(collaborateur_id)
+
+
+def sweep_expired_sessions() -> int:
+    """
+    Supprime les sessions expirées, par lots.
+
+    Returns:
+        int: Le nombre de sessions supprimées.
+    """
+    return _sessions.sweep()
+
+
+# Coût scrypt (n, r, p) des nouveaux hachages : environ 16 Mo et quelques
+# dizaines de millisecondes par calcul. Un hachage d'un coût différent est
+# recalculé à la connexion suivante.
+PASSWORD_COST: Tuple[int, int, int] = (2**14, 8, 1)
+SCRYPT_PREFIX = "scrypt"
+# Nombre de vérifications menées en parallèle. scrypt libère le GIL : des
+# threads suffisent, et leur nombre borne la mémoire consommée (128 * n * r
+# octets chacun) lors d'un afflux de connexions.
+PASSWORD_WORKERS = min(8, os.cpu_count() or 1)
+
+_password_pool = ThreadPoolExecutor(
+    max_workers=PASSWORD_WORKERS, thread_name_prefix="password"
+)
+
+
+def _scrypt(password: str, salt: str, cost: Tuple[int, int, int]) -> str:
+    n, r, p = cost
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt.encode(),
+        n=n,
+        r=r,
+        p=p,
+        maxmem=256 * n * r * p,
+        dklen=32,
+    ).hex()
+
+
+def hash_password(
+    password: str, cost: Optional[Tuple[int, int, int]] = None
+) -> Tuple[str, str]:
+    """
+    Hache le mot de passe avec scrypt et un sel aléatoire.
+
+    Les paramètres de coût sont enregistrés avec l'empreinte
+    (« scrypt$n$r$p$empreinte ») : chaque collaborateur est vérifié avec les
+    paramètres de son propre hachage.
 
     Args:
         password (str): Le mot de passe à hacher.
+        cost (tuple, optional): Les paramètres scrypt (n, r, p). Par défaut,
+                                PASSWORD_COST.
 
     Returns:
         tuple: Un tuple contenant le mot de passe haché et le sel utilisé.
     """
-    salt = secrets.token_hex(8)
-    hashed_password = hashlib.sha3_256((password + salt).encode()).hexdigest()
-    return hashed_password, salt
+    cost = cost or PASSWORD_COST
+    salt = secrets.token_hex(16)
+    digest = _scrypt(password, salt, cost)
+    n, r, p = cost
+    return f"{SCRYPT_PREFIX}${n}${r}${p}${digest}", salt
+
+
+def _hash_cost(hashed_password: str) -> Optional[Tuple[int, int, int]]:
+    # None pour un hachage sha3_256 antérieur à scrypt.
+    if not hashed_password.startswith(SCRYPT_PREFIX + "$"):
+        return None
+    _, n, r, p, _ = hashed_password.split("$")
+    return int(n), int(r), int(p)
+
+
+def verify_password(password: str, hashed_password: str, salt: str) -> bool:
+    """
+    Vérifie un mot de passe contre son hachage, scrypt ou sha3_256 (ancien
+    format), en temps constant.
+
+    Args:
+        password (str): Le mot de passe saisi.
+        hashed_password (str): Le hachage enregistré.
+        salt (str): Le sel enregistré.
+
+    Returns:
+        bool: True si le mot de passe correspond.
+    """
+    cost = _hash_cost(hashed_password)
+    if cost is None:
+        expected = hashlib.sha3_256((password + salt).encode()).hexdigest()
+        return hmac.compare_digest(expected, hashed_password)
+    digest = hashed_password.rsplit("$", 1)[1]
+    return hmac.compare_digest(_scrypt(password, salt, cost), digest)
+
+
+def needs_rehash(
+    hashed_password: str, cost: Optional[Tuple[int, int, int]] = None
+) -> bool:
+    """
+    Indique si un hachage doit être recalculé : ancien format sha3_256, ou
+    paramètres scrypt différents de `cost` (par défaut, PASSWORD_COST).
+    """
+    return _hash_cost(hashed_password) != tuple(cost or PASSWORD_COST)
+
+
+def _with_hashed_password(
+    new_values: Dict[str, Any], current_password: Optional[str]
+) -> Dict[str, Any]:
+    # Les vues renvoient le hachage actuel quand le mot de passe est inchangé.
+    password = new_values.get("mot_de_passe")
+    if not password or password == current_password:
+        return {
+            name: value for name, value in new_values.items() if name != "mot_de_passe"
+        }
+    hashed_password, salt = _password_pool.submit(hash_password, password).result()
+    return {**new_values, "mot_de_passe": hashed_password, "salt": salt}
 
 
 def create_collaborateur(
-    nom_utilisateur: str, mot_de_passe: str, role: str
+    nom_utilisateur: str,
+    mot_de_passe: str,
+    role: str,
+    session: Optional[DbSession] = None,
 ) -> Collaborateur:
     """
     Crée un nouveau collaborateur dans la base de données.
@@ -33,158 +212,270 @@ def create_collaborateur(
         nom_utilisateur (str): Le nom d'utilisateur du collaborateur.
         mot_de_passe (str): Le mot de passe du collaborateur.
         role (str): Le rôle du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Collaborateur: Le collaborateur créé.
     """
-    session = Session()
-    hashed_password, salt = hash_password(mot_de_passe)
-    collaborateur = Collaborateur(
-        nom_utilisateur=nom_utilisateur,
-        mot_de_passe=hashed_password,
-        salt=salt,
-        role=role,
-    )
-    session.add(collaborateur)
-    session.commit()
-    session.close()
-    return collaborateur
+    hashed_password, salt = _password_pool.submit(hash_password, mot_de_passe).result()
+    with session_scope(session) as session:
+        collaborateur = Collaborateur(
+            nom_utilisateur=nom_utilisateur,
+            mot_de_passe=hashed_password,
+            salt=salt,
+            role=role,
+        )
+        session.add(collaborateur)
+        session.flush()
+        return collaborateur
 
 
-def get_support_name(collaborateur_id: int) -> str:
+def get_support_name(collaborateur_id: int, session: Optional[DbSession] = None) -> str:
     """
     Récupère le nom du support à partir de l'identifiant du collaborateur.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         str: Le nom du support associé au collaborateur.
     """
-    session = Session()
-    collaborateur = session.query(Collaborateur).filter_by(id=collaborateur_id).first()
+    with session_scope(session) as session:
+        collaborateur = (
+            session.query(Collaborateur).filter_by(id=collaborateur_id).first()
+        )
 
-    if collaborateur:
-        support_name = collaborateur.nom_utilisateur
-        session.close()
-        if support_name:
-            return support_name
+    if collaborateur and collaborateur.nom_utilisateur:
+        return collaborateur.nom_utilisateur
 
     return "Support introuvable"
 
 
 def authenticate_collaborateur(
-    nom_utilisateur: str, mot_de_passe: str
-) -> Collaborateur:
+    nom_utilisateur: str, mot_de_passe: str, session: Optional[DbSession] = None
+) -> Optional[int]:
     """
     Authentifie un collaborateur.
 
+    La vérification du mot de passe est confiée au pool PASSWORD_WORKERS : des
+    connexions simultanées se partagent les processeurs sans dépasser la
+    mémoire prévue. Aucune connexion à la base n'est retenue pendant le calcul :
+    le hachage est lu, puis la connexion enregistrée, dans deux transactions
+    courtes. Un hachage ancien (sha3_256) ou d'un autre coût est remplacé, une
+    fois le mot de passe vérifié, par un hachage au coût courant.
+
+    Une session est ouverte pour le collaborateur ; son jeton devient celui de
+    ce processus (get_current_token). Les sessions expirées sont purgées au
+    plus toutes les SWEEP_INTERVAL secondes.
+
     Args:
         nom_utilisateur (str): Le nom d'utilisateur du collaborateur.
         mot_de_passe (str): Le mot de passe du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         int: L'identifiant du collaborateur si l'authentification réussit, sinon None.
     """
-    session = get_session()
-    collaborateur = (
-        session.query(Collaborateur).filter_by(nom_utilisateur=nom_utilisateur).first()
-    )
-    collaborateur_id = None
-    if collaborateur:
-        hashed_password_input = hashlib.sha3_256(
-            (mot_de_passe + collaborateur.salt).encode()
-        ).hexdigest()
-        if hashed_password_input == collaborateur.mot_de_passe:
-            collaborateur.is_connected = True
-            session.commit()
-            collaborateur_id = collaborateur.id
-    else:
+    global _current_token
+    with session_scope(session) as current:
+        stored = current.execute(
+            select(
+                Collaborateur.id, Collaborateur.mot_de_passe, Collaborateur.salt
+            ).where(Collaborateur.nom_utilisateur == nom_utilisateur)
+        ).first()
+    if stored is None:
         print("User not found!")
-
-    session.close()
+        return None
+    collaborateur_id, hashed_password, salt = stored
+    verified = _password_pool.submit(
+        verify_password, mot_de_passe, hashed_password, salt
+    ).result()
+    if not verified:
+        return None
+    rehashed = None
+    if needs_rehash(hashed_password):
+        rehashed = _password_pool.submit(hash_password, mot_de_passe).result()
+
+    with session_scope(session) as current:
+        collaborateur = current.get(Collaborateur, collaborateur_id)
+        # Mot de passe modifié entre-temps : la vérification ne vaut plus.
+        if collaborateur is None or collaborateur.mot_de_passe != hashed_password:
+            return None
+        if rehashed is not None:
+            collaborateur.mot_de_passe, collaborateur.salt = rehashed
+        token = _sessions.open(collaborateur, current)
+    _current_token = token
+    _sessions.sweep_if_due()
     return collaborateur_id
 
 
-def get_collaborateur_by_id(collaborateur_id: int) -> Collaborateur:
+def get_collaborateur_by_id(
+    collaborateur_id: int, session: Optional[DbSession] = None
+) -> Collaborateur:
     """
     Récupère un collaborateur à partir de son identifiant.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur à récupérer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Collaborateur: Le collaborateur correspondant à l'identifiant donné.
     """
-    session = Session()
-    collaborateur = session.query(Collaborateur).filter_by(id=collaborateur_id).first()
-    session.close()
-    return collaborateur
+    with session_scope(session) as session:
+        return session.query(Collaborateur).filter_by(id=collaborateur_id).first()
 
 
-def get_collaborateur_id_connected(nom_utilisateur):
+def get_collaborateur_id_connected(
+    nom_utilisateur, session: Optional[DbSession] = None
+):
     """
     Récupère l'identifiant et le rôle du collaborateur connecté.
 
+    L'identité de la session en cours est utilisée en priorité ; la table des
+    collaborateurs n'est interrogée que pour un autre nom d'utilisateur.
+
+    Args:
+        nom_utilisateur (str): Le nom d'utilisateur du collaborateur connecté.
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
         tuple: Un tuple contenant l'identifiant et le rôle du collaborateur connecté,
                ou (None, None) s'il n'y a aucun collaborateur connecté.
     """
-    session = get_session()
-    collaborateur = (
-        session.query(Collaborateur).filter_by(nom_utilisateur=nom_utilisateur).first()
-    )
-    session.close()
+    connecte = get_collaborateur_connecte(session=session)
+    if connecte is not None and connecte.nom_utilisateur == nom_utilisateur:
+        return connecte.id, connecte.role
+    with session_scope(session) as session:
+        collaborateur = (
+            session.query(Collaborateur)
+            .filter_by(nom_utilisateur=nom_utilisateur)
+            .first()
+        )
     if collaborateur:
         return collaborateur.id, collaborateur.role
     print("aucun collaborateur connecté")
     return None, None
 
 
-def get_only_id_collaborateur():
-    session = get_session()
-    collaborateur = session.query(Collaborateur).filter_by(is_connected=True).first()
-    session.close()
-    if collaborateur:
-        return collaborateur.id
-    return None
+def get_only_id_collaborateur(
+    session: Optional[DbSession] = None, token: Optional[str] = None
+) -> Optional[int]:
+    """
+    Renvoie l'identifiant du collaborateur d'une session.
+
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+        token (str, optional): Le jeton de la session. Par défaut, celui de la
+                               session ouverte par ce processus.
+
+    Returns:
+        int: L'identifiant du collaborateur, ou None sans session valide.
+    """
+    connecte = get_collaborateur_connecte(token, session=session)
+    return connecte.id if connecte is not None else None
 
 
-def update_collaborateur(collaborateur_id: int, new_values: Dict[str, str]) -> None:
+def update_collaborateur(
+    collaborateur_id: int,
+    new_values: Dict[str, str],
+    session: Optional[DbSession] = None,
+) -> Optional[Changes]:
     """
     Met à jour les informations d'un collaborateur.
 
+    Seules les colonnes dont la valeur change sont écrites ; rien n'est écrit si
+    aucune valeur ne change. Un nouveau mot de passe est haché avant écriture.
+
     Args:
         collaborateur_id (int): L'identifiant du collaborateur à mettre à jour.
         new_values (dict): Un dictionnaire contenant les nouvelles valeurs à attribuer
                            aux attributs du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
-        None
+        dict: Les colonnes modifiées, ou None si le collaborateur n'existe pas.
     """
 
-    session = Session()
-    collaborateur = session.query(Collaborateur).filter_by(id=collaborateur_id).first()
-    if collaborateur:
-        for attr in new_values:
-            setattr(collaborateur, attr, new_values[attr])
-        session.commit()
-    session.close()
+    with session_scope(session) as session:
+        if "mot_de_passe" in new_values:
+            current = session.get(Collaborateur, int(collaborateur_id))
+            new_values = _with_hashed_password(
+                new_values, current.mot_de_passe if current is not None else None
+            )
+        changes = update_by_id(Collaborateur, collaborateur_id, new_values, session)
+        if changes:
+            # Nom ou rôle en cache dans ses sessions ouvertes.
+            on_commit(
+                session,
+                lambda: invalidate_collaborateur_connecte(int(collaborateur_id)),
+            )
+        return changes
+
+
+def update_collaborateurs(
+    changes_by_id: Dict[int, Dict[str, Any]], session: Optional[DbSession] = None
+) -> int:
+    """
+    Met à jour plusieurs collaborateurs dans la même transaction.
 
+    Args:
+        changes_by_id (dict): Les nouvelles valeurs, par identifiant de collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
-def get_collaborateur_name_by_id(collaborateur_id: int) -> str:
+    Returns:
+        int: Le nombre de collaborateurs effectivement modifiés.
+    """
+    with session_scope(session) as session:
+        with_password = [
+            int(object_id)
+            for object_id, new_values in changes_by_id.items()
+            if "mot_de_passe" in new_values
+        ]
+        if with_password:
+            current = dict(
+                session.execute(
+                    select(Collaborateur.id, Collaborateur.mot_de_passe).where(
+                        Collaborateur.id.in_(with_password)
+                    )
+                ).all()
+            )
+            changes_by_id = {
+                object_id: (
+                    _with_hashed_password(new_values, current.get(int(object_id)))
+                    if "mot_de_passe" in new_values
+                    else new_values
+                )
+                for object_id, new_values in changes_by_id.items()
+            }
+        updated = bulk_update(Collaborateur, changes_by_id, session)
+        if updated:
+            for object_id in changes_by_id:
+                on_commit(
+                    session,
+                    partial(invalidate_collaborateur_connecte, int(object_id)),
+                )
+        return updated
+
+
+def get_collaborateur_name_by_id(
+    collaborateur_id: int, session: Optional[DbSession] = None
+) -> str:
     """
     Récupère le nom du collaborateur à partir de son ID.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         str: Le nom d'utilisateur du collaborateur.
     """
-    session = Session()
-    collaborateur = session.query(Collaborateur).filter_by(id=collaborateur_id).first()
-    session.close()
+    with session_scope(session) as session:
+        collaborateur = (
+            session.query(Collaborateur).filter_by(id=collaborateur_id).first()
+        )
 
     if collaborateur:
         return collaborateur.nom_utilisateur
@@ -192,89 +483,159 @@ def get_collaborateur_name_by_id(collaborateur_id: int) -> str:
         return "Inconnu"
 
 
-def get_all_commercial():
+def get_all_commercial(session: Optional[DbSession] = None):
     """
     Affiche la liste de tous les commerciaux disponibles.
+
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
     """
-    session = Session()
-    collaborateur = session.query(Collaborateur).filter_by(role="commercial").all()
-    session.close()
+    with session_scope(session) as session:
+        collaborateur = session.query(Collaborateur).filter_by(role="commercial").all()
     if collaborateur:
         return collaborateur
 
 
-def delete_collaborateur(nom_utilisateur: int) -> None:
+def delete_collaborateur(
+    nom_utilisateur: int, session: Optional[DbSession] = None
+) -> None:
     """
     Supprime un collaborateur de la base de données.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur à supprimer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         None
     """
-    session = Session()
-    collaborateur = (
-        session.query(Collaborateur).filter_by(nom_utilisateur=nom_utilisateur).first()
-    )
-    if collaborateur:
-        session.delete(collaborateur)
-        session.commit()
-    session.close()
-
-
-def get_all_collaborateurs(nom_utilisateur: Optional[str] = None) -> Collaborateur:
+    with session_scope(session) as session:
+        collaborateur = (
+            session.query(Collaborateur)
+            .filter_by(nom_utilisateur=nom_utilisateur)
+            .first()
+        )
+        if collaborateur:
+            _sessions.close_collaborateur(collaborateur.id, session)
+            session.delete(collaborateur)
+            session.flush()
+
+
+def get_all_collaborateurs(
+    nom_utilisateur: Optional[str] = None, session: Optional[DbSession] = None
+) -> List[Collaborateur]:
     """
     Récupère une liste de tous les collaborateurs ou filtrée par nom d'utilisateur.
 
     Args:
         nom_utilisateur (str, optional): Le nom d'utilisateur à filtrer. Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         list: Une liste des collaborateurs récupérés.
     """
-    session = Session()
-    query = session.query(Collaborateur)
-    if nom_utilisateur:
-        query = query.filter(Collaborateur.nom_utilisateur == nom_utilisateur)
-    query = query.order_by(Collaborateur.nom_utilisateur)
-    collaborateurs = query.all()
-    return collaborateurs
+    with session_scope(session) as session:
+        query = session.query(Collaborateur)
+        if nom_utilisateur:
+            query = query.filter(Collaborateur.nom_utilisateur == nom_utilisateur)
+        query = query.order_by(Collaborateur.nom_utilisateur)
+        return query.all()
 
 
-def get_collaborateurs_filtered(nom_utilisateur: Optional[str] = None) -> Collaborateur:
+def get_collaborateurs_filtered(
+    nom_utilisateur: Optional[str] = None, session: Optional[DbSession] = None
+) -> List[Collaborateur]:
     """
     Récupère une liste de collaborateurs filtrés par nom d'utilisateur.
 
     Args:
         nom_utilisateur (str, optional): Le nom d'utilisateur à filtrer. Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         list: Une liste des collaborateurs filtrés par nom d'utilisateur.
     """
-    session = Session()
-    query = session.query(Collaborateur)
+    with session_scope(session) as session:
+        query = session.query(Collaborateur)
 
-    if nom_utilisateur:
-        query = query.filter(Collaborateur.nom_utilisateur == nom_utilisateur)
-    query = query.order_by(Collaborateur.nom_utilisateur)
-    collaborateur = query.all()
-    return collaborateur
+        if nom_utilisateur:
+            query = query.filter(Collaborateur.nom_utilisateur == nom_utilisateur)
+        query = query.order_by(Collaborateur.nom_utilisateur)
+        return query.all()
 
 
-def disconnection_collaborateur():
+def get_collaborateurs_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    nom_utilisateur: Optional[str] = None,
+    session: Optional[DbSession] = None,
+) -> Page:
     """
-    Déconnecte le collaborateur connecté.
+    Récupère une page de collaborateurs par ordre alphabétique.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre de collaborateurs par page.
+        nom_utilisateur (str, optional): Le nom d'utilisateur à filtrer. Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Page: Une page de collaborateurs.
+    """
+    with session_scope(session) as session:
+        query = session.query(Collaborateur)
+        if nom_utilisateur:
+            query = query.filter(Collaborateur.nom_utilisateur == nom_utilisateur)
+        return paginate(
+            query,
+            [(Collaborateur.nom_utilisateur, False), (Collaborateur.id, False)],
+            key=lambda collaborateur: (collaborateur.nom_utilisateur, collaborateur.id),
+            after=after,
+            limit=limit,
+        )
+
+
+def stream_collaborateurs(
+    batch_size: Optional[int] = None, session: Optional[DbSession] = None
+) -> Iterator[Collaborateur]:
+    """
+    Parcourt les collaborateurs un par un sans charger toute la table en mémoire.
+
+    Args:
+        batch_size (int, optional): Le nombre de lignes lues par lot.
+        session (Session, optional): La session à utiliser.
+
+    Yields:
+        Collaborateur: Les collaborateurs, par identifiant croissant.
+    """
+    yield from stream_scalars(
+        select(Collaborateur).order_by(Collaborateur.id),
+        batch_size=batch_size,
+        session=session,
+    )
+
+
+def disconnection_collaborateur(
+    session: Optional[DbSession] = None, token: Optional[str] = None
+) -> None:
+    """
+    Déconnecte un collaborateur en fermant sa session.
+
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+        token (str, optional): Le jeton de la session à fermer. Par défaut,
+                               celui de la session ouverte par ce processus.
 
     Returns:
         None
     """
-    session = get_session()
-    collaborateur = session.query(Collaborateur).filter_by(is_connected=True).first()
-    if collaborateur:
-        collaborateur.is_connected = False
-        session.commit()
-        session.close()
+    global _current_token
+    token = token or _current_token
+    if token is None:
+        return
+    _sessions.close(token, session=session)
+    if token == _current_token:
+        _current_token = None
 
 
-atexit.register(disconnection_collaborateur)
+instrument_module(globals())
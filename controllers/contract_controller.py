@@ -1,6 +1,21 @@
-from typing import Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session as DbSession
+from models.client import Client
+from models.collaborateur import Collaborateur
 from models.contract import Contract
-from database.db_config import Session
+from models.event import Events
+from database.db_config import session_scope
+from database.streaming import stream_scalars
+from database.tracing import instrument_module
+from database.pagination import PAGE_SIZE, Cursor, Page, paginate
+from database.rollups import (
+    bulk_update_tracked,
+    row_values,
+    track_change,
+    update_tracked,
+)
+from database.updates import Changes
 from controllers.client_controller import get_client_by_id
 from controllers.collaborateur_controlleur import get_collaborateur_id_connected
 
@@ -13,6 +28,7 @@ def create_contract(
     montant_restant_a_payer: int,
     statut_contrat: str,
     nom_utilisateur: str,
+    session: Optional[DbSession] = None,
 ) -> Contract:
     """
     Crée un nouveau contrat dans la base de données.
@@ -25,131 +41,273 @@ def create_contract(
         montant_total (float): Le montant total du contrat.
         montant_restant_a_payer (float): Le montant restant à payer pour le contrat.
         statut_contrat (str): Le statut du contrat.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Contract: Le contrat créé.
     """
-    client = get_client_by_id(client_id)
-    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur)
-    if client:
-        session = Session()
-        contract = Contract(
-            client_id=client_id,
-            contact_commercial=contact_commercial,
-            collaborateur_id=collaborateur_id,
-            montant_total=montant_total,
-            montant_restant_a_payer=montant_restant_a_payer,
-            statut_contrat=statut_contrat,
+    with session_scope(session) as session:
+        client = get_client_by_id(client_id, session=session)
+        collaborateur_id, _ = get_collaborateur_id_connected(
+            nom_utilisateur, session=session
         )
-        session.add(contract)
-        session.commit()
-        session.close()
-        return contract
-    else:
-        raise ValueError("Client non trouvé")
+        if client:
+            contract = Contract(
+                client_id=client_id,
+                contact_commercial=contact_commercial,
+                collaborateur_id=collaborateur_id,
+                montant_total=montant_total,
+                montant_restant_a_payer=montant_restant_a_payer,
+                statut_contrat=statut_contrat,
+            )
+            session.add(contract)
+            session.flush()
+            track_change(session, Contract, None, row_values(contract, Contract))
+            return contract
+        else:
+            raise ValueError("Client non trouvé")
 
 
-def get_contract_by_id(contract_id: int) -> Contract:
+def get_contract_by_id(
+    contract_id: int, session: Optional[DbSession] = None
+) -> Contract:
     """
     Récupère un contrat à partir de son identifiant.
 
     Args:
         contract_id (int): L'identifiant du contrat à récupérer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Contract: Le contrat correspondant à l'identifiant donné.
     """
-    session = Session()
-    contract = session.query(Contract).filter_by(id=contract_id).first()
-    session.close()
-    return contract
+    with session_scope(session) as session:
+        return session.query(Contract).filter_by(id=contract_id).first()
 
 
-def update_contract(contract_id: int, new_values: Dict[str, str]) -> None:
+def update_contract(
+    contract_id: int, new_values: Dict[str, str], session: Optional[DbSession] = None
+) -> Optional[Changes]:
     """
     Met à jour les informations d'un contrat.
 
+    Seules les colonnes dont la valeur change sont écrites ; rien n'est écrit si
+    aucune valeur ne change.
+
     Args:
         contract_id (int): L'identifiant du contrat à mettre à jour.
         new_values (dict): Un dictionnaire contenant les nouvelles valeurs à attribuer
                            aux attributs du contrat.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
-        None
+        dict: Les colonnes modifiées, ou None si le contrat n'existe pas.
     """
-    session = Session()
-    try:
-        contract = session.query(Contract).filter_by(id=contract_id).first()
-        if contract:
-            for attr, value in new_values.items():
-                setattr(contract, attr, value)
-            session.commit()
-            print("Le contrat a été mis à jour avec succès.")
-        else:
-            print("Contrat introuvable.")
-    except Exception as e:
-        session.rollback()
-        print(f"Erreur lors de la mise à jour du contrat : {str(e)}")
-    finally:
-        session.close()
+    with session_scope(session) as session:
+        return update_tracked(Contract, contract_id, new_values, session)
 
 
-def delete_contract(contract_id: int) -> None:
+def update_contracts(
+    changes_by_id: Dict[int, Dict[str, Any]], session: Optional[DbSession] = None
+) -> int:
+    """
+    Met à jour plusieurs contrats dans la même transaction.
+
+    Args:
+        changes_by_id (dict): Les nouvelles valeurs, par identifiant de contrat.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        int: Le nombre de contrats effectivement modifiés.
+    """
+    with session_scope(session) as session:
+        return bulk_update_tracked(Contract, changes_by_id, session)
+
+
+def delete_contract(contract_id: int, session: Optional[DbSession] = None) -> None:
     """
     Supprime un contrat de la base de données.
 
+    Un contrat auquel des événements sont rattachés ne peut pas être supprimé.
+
     Args:
         contract_id (int): L'identifiant du contrat à supprimer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         None
+
+    Raises:
+        ValueError: Si des événements sont rattachés au contrat.
     """
-    session = Session()
-    contract = session.query(Contract).filter_by(id=contract_id).first()
-    if contract:
-        session.delete(contract)
-        session.commit()
-    session.close()
+    with session_scope(session) as session:
+        contract = session.query(Contract).filter_by(id=contract_id).first()
+        if contract:
+            nb_events = session.scalar(
+                select(func.count())
+                .select_from(Events)
+                .where(Events.contract_id == contract.id)
+            )
+            if nb_events:
+                raise ValueError(f"contrat lié à {nb_events} événement(s)")
+            track_change(session, Contract, row_values(contract, Contract), None)
+            session.delete(contract)
+            session.flush()
+
+
+ContractRow = Tuple[Contract, Optional[str], Optional[str]]
+
+
+def _query_contracts_with_names(session: DbSession) -> Query:
+    """
+    Construit la requête des contrats joints au nom du collaborateur et du client.
+    """
+    return (
+        session.query(Contract, Collaborateur.nom_utilisateur, Client.nom_complet)
+        .outerjoin(Collaborateur, Contract.collaborateur_id == Collaborateur.id)
+        .outerjoin(Client, Contract.client_id == Client.id)
+    )
+
 
+def _as_contract_rows(query: Query) -> List[ContractRow]:
+    return [tuple(row) for row in query.all()]
 
-def get_contracts_filter_by_price() -> Contract:
+
+def get_contracts_filter_by_price(
+    session: Optional[DbSession] = None,
+) -> List[ContractRow]:
     """
     Récupère tous les contrats filtrés par prix.
 
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
-        list: Une liste des contrats triés par montant total décroissant.
+        list: Une liste de triplets (contrat, nom du collaborateur, nom du client)
+              triés par montant total décroissant.
     """
-    session = Session()
-    contracts = session.query(Contract).order_by(Contract.montant_total.desc()).all()
-    session.close()
-    return contracts
+    with session_scope(session) as session:
+        query = _query_contracts_with_names(session).order_by(
+            Contract.montant_total.desc()
+        )
+        return _as_contract_rows(query)
 
 
-def get_contracts_filter_by_collaborateur(collaborateur_id: int) -> Contract:
+def get_contracts_filter_by_collaborateur(
+    collaborateur_id: int, session: Optional[DbSession] = None
+) -> List[ContractRow]:
     """
     Récupère tous les contrats associés à un collaborateur donné.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
-        list: Une liste des contrats associés au collaborateur.
+        list: Une liste de triplets (contrat, nom du collaborateur, nom du client)
+              associés au collaborateur.
     """
-    session = Session()
-    contracts = (
-        session.query(Contract).filter_by(collaborateur_id=collaborateur_id[0]).all()
-    )
-    session.close()
-    return contracts
+    with session_scope(session) as session:
+        query = _query_contracts_with_names(session).filter(
+            Contract.collaborateur_id == collaborateur_id[0]
+        )
+        return _as_contract_rows(query)
 
 
-def get_all_contracts() -> Contract:
+def get_all_contracts(session: Optional[DbSession] = None) -> List[ContractRow]:
     """
     Récupère tous les contrats de la base de données.
 
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Une liste de triplets (contrat, nom du collaborateur, nom du client).
+    """
+    with session_scope(session) as session:
+        return _as_contract_rows(_query_contracts_with_names(session))
+
+
+def _contracts_page(
+    query: Query, order: list, after: Optional[Cursor], limit: int
+) -> Page:
+    page = paginate(
+        query,
+        order,
+        key=lambda row: tuple(getattr(row[0], column.key) for column, _ in order),
+        after=after,
+        limit=limit,
+    )
+    page.items = [tuple(row) for row in page.items]
+    return page
+
+
+def get_contracts_by_price_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    session: Optional[DbSession] = None,
+) -> Page:
+    """
+    Récupère une page de contrats triés par montant total décroissant.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre de contrats par page.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Page: Une page de triplets (contrat, nom du collaborateur, nom du client).
+    """
+    with session_scope(session) as session:
+        return _contracts_page(
+            _query_contracts_with_names(session),
+            [(Contract.montant_total, True), (Contract.id, True)],
+            after,
+            limit,
+        )
+
+
+def get_all_contracts_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    collaborateur_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> Page:
+    """
+    Récupère une page de contrats par identifiant croissant.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre de contrats par page.
+        collaborateur_id (int, optional): L'identifiant du collaborateur à filtrer.
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
-        list: Une liste de tous les contrats.
+        Page: Une page de triplets (contrat, nom du collaborateur, nom du client).
+    """
+    with session_scope(session) as session:
+        query = _query_contracts_with_names(session)
+        if collaborateur_id:
+            query = query.filter(Contract.collaborateur_id == collaborateur_id)
+        return _contracts_page(query, [(Contract.id, False)], after, limit)
+
+
+def stream_contracts(
+    batch_size: Optional[int] = None, session: Optional[DbSession] = None
+) -> Iterator[Contract]:
+    """
+    Parcourt les contrats un par un sans charger toute la table en mémoire.
+
+    Args:
+        batch_size (int, optional): Le nombre de lignes lues par lot.
+        session (Session, optional): La session à utiliser.
+
+    Yields:
+        Contract: Les contrats, par identifiant croissant.
     """
-    session = Session()
-    contracts = session.query(Contract).all()
-    return contracts
+    yield from stream_scalars(
+        select(Contract).order_by(Contract.id), batch_size=batch_size, session=session
+    )
+
+
+instrument_module(globals())
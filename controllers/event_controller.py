@@ -1,11 +1,74 @@
+import datetime as dt
+from bisect import bisect_right
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, Iterator, List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Query, Session as DbSession, joinedload
+from models.client import Client
 from models.collaborateur import Collaborateur
+from models.contract import Contract
 from models.event import Events
-from database.db_config import Session
+from database import db_config
+from database.db_config import on_commit, session_scope
+from database.streaming import stream_scalars
+from database.tracing import instrument_module
+from database.pagination import PAGE_SIZE, Cursor, Page, paginate
+from database.rollups import (
+    bulk_update_tracked,
+    row_values,
+    track_change,
+    update_tracked,
+)
+from database.updates import Changes, coerce_value
+from database.window_cache import WindowCache
 from controllers.collaborateur_controlleur import get_collaborateur_by_id
 
-session = Session()
+# Colonnes dont la modification peut créer un conflit de planning.
+SCHEDULE_FIELDS = ("collaborateur_id", "date_debut", "date_fin")
+# Nombre de conflits relevés par la vérification d'un planning.
+MAX_REPORTED_CONFLICTS = 5
+# Ordre des listes d'événements : par date de début, puis par identifiant.
+EVENT_ORDER = [(Events.date_debut, False), (Events.id, False)]
+PAST_EVENT_ORDER = [(Events.date_debut, True), (Events.id, True)]
+
+# Événements des prochains jours, servis depuis la mémoire et invalidés par les
+# écritures de ce module une fois leur transaction validée.
+_upcoming_events = WindowCache()
+
+
+def _event_key(event: Events) -> Cursor:
+    return (event.date_debut, event.id)
+
+
+def invalidate_upcoming_events() -> None:
+    """
+    Vide le cache des événements à venir, rechargé à la prochaine lecture.
+
+    À appeler après une écriture qui ne passe pas par ce module (import en
+    masse, renommage d'un client).
+    """
+    _upcoming_events.invalidate()
+
+
+class EventConflictError(ValueError):
+    """
+    Levée quand un support serait affecté à deux événements qui se chevauchent.
+
+    Attributes:
+        conflicts (list): Les événements déjà planifiés sur la période, en
+                          triplets (id, date_debut, date_fin) : l'exception
+                          survit à l'annulation de la transaction.
+    """
+
+    def __init__(self, conflicts: List[Events]) -> None:
+        self.conflicts = [
+            (event.id, event.date_debut, event.date_fin) for event in conflicts
+        ]
+        dates = ", ".join(
+            f"n°{event_id} du {debut} au {fin}"
+            for event_id, debut, fin in self.conflicts
+        )
+        super().__init__(f"Le support est déjà affecté à : {dates}")
 
 
 def create_event(
@@ -18,13 +81,17 @@ def create_event(
     participants: int,
     notes: str,
     collaborateur_id: int,
+    session: Optional[DbSession] = None,
 ) -> Events:
     """
     Crée un nouvel événement dans la base de données.
 
+    Le client de l'événement est celui du contrat.
+
     Args:
         contract_id (int): L'identifiant du contrat associé à l'événement.
-        client_name (str): Le nom du client associé à l'événement.
+        client_name (str): Le nom du client associé à l'événement. S'il est
+                           renseigné, il doit être celui du client du contrat.
         collaborateur_id (int): L'identifiant du collaborateur associé à l'événement.
         date_debut (datetime): La date de début de l'événement.
         date_fin (datetime): La date de fin de l'événement.
@@ -32,154 +99,580 @@ def create_event(
         lieu (str): Le lieu de l'événement.
         participants (int): Les participants à l'événement.
         notes (str): Les notes de l'événement.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Events: L'événement créé.
+
+    Raises:
+        ValueError: Si le contrat n'existe pas, n'appartient pas au client
+                    nommé, ou si les dates sont invalides.
+        EventConflictError: Si le support est déjà affecté sur la période.
+    """
+    columns = Events.__table__.c
+    date_debut = coerce_value(columns.date_debut, date_debut)
+    date_fin = coerce_value(columns.date_fin, date_fin)
+    with session_scope(session) as session:
+        contract = session.get(Contract, int(contract_id))
+        if contract is None:
+            raise ValueError("Contrat introuvable")
+        if client_name and client_name != contract.client.nom_complet:
+            raise ValueError(
+                f"Le contrat {contract.id} n'appartient pas au client '{client_name}'"
+            )
+        check_schedule(collaborateur_id, date_debut, date_fin, session=session)
+        event = Events(
+            contract_id=contract.id,
+            client_id=contract.client_id,
+            client_name=contract.client.nom_complet,
+            date_debut=date_debut,
+            date_fin=date_fin,
+            contact_support=contact_support,
+            lieu=lieu,
+            participants=participants,
+            notes=notes,
+            collaborateur_id=collaborateur_id,
+        )
+        session.add(event)
+        session.flush()
+        track_change(session, Events, None, row_values(event, Events))
+        on_commit(session, invalidate_upcoming_events)
+        return event
+
+
+def _overlapping_ids(
+    date_debut: dt.date, date_fin: dt.date, collaborateur_id: Optional[int] = None
+) -> Select:
+    """
+    Construit la requête des identifiants des événements qui chevauchent une
+    période : deux périodes se chevauchent si chacune commence avant la fin de
+    l'autre (bornes incluses).
+
+    Seul l'identifiant est lu, ce qui fait des index (date_fin, date_debut) et
+    (collaborateur_id, date_fin, date_debut) des index couvrants : le parcours
+    part de date_debut sur date_fin, et les événements terminés avant la période,
+    qui forment l'essentiel de l'historique, ne sont pas lus. Sélectionner les
+    lignes entières laisserait le moteur choisir l'index sur date_debut, dont
+    la borne supérieure seule ne filtre presque rien.
     """
-    session = Session()
-
-    event = Events(
-        contract_id=contract_id,
-        client_name=client_name,
-        date_debut=date_debut,
-        date_fin=date_fin,
-        contact_support=contact_support,
-        lieu=lieu,
-        participants=participants,
-        notes=notes,
-        collaborateur_id=collaborateur_id,
+    statement = select(Events.id).where(
+        Events.date_fin >= date_debut, Events.date_debut <= date_fin
     )
-    session.add(event)
-    session.commit()
-    session.close()
-    return event
+    if collaborateur_id is not None:
+        statement = statement.where(Events.collaborateur_id == int(collaborateur_id))
+    return statement
+
+
+def find_conflicts(
+    collaborateur_id: Optional[int],
+    date_debut: dt.date,
+    date_fin: dt.date,
+    exclude_event_id: Optional[int] = None,
+    limit: Optional[int] = MAX_REPORTED_CONFLICTS,
+    session: Optional[DbSession] = None,
+) -> List[Events]:
+    """
+    Recherche les événements d'un support qui chevauchent une période.
+
+    Une première requête, limitée, relève les identifiants par l'index
+    (collaborateur_id, date_fin, date_debut) ; les événements ne sont chargés
+    que s'il y a conflit. Seuls les supports ont un planning : un événement
+    rattaché à un autre collaborateur, le commercial qui l'a créé par exemple,
+    n'est jamais en conflit.
 
+    Args:
+        collaborateur_id (int): L'identifiant du support. None : aucun conflit.
+        date_debut (date): Le début de la période.
+        date_fin (date): La fin de la période.
+        exclude_event_id (int, optional): Un événement à ignorer (celui modifié).
+        limit (int, optional): Le nombre maximal de conflits renvoyés, None pour
+                               tous.
+        session (Session, optional): La session de l'unité de travail en cours.
 
-def get_event_by_id(event_id: int) -> Events:
+    Returns:
+        list: Les événements en conflit, par date de début.
+    """
+    if collaborateur_id is None:
+        return []
+    with session_scope(session) as session:
+        statement = _overlapping_ids(date_debut, date_fin, collaborateur_id).where(
+            select(Collaborateur.id)
+            .where(
+                Collaborateur.id == int(collaborateur_id),
+                Collaborateur.role == "support",
+            )
+            .exists()
+        )
+        if exclude_event_id is not None:
+            statement = statement.where(Events.id != exclude_event_id)
+        ids = list(session.scalars(statement.limit(limit)))
+        if not ids:
+            return []
+        return list(
+            session.scalars(
+                select(Events)
+                .where(Events.id.in_(ids))
+                .order_by(Events.date_debut, Events.id)
+            )
+        )
+
+
+def check_schedule(
+    collaborateur_id: Optional[int],
+    date_debut: Optional[dt.date],
+    date_fin: Optional[dt.date],
+    exclude_event_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> None:
+    """
+    Vérifie qu'une période est valide et libre dans le planning d'un support.
+
+    Args:
+        collaborateur_id (int): L'identifiant du support.
+        date_debut (date): Le début de la période.
+        date_fin (date): La fin de la période.
+        exclude_event_id (int, optional): Un événement à ignorer (celui modifié).
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Raises:
+        ValueError: Si la fin précède le début.
+        EventConflictError: Si le support est déjà affecté sur la période.
+    """
+    if date_debut is None or date_fin is None:
+        raise ValueError("Les dates de début et de fin sont obligatoires")
+    if date_fin < date_debut:
+        raise ValueError("La date de fin précède la date de début")
+    conflicts = find_conflicts(
+        collaborateur_id, date_debut, date_fin, exclude_event_id, session=session
+    )
+    if conflicts:
+        raise EventConflictError(conflicts)
+
+
+def get_events_between(
+    start: dt.date,
+    end: dt.date,
+    collaborateur_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> List[Events]:
+    """
+    Récupère les événements en cours à un moment quelconque entre deux dates.
+
+    Les événements sont désignés par l'index (date_fin, date_debut), puis lus
+    par identifiant avec leur client.
+
+    Args:
+        start (date): Le début de la période (inclus).
+        end (date): La fin de la période (incluse).
+        collaborateur_id (int, optional): Restreint la recherche à un support.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Les événements chevauchant la période, par date de début.
+    """
+    with session_scope(session) as session:
+        return (
+            _query_events(session)
+            .filter(
+                Events.id.in_(_overlapping_ids(start, end, collaborateur_id or None))
+            )
+            .order_by(Events.date_debut, Events.id)
+            .all()
+        )
+
+
+def _query_events(session: DbSession) -> Query:
+    # Le client est chargé par jointure sur client_id, pour l'affichage de son nom.
+    return session.query(Events).options(joinedload(Events.client))
+
+
+def get_event_by_id(event_id: int, session: Optional[DbSession] = None) -> Events:
     """
     Récupère un événement à partir de son identifiant.
 
     Args:
         event_id (int): L'identifiant de l'événement à récupérer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         Events: L'événement correspondant à l'identifiant donné.
     """
-    event = session.query(Events).filter_by(id=event_id).first()
-    session.close()
-    return event
+    with session_scope(session) as session:
+        return session.query(Events).filter_by(id=event_id).first()
 
 
-def update_event(event_id: int, new_values: Dict[str, str]) -> None:
+def update_event(
+    event_id: int, new_values: Dict[str, str], session: Optional[DbSession] = None
+) -> Optional[Changes]:
     """
     Met à jour les informations d'un événement.
 
+    Seules les colonnes dont la valeur change sont écrites ; rien n'est écrit si
+    aucune valeur ne change. Changer de contrat rattache l'événement au client
+    de ce contrat.
+
     Args:
         event_id (int): L'identifiant de l'événement à mettre à jour.
         new_values (dict): Un dictionnaire contenant les nouvelles valeurs à attribuer
                            aux attributs de l'événement.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
-        None
+        dict: Les colonnes modifiées, ou None si l'événement n'existe pas.
+
+    Raises:
+        ValueError: Si le nouveau contrat n'existe pas.
+        EventConflictError: Si le support serait affecté à deux événements qui
+                            se chevauchent.
+    """
+    with session_scope(session) as session:
+        new_values = _with_contract_clients(session, {event_id: new_values})[event_id]
+        current = session.get(Events, coerce_value(Events.__table__.c.id, event_id))
+        if current is not None and set(new_values) & set(SCHEDULE_FIELDS):
+            planned = {
+                name: (
+                    coerce_value(Events.__table__.c[name], new_values[name])
+                    if name in new_values
+                    else getattr(current, name)
+                )
+                for name in SCHEDULE_FIELDS
+            }
+            check_schedule(**planned, exclude_event_id=current.id, session=session)
+        changes = update_tracked(Events, event_id, new_values, session)
+        if changes:
+            on_commit(session, invalidate_upcoming_events)
+        return changes
+
+
+def _with_contract_clients(
+    session: DbSession, changes_by_id: Dict[Any, Dict[str, Any]]
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Complète les modifications qui changent de contrat avec le client de ce
+    contrat et son nom dénormalisé, lus en une requête pour tout le lot.
+
+    Raises:
+        ValueError: Si un des contrats n'existe pas.
     """
-    event = session.query(Events).filter_by(id=event_id).first()
-    if event:
-        for attr in new_values:
-            setattr(event, attr, new_values[attr])
-        session.commit()
-    session.close()
+    contract_ids = {
+        int(new_values["contract_id"])
+        for new_values in changes_by_id.values()
+        if new_values.get("contract_id")
+    }
+    if not contract_ids:
+        return changes_by_id
+    clients = {
+        contract_id: (client_id, nom_complet)
+        for contract_id, client_id, nom_complet in session.execute(
+            select(Contract.id, Contract.client_id, Client.nom_complet)
+            .join(Client, Contract.client_id == Client.id)
+            .where(Contract.id.in_(contract_ids))
+        )
+    }
+    if contract_ids - set(clients):
+        raise ValueError("Contrat introuvable")
+    completed = {}
+    for event_id, new_values in changes_by_id.items():
+        if new_values.get("contract_id"):
+            client_id, client_name = clients[int(new_values["contract_id"])]
+            new_values = {
+                **new_values,
+                "client_id": client_id,
+                "client_name": client_name,
+            }
+        completed[event_id] = new_values
+    return completed
+
+
+def update_events(
+    changes_by_id: Dict[int, Dict[str, Any]], session: Optional[DbSession] = None
+) -> int:
+    """
+    Met à jour plusieurs événements dans la même transaction.
+
+    Comme pour update_event, un événement qui change de contrat est rattaché au
+    client de ce contrat.
+
+    Args:
+        changes_by_id (dict): Les nouvelles valeurs, par identifiant d'événement.
+        session (Session, optional): La session de l'unité de travail en cours.
 
+    Returns:
+        int: Le nombre d'événements effectivement modifiés.
 
-def delete_event(event_id: int) -> None:
+    Raises:
+        ValueError: Si un des contrats n'existe pas.
+        EventConflictError: Si, une fois le lot appliqué, un support est affecté
+                            à deux événements qui se chevauchent. La transaction
+                            doit alors être annulée.
+    """
+    with session_scope(session) as session:
+        changes_by_id = _with_contract_clients(session, changes_by_id)
+        updated = bulk_update_tracked(Events, changes_by_id, session)
+        rescheduled = [
+            int(event_id)
+            for event_id, new_values in changes_by_id.items()
+            if set(new_values) & set(SCHEDULE_FIELDS)
+        ]
+        if updated and rescheduled:
+            # Vérification après écriture : les chevauchements internes au lot
+            # sont aussi détectés.
+            for event in session.scalars(
+                select(Events).where(Events.id.in_(rescheduled))
+            ):
+                check_schedule(
+                    event.collaborateur_id,
+                    event.date_debut,
+                    event.date_fin,
+                    exclude_event_id=event.id,
+                    session=session,
+                )
+        if updated:
+            on_commit(session, invalidate_upcoming_events)
+        return updated
+
+
+def delete_event(event_id: int, session: Optional[DbSession] = None) -> None:
     """
     Supprime un événement de la base de données.
 
     Args:
         event_id (int): L'identifiant de l'événement à supprimer.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         None
     """
-    event = session.query(Events).filter_by(id=event_id).first()
-    if event:
-        session.delete(event)
-        session.commit()
-    session.close()
-
-
-def get_events_filter_by_collaborateur(collaborateur_id: int) -> Events:
+    with session_scope(session) as session:
+        event = session.query(Events).filter_by(id=event_id).first()
+        if event:
+            track_change(session, Events, row_values(event, Events), None)
+            session.delete(event)
+            session.flush()
+            on_commit(session, invalidate_upcoming_events)
+
+
+def get_events_filter_by_collaborateur(
+    collaborateur_id: int, session: Optional[DbSession] = None
+) -> List[Events]:
     """
     Récupère tous les événements associés à un collaborateur donné.
 
     Args:
         collaborateur_id (int): L'identifiant du collaborateur.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         list: Une liste des événements associés au collaborateur.
     """
-    events = session.query(Events).filter_by(collaborateur_id=collaborateur_id[0]).all()
-    return events
+    with session_scope(session) as session:
+        return (
+            _query_events(session)
+            .filter(Events.collaborateur_id == collaborateur_id[0])
+            .all()
+        )
 
 
-def get_all_events() -> Events:
+def get_all_events(session: Optional[DbSession] = None) -> List[Events]:
     """
     Récupère tous les événements de la base de données.
 
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
         list: Une liste de tous les événements.
     """
-    events = session.query(Events).all()
-    return events
+    with session_scope(session) as session:
+        return _query_events(session).all()
 
 
-def get_events_filter_by_date(date_debut: int = None) -> Events:
+def get_events_filter_by_date(
+    date_debut: int = None, session: Optional[DbSession] = None
+) -> List[Events]:
     """
     Récupère tous les événements filtrés par date de début.
 
     Args:
         date_debut (datetime, optional): La date de début à filtrer. Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         list: Une liste des événements filtrés par date de début.
     """
-    query = session.query(Events)
+    with session_scope(session) as session:
+        query = _query_events(session)
 
-    if date_debut:
-        query = query.filter(Events.date_debut == date_debut)
-    query = query.order_by(Events.date_debut)
-    event = query.all()
-    return event
+        if date_debut:
+            query = query.filter(Events.date_debut == date_debut)
+        query = query.order_by(Events.date_debut)
+        return query.all()
 
 
-def get_events_filter_by_date_passed() -> Events:
+def get_events_filter_by_date_passed(
+    session: Optional[DbSession] = None,
+) -> List[Events]:
     """
     Récupère tous les événements passés.
 
+    La liste grandit avec l'historique : préférer get_past_events_page.
+
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
         list: Une liste des événements passés.
     """
-    current_date = datetime.now()
-    past_events = (
-        session.query(Events)
-        .filter(Events.date_debut < current_date)
-        .order_by(Events.date_debut)
-        .all()
-    )
-    return past_events
-
-
-def get_events_filter_by_date_future() -> Events:
+    with session_scope(session) as session:
+        return (
+            _query_events(session)
+            .filter(Events.date_debut < dt.date.today())
+            .order_by(Events.date_debut)
+            .all()
+        )
+
+
+def get_events_filter_by_date_future(
+    session: Optional[DbSession] = None,
+) -> List[Events]:
     """
     Récupère tous les événements futurs.
 
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+
     Returns:
         list: Une liste des événements futurs.
     """
-    current_date = datetime.now()
-    future_events = (
-        session.query(Events)
-        .filter(Events.date_debut >= current_date)
-        .order_by(Events.date_debut)
-        .all()
+    with session_scope(session) as session:
+        return (
+            _query_events(session)
+            .filter(Events.date_debut >= dt.date.today())
+            .order_by(Events.date_debut)
+            .all()
+        )
+
+
+def _load_upcoming_events(start: dt.date, end: dt.date) -> List[Events]:
+    # Session dédiée, fermée aussitôt : les événements mis en cache, détachés
+    # avec leur client, ne sont liés à la session d'aucun thread.
+    with db_config.Session() as session:
+        return (
+            _query_events(session)
+            .filter(Events.date_debut >= start, Events.date_debut < end)
+            .order_by(Events.date_debut, Events.id)
+            .all()
+        )
+
+
+def get_upcoming_events_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    session: Optional[DbSession] = None,
+) -> Page:
+    """
+    Récupère une page d'événements à venir, triés par date de début.
+
+    Les événements des WINDOW_DAYS prochains jours sont servis depuis le cache
+    en mémoire ; au-delà, les pages sont lues en base par curseur. Les
+    événements renvoyés depuis le cache sont partagés : ils sont en lecture
+    seule.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre d'événements par page.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Page: Une page d'événements à venir.
+    """
+    today = dt.date.today()
+    window_end = _upcoming_events.bounds(today)[1]
+    window = _upcoming_events.get(today, _load_upcoming_events)
+    position = 0 if after is None else bisect_right(window, after, key=_event_key)
+    items = list(window[position : position + limit])
+    if position + limit < len(window):
+        return Page(items, _event_key(items[-1]))
+
+    # Fenêtre épuisée : la suite est lue en base, au-delà de la fenêtre.
+    beyond = after if after is not None and after[0] >= window_end else None
+    with session_scope(session) as session:
+        query = _query_events(session).filter(Events.date_debut >= window_end)
+        remaining = limit - len(items)
+        if remaining == 0:
+            more = query.with_entities(Events.id).limit(1).first() is not None
+            return Page(items, _event_key(items[-1]) if more else None)
+        page = paginate(query, EVENT_ORDER, _event_key, after=beyond, limit=remaining)
+    return Page(items + page.items, page.next_cursor)
+
+
+def get_past_events_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    session: Optional[DbSession] = None,
+) -> Page:
+    """
+    Récupère une page d'événements passés, des plus récents aux plus anciens.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre d'événements par page.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Page: Une page d'événements passés.
+    """
+    with session_scope(session) as session:
+        return paginate(
+            _query_events(session).filter(Events.date_debut < dt.date.today()),
+            PAST_EVENT_ORDER,
+            _event_key,
+            after=after,
+            limit=limit,
+        )
+
+
+def get_events_page(
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    date_debut: Optional[datetime] = None,
+    session: Optional[DbSession] = None,
+) -> Page:
+    """
+    Récupère une page d'événements triés par date de début.
+
+    Args:
+        after (tuple, optional): Le curseur renvoyé par la page précédente.
+        limit (int): Le nombre d'événements par page.
+        date_debut (datetime, optional): La date de début à filtrer. Par défaut, None.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        Page: Une page d'événements.
+    """
+    with session_scope(session) as session:
+        query = _query_events(session)
+        if date_debut:
+            query = query.filter(Events.date_debut == date_debut)
+        return paginate(query, EVENT_ORDER, _event_key, after=after, limit=limit)
+
+
+def stream_events(
+    batch_size: Optional[int] = None, session: Optional[DbSession] = None
+) -> Iterator[Events]:
+    """
+    Parcourt les événements un par un sans charger toute la table en mémoire.
+
+    Args:
+        batch_size (int, optional): Le nombre de lignes lues par lot.
+        session (Session, optional): La session à utiliser.
+
+    Yields:
+        Events: Les événements, par identifiant croissant.
+    """
+    yield from stream_scalars(
+        select(Events).order_by(Events.id), batch_size=batch_size, session=session
     )
-    return future_events
+
+
+instrument_module(globals())
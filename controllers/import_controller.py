@@ -0,0 +1,786 @@
+import csv
+import datetime
+import json
+import os
+from bisect import bisect_right
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.exc import DBAPIError
+from database import db_config
+from database.db_config import session_scope
+from database.rollups import refresh_rollups
+from database.tracing import instrument_module
+from database.updates import IN_CLAUSE_SIZE
+from controllers.client_controller import invalidate_client_index
+from controllers.event_controller import invalidate_upcoming_events
+from models.client import Client
+from models.collaborateur import Collaborateur
+from models.contract import Contract
+from models.event import Events
+
+IMPORT_CHUNK_SIZE = 5000
+# Au-delà de cette taille, la validation des lignes est répartie sur plusieurs
+# processus.
+PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+# Nombre de lots en cours de validation par processus : la lecture du fichier
+# ne prend pas plus d'avance que cela sur l'insertion.
+PARSE_BATCHES_PER_WORKER = 2
+
+Row = Tuple[int, Dict[str, Any]]
+
+
+class ImportReport:
+    """
+    Bilan d'un import en masse.
+
+    Attributes:
+        inserted (int): Nombre de lignes insérées.
+        errors (list): Les erreurs rencontrées, sous forme de couples
+                       (numéro de ligne du fichier, message).
+    """
+
+    def __init__(self) -> None:
+        self.inserted = 0
+        self.errors: List[Tuple[int, str]] = []
+
+    def add_error(self, line: int, message: str) -> None:
+        self.errors.append((line, message))
+
+    def __repr__(self) -> str:
+        return f"ImportReport(inserted={self.inserted}, errors={len(self.errors)})"
+
+
+def read_records(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lit un fichier CSV (avec en-tête) ou JSONL ligne à ligne.
+
+    Args:
+        path (str): Le chemin du fichier, dont l'extension détermine le format
+                    (.csv, .jsonl ou .ndjson).
+
+    Yields:
+        tuple: Le numéro de ligne dans le fichier et l'enregistrement lu. Une ligne
+               JSON illisible est renvoyée sous la forme {"__error__": message}.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8") as file:
+        if extension == ".csv":
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+        elif extension in (".jsonl", ".ndjson"):
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    record = {"__error__": f"JSON invalide : {e}"}
+                if not isinstance(record, dict):
+                    record = {"__error__": "un objet JSON est attendu"}
+                yield line_number, record
+        else:
+            raise ValueError(f"Format de fichier non supporté : {extension}")
+
+
+def _text(
+    record: Dict[str, Any], field: str, max_length: int, required: bool = False
+) -> Optional[str]:
+    value = record.get(field)
+    if value is None or str(value).strip() == "":
+        if required:
+            raise ValueError(f"le champ '{field}' est obligatoire")
+        return None
+    value = str(value).strip()
+    if len(value) > max_length:
+        raise ValueError(f"le champ '{field}' dépasse {max_length} caractères")
+    return value
+
+
+def _integer(
+    record: Dict[str, Any], field: str, required: bool = False
+) -> Optional[int]:
+    value = record.get(field)
+    if value is None or str(value).strip() == "":
+        if required:
+            raise ValueError(f"le champ '{field}' est obligatoire")
+        return None
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise ValueError(f"le champ '{field}' n'est pas un entier")
+
+
+def _date(record: Dict[str, Any], field: str) -> datetime.date:
+    value = record.get(field)
+    if value is None or str(value).strip() == "":
+        raise ValueError(f"le champ '{field}' est obligatoire")
+    try:
+        return datetime.date.fromisoformat(str(value).strip()[:10])
+    except ValueError:
+        raise ValueError(f"le champ '{field}' n'est pas une date ISO valide")
+
+
+def _datetime(
+    record: Dict[str, Any], field: str, default: Optional[datetime.datetime]
+) -> Optional[datetime.datetime]:
+    value = record.get(field)
+    if value is None or str(value).strip() == "":
+        return default
+    try:
+        return datetime.datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValueError(f"le champ '{field}' n'est pas une date ISO valide")
+
+
+def validate_client_record(
+    record: Dict[str, Any], collaborateur_id: int, now: datetime.datetime
+) -> Dict[str, Any]:
+    """
+    Valide une ligne du fichier et la convertit en valeurs de la table client.
+
+    Args:
+        record (dict): La ligne lue dans le fichier.
+        collaborateur_id (int): L'identifiant du commercial propriétaire des clients.
+        now (datetime): La date utilisée quand le fichier n'en fournit pas.
+
+    Returns:
+        dict: Les valeurs à insérer.
+
+    Raises:
+        ValueError: Si la ligne est invalide.
+    """
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    return {
+        "nom_complet": _text(record, "nom_complet", 256, required=True),
+        "email": _text(record, "email", 256, required=True),
+        "telephone": _text(record, "telephone", 16),
+        "nom_entreprise": _text(record, "nom_entreprise", 256),
+        "date_de_creation": _datetime(record, "date_de_creation", now),
+        "derniere_maj_contact": _datetime(record, "derniere_maj_contact", now),
+        "collaborateur_id": collaborateur_id,
+    }
+
+
+def validate_contract_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Valide une ligne du fichier et la convertit en valeurs de la table contract.
+
+    Seuls les types sont vérifiés ici ; l'existence du client et du collaborateur
+    est contrôlée ensuite, pour tout un lot à la fois.
+
+    Args:
+        record (dict): La ligne lue dans le fichier.
+
+    Returns:
+        dict: Les valeurs à insérer.
+
+    Raises:
+        ValueError: Si la ligne est invalide.
+    """
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    values = {
+        "client_id": _integer(record, "client_id", required=True),
+        "contact_commercial": _text(record, "contact_commercial", 256, required=True),
+        "collaborateur_id": _integer(record, "collaborateur_id"),
+        "montant_total": _integer(record, "montant_total"),
+        "montant_restant_a_payer": _integer(record, "montant_restant_a_payer"),
+        "statut_contrat": _text(record, "statut_contrat", 50, required=True),
+    }
+    if values["montant_restant_a_payer"] is None:
+        values["montant_restant_a_payer"] = values["montant_total"]
+    return values
+
+
+def validate_event_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Valide une ligne du fichier et la convertit en valeurs de la table events.
+
+    Seuls les types sont vérifiés ici ; l'existence du contrat, du client et du
+    collaborateur est contrôlée ensuite, pour tout un lot à la fois.
+
+    Args:
+        record (dict): La ligne lue dans le fichier.
+
+    Returns:
+        dict: Les valeurs à insérer.
+
+    Raises:
+        ValueError: Si la ligne est invalide.
+    """
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    values = {
+        "contract_id": _integer(record, "contract_id", required=True),
+        "client_name": _text(record, "client_name", 256, required=True),
+        "collaborateur_id": _integer(record, "collaborateur_id"),
+        "date_debut": _date(record, "date_debut"),
+        "date_fin": _date(record, "date_fin"),
+        "contact_support": _text(record, "contact_support", 256),
+        "lieu": _text(record, "lieu", 1024),
+        "participants": _integer(record, "participants"),
+        "notes": _text(record, "notes", 2048),
+    }
+    if values["date_fin"] < values["date_debut"]:
+        raise ValueError("la date de fin précède la date de début")
+    return values
+
+
+def _validate_batch(
+    validate: Callable[[Dict[str, Any]], Dict[str, Any]], batch: List[Row]
+) -> List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    results = []
+    for line_number, record in batch:
+        try:
+            results.append((line_number, validate(record), None))
+        except ValueError as e:
+            results.append((line_number, None, str(e)))
+    return results
+
+
+def _batches(records: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    batch: List[Row] = []
+    for row in records:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _bounded_map(
+    pool: Executor, function: Callable, items: Iterable[Any], window: int
+) -> Iterator[Any]:
+    # Executor.map soumet tout l'itérable d'un coup, et lirait donc tout le
+    # fichier : ici, au plus `window` lots sont en cours, rendus dans l'ordre.
+    pending: deque = deque()
+    for item in items:
+        pending.append(pool.submit(function, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _collect(
+    results: Iterable[List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]],
+    report: ImportReport,
+) -> Iterator[Row]:
+    for batch in results:
+        for line_number, values, error in batch:
+            if error is None:
+                yield line_number, values
+            else:
+                report.add_error(line_number, error)
+
+
+def parse_records(
+    path: str,
+    validate: Callable[[Dict[str, Any]], Dict[str, Any]],
+    report: ImportReport,
+    workers: Optional[int] = None,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> Iterator[Row]:
+    """
+    Lit et valide les lignes d'un fichier, en flux.
+
+    Pour les gros fichiers, la validation est répartie par lots sur un pool de
+    processus ; la lecture reste séquentielle, l'ordre des lignes est conservé
+    et seuls quelques lots par processus sont en mémoire à la fois.
+
+    Args:
+        path (str): Le chemin du fichier à lire.
+        validate (callable): Fonction de validation, définie au niveau d'un module
+                             pour pouvoir être envoyée aux processus.
+        report (ImportReport): Le bilan où consigner les lignes invalides.
+        workers (int, optional): Le nombre de processus. Par défaut, un par cœur
+                                 si le fichier est volumineux ; 1 pour désactiver.
+        chunk_size (int): Le nombre de lignes par lot envoyé à un processus.
+
+    Yields:
+        tuple: Le numéro de ligne et les valeurs de chaque ligne valide.
+    """
+    batches = _batches(read_records(path), chunk_size)
+    check = partial(_validate_batch, validate)
+    if workers is None and os.path.getsize(path) < PARALLEL_PARSE_MIN_BYTES:
+        workers = 1
+    if workers == 1:
+        yield from _collect(map(check, batches), report)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = workers * PARSE_BATCHES_PER_WORKER
+        yield from _collect(_bounded_map(pool, check, batches, window), report)
+
+
+def _existing(session: Any, columns: Tuple[Any, ...], values: Set[Any]) -> List[Any]:
+    # Une requête par tranche de IN_CLAUSE_SIZE valeurs, pour rester sous la
+    # limite de paramètres des bases.
+    values = sorted(value for value in values if value is not None)
+    found: List[Any] = []
+    for start in range(0, len(values), IN_CLAUSE_SIZE):
+        found.extend(
+            session.execute(
+                select(*columns).where(
+                    columns[0].in_(values[start : start + IN_CLAUSE_SIZE])
+                )
+            ).all()
+        )
+    return found
+
+
+def insert_in_chunks(
+    table: Any,
+    records: Iterable[Row],
+    validate: Callable[[Dict[str, Any]], Dict[str, Any]],
+    report: ImportReport,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    schedule: Optional["_Schedule"] = None,
+) -> ImportReport:
+    """
+    Valide des lignes puis les insère par lots, un lot par transaction.
+
+    Chaque lot est envoyé en un seul INSERT multi-lignes (executemany). Si la base
+    refuse un lot, il est rejoué ligne à ligne pour isoler les lignes fautives ;
+    les autres lots ne sont pas affectés.
+
+    Args:
+        table (Table): La table cible.
+        records (iterable): Les couples (numéro de ligne, enregistrement) à importer.
+        validate (callable): Fonction convertissant un enregistrement en valeurs à
+                             insérer, ou levant ValueError.
+        report (ImportReport): Le bilan à compléter.
+        chunk_size (int): Le nombre de lignes par lot.
+        schedule (_Schedule, optional): Le planning des supports, contre lequel
+                                        chaque lot est vérifié juste avant son
+                                        insertion.
+
+    Returns:
+        ImportReport: Le bilan complété.
+    """
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+
+    def admit(rows: List[Row]) -> Tuple[List[Row], List[Tuple[int, str]]]:
+        if schedule is None:
+            return rows, []
+        return schedule.split(rows)
+
+    def insert_rows(rows: List[Row]) -> None:
+        if rows:
+            with db_config.engine.begin() as connection:
+                connection.execute(insert(table), [values for _, values in rows])
+        report.inserted += len(rows)
+        if schedule is not None:
+            schedule.record(rows)
+
+    def flush() -> None:
+        if not chunk:
+            return
+        rows, conflicts = admit(chunk)
+        try:
+            insert_rows(rows)
+        except DBAPIError:
+            # Les conflits sont réévalués : une ligne refusée par la base ne
+            # doit pas en écarter d'autres.
+            for row in chunk:
+                rows, conflicts = admit([row])
+                try:
+                    insert_rows(rows)
+                except DBAPIError as e:
+                    report.add_error(row[0], str(e.orig))
+                for line_number, message in conflicts:
+                    report.add_error(line_number, message)
+        else:
+            for line_number, message in conflicts:
+                report.add_error(line_number, message)
+        chunk.clear()
+
+    for line_number, record in records:
+        try:
+            chunk.append((line_number, validate(record)))
+        except ValueError as e:
+            report.add_error(line_number, str(e))
+            continue
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    return report
+
+
+def _refresh_rollups_after_import(
+    source: Any, ids_by_target: Dict[Any, Iterable[Optional[int]]]
+) -> None:
+    """
+    Recalcule les agrégats des lignes touchées par un import, les lots étant
+    insérés sans passer par les contrôleurs qui les tiennent à jour.
+    """
+    with session_scope() as session:
+        for target, ids in ids_by_target.items():
+            refresh_rollups(
+                session,
+                target,
+                sorted(filter(None, ids)),
+                sources=[source],
+            )
+
+
+class _Planning:
+    """
+    Les périodes déjà affectées à un support, triées par date de début, pour
+    vérifier les lignes d'un lot sans requête supplémentaire.
+    """
+
+    def __init__(
+        self, periods: Iterable[Tuple[datetime.date, datetime.date, str]]
+    ) -> None:
+        self.periods = sorted(periods)
+        self.starts = [debut for debut, _, _ in self.periods]
+
+    def conflict(
+        self, date_debut: datetime.date, date_fin: datetime.date
+    ) -> Optional[Tuple[datetime.date, datetime.date, str]]:
+        # check_schedule garantit que les périodes d'un support ne se
+        # chevauchent pas : seule la dernière qui commence avant la fin peut
+        # encore être en cours au début.
+        index = bisect_right(self.starts, date_fin)
+        if index and self.periods[index - 1][1] >= date_debut:
+            return self.periods[index - 1]
+        return None
+
+    def add(
+        self, date_debut: datetime.date, date_fin: datetime.date, label: str
+    ) -> None:
+        index = bisect_right(self.starts, date_debut)
+        self.starts.insert(index, date_debut)
+        self.periods.insert(index, (date_debut, date_fin, label))
+
+
+class _Schedule:
+    """
+    Le planning des supports référencés par un lot, chargé en une requête sur la
+    période couverte par le lot.
+
+    Une ligne n'y est ajoutée qu'une fois insérée : une ligne refusée par la base
+    ne peut pas en écarter une autre.
+    """
+
+    def __init__(self, session: Any, chunk: List[Row], supports: Set[int]) -> None:
+        self.plannings: Dict[int, _Planning] = {}
+        rows = [values for _, values in chunk if values["collaborateur_id"] in supports]
+        if not rows:
+            return
+        debut = min(values["date_debut"] for values in rows)
+        fin = max(values["date_fin"] for values in rows)
+        periods: Dict[int, List[Tuple[datetime.date, datetime.date, str]]] = {
+            values["collaborateur_id"]: [] for values in rows
+        }
+        ids = sorted(periods)
+        for start in range(0, len(ids), IN_CLAUSE_SIZE):
+            for support, event_id, date_debut, date_fin in session.execute(
+                select(
+                    Events.collaborateur_id,
+                    Events.id,
+                    Events.date_debut,
+                    Events.date_fin,
+                ).where(
+                    Events.collaborateur_id.in_(ids[start : start + IN_CLAUSE_SIZE]),
+                    Events.date_fin >= debut,
+                    Events.date_debut <= fin,
+                )
+            ):
+                periods[support].append(
+                    (date_debut, date_fin, f"l'événement n°{event_id}")
+                )
+        self.plannings = {
+            support: _Planning(support_periods)
+            for support, support_periods in periods.items()
+        }
+
+    def split(self, rows: List[Row]) -> Tuple[List[Row], List[Tuple[int, str]]]:
+        """
+        Sépare les lignes à insérer de celles qui chevauchent le planning ou une
+        ligne précédente du même envoi, sans modifier le planning.
+
+        Returns:
+            tuple: Les lignes à insérer, et les conflits en couples
+                   (numéro de ligne, message).
+        """
+        accepted: List[Row] = []
+        conflicts: List[Tuple[int, str]] = []
+        pending: Dict[int, _Planning] = {}
+        for line_number, values in rows:
+            support = values["collaborateur_id"]
+            if support not in self.plannings:
+                accepted.append((line_number, values))
+                continue
+            debut, fin = values["date_debut"], values["date_fin"]
+            planning = pending.setdefault(support, _Planning([]))
+            conflict = self.plannings[support].conflict(
+                debut, fin
+            ) or planning.conflict(debut, fin)
+            if conflict is not None:
+                conflict_debut, conflict_fin, label = conflict
+                conflicts.append(
+                    (
+                        line_number,
+                        f"le support {support} est déjà affecté à {label} "
+                        f"du {conflict_debut} au {conflict_fin}",
+                    )
+                )
+                continue
+            planning.add(debut, fin, f"la ligne {line_number}")
+            accepted.append((line_number, values))
+        return accepted, conflicts
+
+    def record(self, rows: List[Row]) -> None:
+        """
+        Ajoute au planning les lignes qui viennent d'être insérées.
+        """
+        for line_number, values in rows:
+            planning = self.plannings.get(values["collaborateur_id"])
+            if planning is not None:
+                planning.add(
+                    values["date_debut"], values["date_fin"], f"la ligne {line_number}"
+                )
+
+
+def _import_in_chunks(
+    table: Any,
+    rows: Iterable[Row],
+    resolve: Callable[[Any, List[Row]], Tuple[Callable, Optional[_Schedule]]],
+    report: ImportReport,
+    chunk_size: int,
+) -> ImportReport:
+    """
+    Insère des lignes validées lot par lot, en résolvant les références de chaque
+    lot juste avant son insertion : seul le lot courant est gardé en mémoire.
+
+    Args:
+        table (Table): La table cible.
+        rows (iterable): Les couples (numéro de ligne, valeurs) à insérer.
+        resolve (callable): Fonction recevant une session et un lot, et renvoyant
+                            la fonction de vérification des lignes de ce lot et,
+                            s'il y a lieu, le planning des supports du lot.
+        report (ImportReport): Le bilan à compléter.
+        chunk_size (int): Le nombre de lignes par lot.
+
+    Returns:
+        ImportReport: Le bilan complété.
+    """
+    for chunk in _batches(rows, chunk_size):
+        with session_scope() as session:
+            check, schedule = resolve(session, chunk)
+        insert_in_chunks(table, chunk, check, report, chunk_size, schedule)
+    return report
+
+
+def import_clients(
+    path: str, collaborateur_id: int, chunk_size: int = IMPORT_CHUNK_SIZE
+) -> ImportReport:
+    """
+    Importe en masse les clients d'un commercial depuis un fichier CSV ou JSONL.
+
+    Le rôle du commercial est vérifié une seule fois, puis le fichier est lu en
+    flux et inséré par lots.
+
+    Args:
+        path (str): Le chemin du fichier à importer.
+        collaborateur_id (int): L'identifiant du commercial propriétaire des clients.
+        chunk_size (int): Le nombre de clients insérés par transaction.
+
+    Returns:
+        ImportReport: Le nombre de clients insérés et les erreurs par ligne.
+    """
+    with session_scope() as session:
+        collaborateur = (
+            session.query(Collaborateur).filter_by(id=collaborateur_id).first()
+        )
+    if not collaborateur:
+        raise ValueError("Collaborateur not found.")
+    if collaborateur.role != "commercial":
+        raise ValueError(
+            "Seuls les collaborateurs avec le rôle 'commercial' sont autorisés à créer un client."
+        )
+
+    now = datetime.datetime.now()
+    try:
+        return insert_in_chunks(
+            Client.__table__,
+            read_records(path),
+            lambda record: validate_client_record(record, collaborateur_id, now),
+            ImportReport(),
+            chunk_size,
+        )
+    finally:
+        # Les lots sont insérés sans passer par create_client.
+        invalidate_client_index()
+        _refresh_rollups_after_import(Client, {Collaborateur: [collaborateur_id]})
+
+
+def import_contracts(
+    path: str, chunk_size: int = IMPORT_CHUNK_SIZE, workers: Optional[int] = None
+) -> ImportReport:
+    """
+    Importe en masse des contrats depuis un fichier CSV ou JSONL.
+
+    Le fichier est lu en flux ; les clients et collaborateurs référencés par
+    chaque lot sont résolus en quelques requêtes avant son insertion, au lieu de
+    deux requêtes par contrat. Un contrat sans collaborateur_id est rattaché au
+    commercial de son client.
+
+    Args:
+        path (str): Le chemin du fichier à importer.
+        chunk_size (int): Le nombre de contrats insérés par transaction.
+        workers (int, optional): Le nombre de processus de validation.
+
+    Returns:
+        ImportReport: Le nombre de contrats insérés et les erreurs par ligne.
+    """
+    report = ImportReport()
+    touched: Dict[Any, Set[int]] = defaultdict(set)
+
+    def resolve(session: Any, chunk: List[Row]) -> Tuple[Callable, None]:
+        commercial_of_client = dict(
+            _existing(
+                session,
+                (Client.id, Client.collaborateur_id),
+                {values["client_id"] for _, values in chunk},
+            )
+        )
+        collaborateurs = {
+            collaborateur_id
+            for (collaborateur_id,) in _existing(
+                session,
+                (Collaborateur.id,),
+                {values["collaborateur_id"] for _, values in chunk},
+            )
+        }
+
+        def check_references(values: Dict[str, Any]) -> Dict[str, Any]:
+            if values["client_id"] not in commercial_of_client:
+                raise ValueError(f"client {values['client_id']} introuvable")
+            if values["collaborateur_id"] is None:
+                values["collaborateur_id"] = commercial_of_client[values["client_id"]]
+            elif values["collaborateur_id"] not in collaborateurs:
+                raise ValueError(
+                    f"collaborateur {values['collaborateur_id']} introuvable"
+                )
+            touched[Client].add(values["client_id"])
+            touched[Collaborateur].add(values["collaborateur_id"])
+            return values
+
+        return check_references, None
+
+    rows = parse_records(path, validate_contract_record, report, workers, chunk_size)
+    try:
+        return _import_in_chunks(Contract.__table__, rows, resolve, report, chunk_size)
+    finally:
+        _refresh_rollups_after_import(Contract, touched)
+
+
+def import_events(
+    path: str, chunk_size: int = IMPORT_CHUNK_SIZE, workers: Optional[int] = None
+) -> ImportReport:
+    """
+    Importe en masse des événements depuis un fichier CSV ou JSONL.
+
+    Le fichier est lu en flux ; les contrats, noms de clients et collaborateurs
+    référencés par chaque lot sont résolus en quelques requêtes avant son
+    insertion. Le nom du client doit correspondre au client du contrat.
+
+    Comme pour create_event, un support ne peut être affecté à deux événements
+    qui se chevauchent : le planning des supports d'un lot est lu en une requête,
+    et une ligne en conflit avec un événement existant ou une ligne déjà insérée
+    du fichier est rejetée.
+
+    Args:
+        path (str): Le chemin du fichier à importer.
+        chunk_size (int): Le nombre d'événements insérés par transaction.
+        workers (int, optional): Le nombre de processus de validation.
+
+    Returns:
+        ImportReport: Le nombre d'événements insérés et les erreurs par ligne.
+    """
+    report = ImportReport()
+    touched: Dict[Any, Set[int]] = defaultdict(set)
+
+    def resolve(session: Any, chunk: List[Row]) -> Tuple[Callable, _Schedule]:
+        client_of_contract = dict(
+            _existing(
+                session,
+                (Contract.id, Contract.client_id),
+                {values["contract_id"] for _, values in chunk},
+            )
+        )
+        clients_by_name: Dict[str, Set[int]] = {}
+        for nom_complet, client_id in _existing(
+            session,
+            (Client.nom_complet, Client.id),
+            {values["client_name"] for _, values in chunk},
+        ):
+            clients_by_name.setdefault(nom_complet, set()).add(client_id)
+        roles = dict(
+            _existing(
+                session,
+                (Collaborateur.id, Collaborateur.role),
+                {values["collaborateur_id"] for _, values in chunk},
+            )
+        )
+        supports = {
+            collaborateur_id
+            for collaborateur_id, role in roles.items()
+            if role == "support"
+        }
+
+        def check_references(values: Dict[str, Any]) -> Dict[str, Any]:
+            if values["contract_id"] not in client_of_contract:
+                raise ValueError(f"contrat {values['contract_id']} introuvable")
+            if values["client_name"] not in clients_by_name:
+                raise ValueError(f"client '{values['client_name']}' introuvable")
+            if (
+                client_of_contract[values["contract_id"]]
+                not in clients_by_name[values["client_name"]]
+            ):
+                raise ValueError(
+                    f"le contrat {values['contract_id']} n'appartient pas au client "
+                    f"'{values['client_name']}'"
+                )
+            if (
+                values["collaborateur_id"] is not None
+                and values["collaborateur_id"] not in roles
+            ):
+                raise ValueError(
+                    f"collaborateur {values['collaborateur_id']} introuvable"
+                )
+            values["client_id"] = client_of_contract[values["contract_id"]]
+            touched[Collaborateur].add(values["collaborateur_id"])
+            return values
+
+        # Seules les lignes qui passent la vérification sont confrontées au
+        # planning, juste avant leur insertion.
+        return check_references, _Schedule(session, chunk, supports)
+
+    rows = parse_records(path, validate_event_record, report, workers, chunk_size)
+    try:
+        return _import_in_chunks(Events.__table__, rows, resolve, report, chunk_size)
+    finally:
+        # Les lots sont insérés sans passer par create_event.
+        invalidate_upcoming_events()
+        _refresh_rollups_after_import(Events, touched)
+
+
+# La validation est appelée pour chaque ligne, dans les processus de validation.
+instrument_module(
+    globals(),
+    exclude=(
+        "validate_client_record",
+        "validate_contract_record",
+        "validate_event_record",
+    ),
+)
@@ -0,0 +1,221 @@
+import datetime
+from typing import Any, List, Optional, Sequence
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session as DbSession
+from database.db_config import session_scope
+from database.tracing import instrument_module
+from models.client import Client
+from models.collaborateur import Collaborateur
+from models.contract import Contract
+
+# Nombre de clients affichés dans le classement par chiffre d'affaires.
+TOP_CLIENTS = 20
+
+
+class RevenueLine:
+    """
+    Une ligne agrégée du rapport de chiffre d'affaires.
+
+    Attributes:
+        key: La valeur regroupée (identifiant, statut), ou None pour le total.
+        label (str): Le libellé affiché.
+        contracts (int): Le nombre de contrats.
+        montant_total (int): La somme des montants des contrats.
+        montant_restant (int): La somme des montants restant à payer.
+        unpaid_contracts (int): Le nombre de contrats non soldés.
+    """
+
+    def __init__(
+        self,
+        key: Any,
+        label: str,
+        contracts: int,
+        montant_total: int,
+        montant_restant: int,
+        unpaid_contracts: int,
+    ) -> None:
+        self.key = key
+        self.label = label
+        self.contracts = contracts
+        self.montant_total = montant_total
+        self.montant_restant = montant_restant
+        self.unpaid_contracts = unpaid_contracts
+
+    @property
+    def montant_encaisse(self) -> int:
+        return self.montant_total - self.montant_restant
+
+    def __repr__(self) -> str:
+        return (
+            f"RevenueLine(label={self.label!r}, contracts={self.contracts!r}, "
+            f"montant_total={self.montant_total!r}, "
+            f"montant_restant={self.montant_restant!r})"
+        )
+
+
+def _aggregates() -> List[Any]:
+    return [
+        func.count(Contract.id),
+        func.coalesce(func.sum(Contract.montant_total), 0),
+        func.coalesce(func.sum(Contract.montant_restant_a_payer), 0),
+        func.coalesce(
+            func.sum(case((Contract.montant_restant_a_payer > 0, 1), else_=0)), 0
+        ),
+    ]
+
+
+def _revenue(
+    session: DbSession,
+    group_by: Sequence[Any],
+    since: Optional[datetime.date],
+    until: Optional[datetime.date],
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+    outer_join_commercial: bool = False,
+) -> List[Any]:
+    """
+    Exécute une agrégation des contrats, regroupée sur les colonnes données.
+
+    Les contrats sont joints à leur client, dont la date de création délimite
+    la période ; seule une ligne par groupe est renvoyée par la base.
+    """
+    statement = select(*group_by, *_aggregates()).join(
+        Client, Contract.client_id == Client.id
+    )
+    if outer_join_commercial:
+        statement = statement.outerjoin(
+            Collaborateur, Client.collaborateur_id == Collaborateur.id
+        )
+    if since is not None:
+        statement = statement.where(
+            Client.date_de_creation
+            >= datetime.datetime.combine(since, datetime.time.min)
+        )
+    if until is not None:
+        # Borne incluse : tout le jour `until` fait partie de la période.
+        statement = statement.where(
+            Client.date_de_creation
+            < datetime.datetime.combine(
+                until + datetime.timedelta(days=1), datetime.time.min
+            )
+        )
+    if group_by:
+        statement = statement.group_by(*group_by)
+    statement = statement.order_by(*order_by).limit(limit)
+    return session.execute(statement).all()
+
+
+def revenue_totals(
+    since: Optional[datetime.date] = None,
+    until: Optional[datetime.date] = None,
+    session: Optional[DbSession] = None,
+) -> RevenueLine:
+    """
+    Calcule le chiffre d'affaires et l'encours de tous les contrats.
+
+    Args:
+        since (date, optional): Première date de création des clients retenus.
+        until (date, optional): Dernière date de création des clients retenus.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        RevenueLine: Les totaux de la période.
+    """
+    with session_scope(session) as session:
+        (row,) = _revenue(session, [], since, until)
+    return RevenueLine(None, "Total", *row)
+
+
+def revenue_by_commercial(
+    since: Optional[datetime.date] = None,
+    until: Optional[datetime.date] = None,
+    session: Optional[DbSession] = None,
+) -> List[RevenueLine]:
+    """
+    Calcule le chiffre d'affaires et l'encours par commercial en charge du client.
+
+    Args:
+        since (date, optional): Première date de création des clients retenus.
+        until (date, optional): Dernière date de création des clients retenus.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Une ligne par commercial, par chiffre d'affaires décroissant.
+    """
+    with session_scope(session) as session:
+        rows = _revenue(
+            session,
+            [Client.collaborateur_id, Collaborateur.nom_utilisateur],
+            since,
+            until,
+            order_by=[func.sum(Contract.montant_total).desc()],
+            outer_join_commercial=True,
+        )
+    return [
+        RevenueLine(collaborateur_id, nom_utilisateur or "Inconnu", *aggregates)
+        for collaborateur_id, nom_utilisateur, *aggregates in rows
+    ]
+
+
+def revenue_by_client(
+    since: Optional[datetime.date] = None,
+    until: Optional[datetime.date] = None,
+    limit: Optional[int] = TOP_CLIENTS,
+    session: Optional[DbSession] = None,
+) -> List[RevenueLine]:
+    """
+    Calcule le chiffre d'affaires et l'encours par client.
+
+    Args:
+        since (date, optional): Première date de création des clients retenus.
+        until (date, optional): Dernière date de création des clients retenus.
+        limit (int, optional): Le nombre de clients renvoyés, les plus gros
+                               d'abord. None pour tous les clients.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Une ligne par client, par chiffre d'affaires décroissant.
+    """
+    with session_scope(session) as session:
+        rows = _revenue(
+            session,
+            [Client.id, Client.nom_complet],
+            since,
+            until,
+            order_by=[func.sum(Contract.montant_total).desc(), Client.id],
+            limit=limit,
+        )
+    return [
+        RevenueLine(client_id, nom_complet, *aggregates)
+        for client_id, nom_complet, *aggregates in rows
+    ]
+
+
+def revenue_by_statut(
+    since: Optional[datetime.date] = None,
+    until: Optional[datetime.date] = None,
+    session: Optional[DbSession] = None,
+) -> List[RevenueLine]:
+    """
+    Calcule le chiffre d'affaires et l'encours par statut de contrat.
+
+    Args:
+        since (date, optional): Première date de création des clients retenus.
+        until (date, optional): Dernière date de création des clients retenus.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Une ligne par statut, par ordre alphabétique.
+    """
+    with session_scope(session) as session:
+        rows = _revenue(
+            session,
+            [Contract.statut_contrat],
+            since,
+            until,
+            order_by=[Contract.statut_contrat],
+        )
+    return [RevenueLine(statut, statut, *aggregates) for statut, *aggregates in rows]
+
+
+instrument_module(globals())
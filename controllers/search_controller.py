@@ -0,0 +1,64 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session as DbSession, joinedload
+from database.db_config import session_scope
+from database.fulltext import CLIENT_SEARCH, EVENTS_SEARCH, SEARCH_LIMIT, ranked_search
+from database.tracing import instrument_module
+from models.client import Client
+from models.event import Events
+
+
+def search_clients(
+    query: str, limit: int = SEARCH_LIMIT, session: Optional[DbSession] = None
+) -> List[Tuple[Client, float]]:
+    """
+    Recherche des clients par nom complet, email ou nom d'entreprise.
+
+    Chaque mot saisi doit apparaître (au début d'un mot, ou en entier pour un
+    mot de moins de trois caractères ou un nombre) dans l'un de ces champs,
+    sans tenir compte des accents ni de la casse.
+
+    Args:
+        query (str): Les mots recherchés.
+        limit (int): Le nombre maximum de résultats.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Les couples (client, score), du plus pertinent au moins pertinent.
+    """
+    with session_scope(session) as session:
+        return ranked_search(
+            Client,
+            CLIENT_SEARCH,
+            query,
+            session,
+            limit,
+            options=[joinedload(Client.collaborateur)],
+        )
+
+
+def search_events(
+    query: str, limit: int = SEARCH_LIMIT, session: Optional[DbSession] = None
+) -> List[Tuple[Events, float]]:
+    """
+    Recherche des événements par leurs notes ou leur lieu.
+
+    Args:
+        query (str): Les mots recherchés.
+        limit (int): Le nombre maximum de résultats.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        list: Les couples (événement, score), du plus pertinent au moins pertinent.
+    """
+    with session_scope(session) as session:
+        return ranked_search(
+            Events,
+            EVENTS_SEARCH,
+            query,
+            session,
+            limit,
+            options=[joinedload(Events.client)],
+        )
+
+
+instrument_module(globals())
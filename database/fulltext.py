@@ -0,0 +1,194 @@
+import re
+from typing import Any, List, Sequence, Tuple
+from sqlalchemy import column, func, inspect, literal_column, select, table, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session as DbSession
+
+SEARCH_LIMIT = 20
+# Longueur minimale d'un mot recherché comme préfixe. Un préfixe court ou un
+# nombre (« 3 » dans « Salle 3 ») désigne une grande partie du vocabulaire
+# (3, 30, 300...) : tous ces mots seraient parcourus, et leurs lignes classées.
+MIN_PREFIX_LENGTH = 3
+
+
+class FulltextIndex:
+    """
+    Un index plein texte sur quelques colonnes d'une table.
+
+    Sous SQLite, il s'agit d'une table virtuelle FTS5 à contenu externe, tenue à
+    jour par des triggers ; sous MySQL, d'un index FULLTEXT tenu à jour par InnoDB.
+
+    Attributes:
+        name (str): Le nom de la table FTS5 ou de l'index FULLTEXT.
+        table (str): La table indexée.
+        columns (tuple): Les colonnes indexées.
+        weights (tuple): Le poids de chaque colonne dans le score (SQLite).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table: str,
+        columns: Sequence[str],
+        weights: Sequence[float],
+    ) -> None:
+        self.name = name
+        self.table = table
+        self.columns = tuple(columns)
+        self.weights = tuple(weights)
+
+    def __repr__(self) -> str:
+        return f"FulltextIndex(name={self.name!r}, table={self.table!r})"
+
+    def _sqlite_ddl(self) -> List[str]:
+        columns = ", ".join(self.columns)
+        new = ", ".join(f"new.{name}" for name in self.columns)
+        old = ", ".join(f"old.{name}" for name in self.columns)
+        delete_old = (
+            f"INSERT INTO {self.name} ({self.name}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old});"
+        )
+        insert_new = (
+            f"INSERT INTO {self.name} (rowid, {columns}) VALUES (new.id, {new});"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5("
+            f"{columns}, content='{self.table}', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ai AFTER INSERT ON {self.table} "
+            f"BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ad AFTER DELETE ON {self.table} "
+            f"BEGIN {delete_old} END",
+            # Seule la modification d'une colonne indexée déclenche une réindexation.
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_au "
+            f"AFTER UPDATE OF {columns} ON {self.table} "
+            f"BEGIN {delete_old} {insert_new} END",
+            f"INSERT INTO {self.name} ({self.name}) VALUES ('rebuild')",
+        ]
+
+    def install(self, connection: Connection) -> None:
+        """
+        Crée l'index s'il n'existe pas et l'alimente avec les lignes existantes.
+
+        Args:
+            connection (Connection): La connexion de la migration.
+        """
+        if connection.dialect.name == "sqlite":
+            for statement in self._sqlite_ddl():
+                connection.execute(text(statement))
+        elif connection.dialect.name == "mysql":
+            existing = inspect(connection).get_indexes(self.table)
+            if not any(index["name"] == self.name for index in existing):
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {self.table} ADD FULLTEXT INDEX {self.name} "
+                        f"({', '.join(self.columns)})"
+                    )
+                )
+        else:
+            raise NotImplementedError(
+                f"Recherche plein texte non disponible pour {connection.dialect.name}"
+            )
+
+
+CLIENT_SEARCH = FulltextIndex(
+    "client_fts", "client", ("nom_complet", "email", "nom_entreprise"), (10, 3, 5)
+)
+EVENTS_SEARCH = FulltextIndex("events_fts", "events", ("notes", "lieu"), (1, 3))
+FULLTEXT_INDEXES = (CLIENT_SEARCH, EVENTS_SEARCH)
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Découpe une saisie libre en mots, sans la syntaxe propre au moteur.
+
+    Args:
+        query (str): La saisie de l'utilisateur.
+
+    Returns:
+        list: Les mots à rechercher.
+    """
+    return re.findall(r"\w+", query)
+
+
+def _is_prefix(term: str) -> bool:
+    return len(term) >= MIN_PREFIX_LENGTH and not term.isdigit()
+
+
+def _match_expression(
+    dialect: str, model: Any, index: FulltextIndex, terms: List[str]
+) -> Any:
+    # Chaque mot est obligatoire et recherché comme préfixe, sauf les mots
+    # courts et les nombres, recherchés en entier.
+    if dialect == "sqlite":
+        fts_query = " ".join(
+            f'"{term}"*' if _is_prefix(term) else f'"{term}"' for term in terms
+        )
+        return literal_column(index.name).op("MATCH")(fts_query)
+    boolean_query = " ".join(
+        f"+{term}*" if _is_prefix(term) else f"+{term}" for term in terms
+    )
+    return match(
+        *[model.__table__.c[name] for name in index.columns], against=boolean_query
+    )
+
+
+def ranked_search(
+    model: Any,
+    index: FulltextIndex,
+    query: str,
+    session: DbSession,
+    limit: int = SEARCH_LIMIT,
+    options: Sequence[Any] = (),
+) -> List[Tuple[Any, float]]:
+    """
+    Recherche les lignes d'un modèle correspondant à une saisie libre, classées
+    par pertinence, en une requête.
+
+    Args:
+        model (Base): La classe du modèle indexé.
+        index (FulltextIndex): L'index plein texte de sa table.
+        query (str): La saisie de l'utilisateur.
+        session (Session): La session à utiliser.
+        limit (int): Le nombre maximum de résultats.
+        options (list): Options de chargement à appliquer (joinedload...).
+
+    Returns:
+        list: Les couples (objet, score), du plus pertinent au moins pertinent.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    dialect = session.get_bind().dialect.name
+    condition = _match_expression(dialect, model, index, terms)
+    if dialect == "sqlite":
+        # Le classement se fait dans la seule table FTS5, et seules les `limit`
+        # meilleures lignes sont ensuite jointes à la table du modèle.
+        fts = table(index.name, column("rowid"))
+        # bm25 renvoie un score négatif : plus il est bas, plus la ligne est pertinente.
+        score = (-func.bm25(literal_column(index.name), *index.weights)).label("score")
+        ranked = (
+            select(fts.c.rowid.label("id"), score)
+            .select_from(fts)
+            .where(condition)
+            # Tri sur l'alias : bm25 n'est calculé qu'une fois par ligne.
+            .order_by(score.desc())
+            .limit(limit)
+            .subquery()
+        )
+        statement = (
+            select(model, ranked.c.score)
+            .join(ranked, ranked.c.id == model.id)
+            .order_by(ranked.c.score.desc())
+        )
+    else:
+        score = condition.in_boolean_mode()
+        statement = (
+            select(model, score.label("score"))
+            .where(score > 0)
+            .order_by(score.desc())
+            .limit(limit)
+        )
+    statement = statement.options(*options)
+    return [(row[0], float(row[1])) for row in session.execute(statement).all()]
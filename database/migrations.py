@@ -0,0 +1,443 @@
+import datetime
+from typing import Callable, List, Optional, Sequence
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+from database import db_config
+from database.fulltext import FULLTEXT_INDEXES
+from database.rollups import ROLLUPS, reconcile_rollups
+from models.base import Base
+
+# Chargement de tous les modèles pour que Base.metadata soit complet.
+from models import (  # noqa: F401
+    client,
+    collaborateur,
+    collaborateur_session,
+    contract,
+    event,
+)
+
+# Nombre de lignes mises à jour par transaction lors des reprises de données.
+BACKFILL_BATCH_SIZE = 5000
+
+schema_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    schema_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(256), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migration:
+    """
+    Une étape de l'évolution du schéma.
+
+    Les migrations sont idempotentes : une base neuve est créée directement au
+    dernier schéma des modèles par la migration initiale, et les suivantes ne
+    font alors plus rien. Sous MySQL, les ordres DDL valident implicitement la
+    transaction ; l'idempotence permet de relancer une migration interrompue.
+
+    Attributes:
+        version (int): Le numéro de version atteint après la migration.
+        name (str): La description de la migration.
+        upgrade (callable): La fonction appliquant la migration sur une connexion.
+    """
+
+    def __init__(
+        self, version: int, name: str, upgrade: Callable[[Connection], None]
+    ) -> None:
+        self.version = version
+        self.name = name
+        self.upgrade = upgrade
+
+    def __repr__(self) -> str:
+        return f"Migration(version={self.version!r}, name={self.name!r})"
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, name: str) -> Callable:
+    """
+    Enregistre une fonction comme migration vers la version donnée.
+
+    Args:
+        version (int): Le numéro de version, strictement croissant.
+        name (str): La description de la migration.
+    """
+
+    def register(upgrade: Callable[[Connection], None]) -> Callable:
+        if MIGRATIONS and version <= MIGRATIONS[-1].version:
+            raise ValueError(f"Version de migration non croissante : {version}")
+        MIGRATIONS.append(Migration(version, name, upgrade))
+        return upgrade
+
+    return register
+
+
+def create_index(
+    connection: Connection, table: str, name: str, columns: Sequence[str]
+) -> bool:
+    """
+    Crée un index s'il n'existe pas déjà un index sur les mêmes colonnes.
+
+    MySQL crée automatiquement un index pour chaque clé étrangère : il n'est pas
+    doublé.
+
+    Args:
+        connection (Connection): La connexion de la migration.
+        table (str): Le nom de la table.
+        name (str): Le nom de l'index.
+        columns (list): Les colonnes de l'index, dans l'ordre.
+
+    Returns:
+        bool: True si l'index a été créé.
+    """
+    for existing in inspect(connection).get_indexes(table):
+        if existing["name"] == name or existing["column_names"] == list(columns):
+            return False
+    # Ordre DDL écrit directement : un objet Index s'attacherait à la table des
+    # modèles et serait recréé par tout create_all ultérieur.
+    connection.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+    return True
+
+
+def drop_index(connection: Connection, table: str, columns: Sequence[str]) -> None:
+    """
+    Supprime les index portant exactement sur les colonnes données.
+
+    Args:
+        connection (Connection): La connexion de la migration.
+        table (str): Le nom de la table.
+        columns (list): Les colonnes de l'index, dans l'ordre.
+    """
+    for existing in inspect(connection).get_indexes(table):
+        if existing["column_names"] == list(columns):
+            table_clause = f" ON {table}" if connection.dialect.name == "mysql" else ""
+            connection.execute(text(f"DROP INDEX {existing['name']}{table_clause}"))
+
+
+def has_column(connection: Connection, table: str, column: str) -> bool:
+    """
+    Indique si une colonne existe dans une table.
+    """
+    return any(
+        existing["name"] == column
+        for existing in inspect(connection).get_columns(table)
+    )
+
+
+def foreign_keys(connection: Connection, table: str, column: str) -> List[str]:
+    """
+    Renvoie le nom des clés étrangères portant sur une colonne.
+    """
+    return [
+        foreign_key["name"]
+        for foreign_key in inspect(connection).get_foreign_keys(table)
+        if foreign_key["constrained_columns"] == [column]
+    ]
+
+
+@migration(1, "Schéma initial")
+def _initial_schema(connection: Connection) -> None:
+    Base.metadata.create_all(connection, checkfirst=True)
+
+
+@migration(2, "Index des colonnes filtrées et triées")
+def _hot_column_indexes(connection: Connection) -> None:
+    create_index(connection, "client", "idx_client_name", ["nom_complet"])
+    create_index(
+        connection,
+        "client",
+        "ix_client_collaborateur_nom",
+        ["collaborateur_id", "nom_complet"],
+    )
+    create_index(connection, "contract", "ix_contract_client_id", ["client_id"])
+    create_index(
+        connection, "contract", "ix_contract_collaborateur_id", ["collaborateur_id"]
+    )
+    create_index(connection, "contract", "ix_contract_montant_total", ["montant_total"])
+    create_index(
+        connection,
+        "contract",
+        "ix_contract_statut_montant",
+        ["statut_contrat", "montant_total"],
+    )
+    create_index(
+        connection,
+        "events",
+        "ix_events_collaborateur_date",
+        ["collaborateur_id", "date_debut"],
+    )
+    create_index(connection, "events", "ix_events_date_debut", ["date_debut"])
+    create_index(
+        connection,
+        "collaborateurs",
+        "ix_collaborateurs_role_nom",
+        ["role", "nom_utilisateur"],
+    )
+
+
+def backfill_event_client_ids(
+    connection: Connection, batch_size: int = BACKFILL_BATCH_SIZE
+) -> int:
+    """
+    Renseigne events.client_id par tranches d'identifiants, une transaction par
+    tranche, pour ne pas verrouiller toute la table.
+
+    Le client est celui du contrat de l'événement ; à défaut, celui dont le nom
+    correspond à client_name.
+
+    Args:
+        connection (Connection): La connexion de la migration.
+        batch_size (int): Le nombre d'identifiants par tranche.
+
+    Returns:
+        int: Le nombre d'événements mis à jour.
+    """
+    events = Base.metadata.tables["events"]
+    contracts = Base.metadata.tables["contract"]
+    clients = Base.metadata.tables["client"]
+    client_of_contract = (
+        select(contracts.c.client_id)
+        .where(contracts.c.id == events.c.contract_id)
+        .scalar_subquery()
+    )
+    client_of_name = (
+        select(func.min(clients.c.id))
+        .where(clients.c.nom_complet == events.c.client_name)
+        .scalar_subquery()
+    )
+    low, high = connection.execute(
+        select(func.min(events.c.id), func.max(events.c.id)).where(
+            events.c.client_id.is_(None)
+        )
+    ).one()
+    connection.commit()
+    updated = 0
+    if low is None:
+        return updated
+    for start in range(low, high + 1, batch_size):
+        result = connection.execute(
+            update(events)
+            .where(
+                events.c.client_id.is_(None),
+                events.c.id >= start,
+                events.c.id < start + batch_size,
+            )
+            .values(client_id=func.coalesce(client_of_contract, client_of_name))
+        )
+        connection.commit()
+        updated += result.rowcount
+    return updated
+
+
+@migration(3, "Clés étrangères entières client_id et contract_id sur events")
+def _events_integer_foreign_keys(connection: Connection) -> None:
+    mysql = connection.dialect.name == "mysql"
+    if not has_column(connection, "events", "client_id"):
+        # MySQL ignore une clause REFERENCES dans ADD COLUMN : la contrainte est
+        # ajoutée après la reprise des données.
+        reference = "" if mysql else " REFERENCES client (id)"
+        connection.execute(
+            text(f"ALTER TABLE events ADD COLUMN client_id INTEGER NULL{reference}")
+        )
+    create_index(connection, "events", "ix_events_client_id", ["client_id"])
+    create_index(connection, "events", "ix_events_contract_id", ["contract_id"])
+    connection.commit()
+
+    backfill_event_client_ids(connection)
+
+    if mysql:
+        if not foreign_keys(connection, "events", "client_id"):
+            connection.execute(
+                text(
+                    "ALTER TABLE events ADD CONSTRAINT fk_events_client_id "
+                    "FOREIGN KEY (client_id) REFERENCES client (id)"
+                )
+            )
+        if not foreign_keys(connection, "events", "contract_id"):
+            orphans = connection.execute(
+                text(
+                    "SELECT COUNT(*) FROM events LEFT JOIN contract "
+                    "ON contract.id = events.contract_id WHERE contract.id IS NULL"
+                )
+            ).scalar()
+            if orphans:
+                raise RuntimeError(
+                    f"{orphans} événement(s) référencent un contrat inexistant : "
+                    "corrigez-les puis relancez la migration."
+                )
+            connection.execute(
+                text(
+                    "ALTER TABLE events ADD CONSTRAINT fk_events_contract_id "
+                    "FOREIGN KEY (contract_id) REFERENCES contract (id)"
+                )
+            )
+        for name in foreign_keys(connection, "events", "client_name"):
+            connection.execute(text(f"ALTER TABLE events DROP FOREIGN KEY {name}"))
+    # SQLite ne sait pas ajouter ni retirer une contrainte sans reconstruire la
+    # table ; elles n'y sont de toute façon pas vérifiées par défaut. Une base
+    # créée depuis les modèles a directement les bonnes clés étrangères.
+    # Index créé par MySQL pour l'ancienne clé étrangère sur client_name.
+    drop_index(connection, "events", ["client_name"])
+
+
+@migration(4, "Index plein texte des clients et des événements")
+def _fulltext_indexes(connection: Connection) -> None:
+    # FTS5 sous SQLite (tenu à jour par triggers), FULLTEXT sous MySQL.
+    for index in FULLTEXT_INDEXES:
+        index.install(connection)
+
+
+@migration(5, "Index de la date de création des clients (rapports par période)")
+def _client_creation_date_index(connection: Connection) -> None:
+    create_index(
+        connection, "client", "ix_client_date_de_creation", ["date_de_creation"]
+    )
+
+
+@migration(6, "Agrégats dénormalisés des clients et des collaborateurs")
+def _rollup_columns(connection: Connection) -> None:
+    for rollup in ROLLUPS:
+        table = rollup.target.__tablename__
+        if not has_column(connection, table, rollup.column):
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table} ADD COLUMN {rollup.column} "
+                    "INTEGER NOT NULL DEFAULT 0"
+                )
+            )
+    connection.commit()
+    reconcile_rollups(connection)
+
+
+@migration(7, "Index des périodes d'événements (conflits de planning)")
+def _event_interval_indexes(connection: Connection) -> None:
+    create_index(
+        connection,
+        "events",
+        "ix_events_collaborateur_fin",
+        ["collaborateur_id", "date_fin", "date_debut"],
+    )
+    create_index(connection, "events", "ix_events_date_fin", ["date_fin", "date_debut"])
+
+
+@migration(8, "Colonnes élargies pour les hachages scrypt des mots de passe")
+def _password_hash_columns(connection: Connection) -> None:
+    # SQLite ne contrôle pas la longueur des VARCHAR : seul MySQL est concerné.
+    if connection.dialect.name != "mysql":
+        return
+    lengths = {
+        column["name"]: getattr(column["type"], "length", None)
+        for column in inspect(connection).get_columns("collaborateurs")
+    }
+    for name, length in (("mot_de_passe", 255), ("salt", 64)):
+        if (lengths.get(name) or 0) < length:
+            connection.execute(
+                text(
+                    f"ALTER TABLE collaborateurs MODIFY {name} "
+                    f"VARCHAR({length}) NOT NULL"
+                )
+            )
+
+
+@migration(9, "Table des sessions de connexion des collaborateurs")
+def _collaborateur_sessions(connection: Connection) -> None:
+    collaborateur_session.CollaborateurSession.__table__.create(
+        connection, checkfirst=True
+    )
+
+
+@migration(10, "Suppression de l'index de l'indicateur de connexion abandonné")
+def _drop_is_connected_index(connection: Connection) -> None:
+    drop_index(connection, "collaborateurs", ["is_connected"])
+
+
+def current_version(connection: Connection) -> int:
+    """
+    Renvoie la version du schéma de la base.
+
+    Args:
+        connection (Connection): Une connexion à la base.
+
+    Returns:
+        int: La dernière version appliquée, ou 0 pour une base jamais migrée.
+    """
+    if not inspect(connection).has_table(schema_version.name):
+        return 0
+    version = connection.execute(
+        select(schema_version.c.version)
+        .order_by(schema_version.c.version.desc())
+        .limit(1)
+    ).scalar()
+    return version or 0
+
+
+def pending_migrations(engine: Optional[Engine] = None) -> List[Migration]:
+    """
+    Liste les migrations qui restent à appliquer.
+
+    Args:
+        engine (Engine, optional): Le moteur à utiliser. Par défaut, celui de
+                                   l'application.
+
+    Returns:
+        list: Les migrations non appliquées, dans l'ordre.
+    """
+    engine = engine or db_config.engine
+    with engine.connect() as connection:
+        version = current_version(connection)
+    return [step for step in MIGRATIONS if step.version > version]
+
+
+def migrate(
+    target: Optional[int] = None, engine: Optional[Engine] = None
+) -> List[Migration]:
+    """
+    Applique les migrations en attente, chacune dans sa propre transaction.
+
+    Une migration peut valider elle-même des étapes intermédiaires avec
+    connection.commit() (reprise de données par lots) ; la version n'est
+    enregistrée qu'une fois la migration terminée.
+
+    Args:
+        target (int, optional): La version à atteindre. Par défaut, la dernière.
+        engine (Engine, optional): Le moteur à utiliser. Par défaut, celui de
+                                   l'application.
+
+    Returns:
+        list: Les migrations appliquées.
+    """
+    engine = engine or db_config.engine
+    schema_metadata.create_all(engine, checkfirst=True)
+    applied = []
+    for step in pending_migrations(engine):
+        if target is not None and step.version > target:
+            break
+        with engine.connect() as connection:
+            step.upgrade(connection)
+            connection.execute(
+                schema_version.insert().values(
+                    version=step.version,
+                    name=step.name,
+                    applied_at=datetime.datetime.now(),
+                )
+            )
+            connection.commit()
+        applied.append(step)
+    return applied
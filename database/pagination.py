@@ -0,0 +1,101 @@
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from sqlalchemy import and_, false, or_
+from sqlalchemy.orm import Query
+
+PAGE_SIZE = 20
+
+T = TypeVar("T")
+
+# Une colonne de tri et son sens : (colonne, décroissant).
+OrderKey = Tuple[Any, bool]
+Cursor = Tuple[Any, ...]
+
+
+class Page(Generic[T]):
+    """
+    Une page de résultats obtenue par pagination par curseur (keyset).
+
+    Attributes:
+        items (list): Les lignes de la page.
+        next_cursor (tuple): Les valeurs de tri de la dernière ligne, à passer
+                             en paramètre `after` pour obtenir la page suivante,
+                             ou None s'il s'agit de la dernière page.
+    """
+
+    def __init__(self, items: List[T], next_cursor: Optional[Cursor]) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def __repr__(self) -> str:
+        return f"Page(items={len(self.items)}, next_cursor={self.next_cursor!r})"
+
+
+def _after(column: Any, descending: bool, value: Any) -> Any:
+    # MySQL et SQLite placent les NULL en tête en ordre croissant et en
+    # queue en ordre décroissant.
+    if descending:
+        if value is None:
+            return false()
+        return or_(column < value, column.is_(None))
+    if value is None:
+        return column.is_not(None)
+    return column > value
+
+
+def keyset_filter(order: Sequence[OrderKey], cursor: Cursor) -> Any:
+    """
+    Construit la condition « strictement après le curseur » pour un tri donné.
+
+    Args:
+        order (list): Les colonnes de tri et leur sens, la dernière devant être unique.
+        cursor (tuple): Les valeurs de ces colonnes pour la dernière ligne lue.
+
+    Returns:
+        La condition SQLAlchemy à appliquer à la requête.
+    """
+    clauses = []
+    for index, (column, descending) in enumerate(order):
+        equalities = [
+            previous == cursor[position]
+            for position, (previous, _) in enumerate(order[:index])
+        ]
+        clauses.append(and_(*equalities, _after(column, descending, cursor[index])))
+    return or_(*clauses)
+
+
+def paginate(
+    query: Query,
+    order: Sequence[OrderKey],
+    key: Callable[[Any], Cursor],
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+) -> Page:
+    """
+    Applique une pagination par curseur à une requête.
+
+    Seules `limit` lignes sont lues, et grâce au filtre sur le curseur la base
+    n'a jamais à parcourir puis ignorer les pages précédentes (contrairement à OFFSET).
+
+    Args:
+        query (Query): La requête à paginer, sans ORDER BY.
+        order (list): Les colonnes de tri et leur sens, la dernière devant être unique.
+        key (callable): Fonction renvoyant les valeurs de tri d'une ligne de résultat.
+        after (tuple, optional): Le curseur de la page précédente. Par défaut, None.
+        limit (int): Le nombre de lignes par page.
+
+    Returns:
+        Page: La page demandée.
+    """
+    if after is not None:
+        query = query.filter(keyset_filter(order, after))
+    query = query.order_by(
+        *[column.desc() if descending else column.asc() for column, descending in order]
+    )
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = key(items[-1]) if len(rows) > limit else None
+    return Page(items, next_cursor)
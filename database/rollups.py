@@ -0,0 +1,369 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union
+from sqlalchemy import case, func, inspect, or_, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session as DbSession
+from database.updates import (
+    IN_CLAUSE_SIZE,
+    Changes,
+    bulk_update,
+    coerce_value,
+    update_by_id,
+)
+from models.client import Client
+from models.collaborateur import Collaborateur
+from models.contract import Contract
+from models.event import Events
+
+Executor = Union[DbSession, Connection]
+
+
+class Rollup:
+    """
+    Une colonne dénormalisée qui agrège les lignes d'une autre table.
+
+    Attributes:
+        target (Base): Le modèle portant la colonne (Client, Collaborateur).
+        column (str): Le nom de la colonne dénormalisée.
+        source (Base): Le modèle agrégé (Contract, Events, Client).
+        foreign_key (str): La colonne de la source qui désigne la ligne cible.
+        summed (str, optional): La colonne de la source additionnée ; à défaut,
+                                les lignes sont comptées.
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        column: str,
+        source: Any,
+        foreign_key: str,
+        summed: Optional[str] = None,
+    ) -> None:
+        self.target = target
+        self.column = column
+        self.source = source
+        self.foreign_key = foreign_key
+        self.summed = summed
+
+    def __repr__(self) -> str:
+        return f"Rollup({self.target.__tablename__}.{self.column})"
+
+    def contribution(self, values: Optional[Mapping[str, Any]]) -> int:
+        """
+        Renvoie ce qu'une ligne source apporte à la colonne.
+        """
+        if values is None:
+            return 0
+        if self.summed is None:
+            return 1
+        return values.get(self.summed) or 0
+
+    def expected(self) -> Any:
+        """
+        Renvoie la sous-requête corrélée qui recalcule la colonne.
+        """
+        foreign_key = getattr(self.source, self.foreign_key)
+        if self.summed is None:
+            value = func.count(self.source.id)
+        else:
+            value = func.coalesce(func.sum(getattr(self.source, self.summed)), 0)
+        return (
+            select(value)
+            .where(foreign_key == self.target.id)
+            .correlate(self.target)
+            .scalar_subquery()
+        )
+
+
+ROLLUPS = (
+    Rollup(Client, "nb_contrats", Contract, "client_id"),
+    Rollup(Client, "montant_total_contrats", Contract, "client_id", "montant_total"),
+    Rollup(
+        Client,
+        "montant_restant_contrats",
+        Contract,
+        "client_id",
+        "montant_restant_a_payer",
+    ),
+    Rollup(Collaborateur, "nb_clients", Client, "collaborateur_id"),
+    Rollup(Collaborateur, "nb_contrats", Contract, "collaborateur_id"),
+    Rollup(Collaborateur, "nb_evenements", Events, "collaborateur_id"),
+)
+
+
+def row_values(row: Any, source: Any) -> Dict[str, Any]:
+    """
+    Relève, sur une ligne source, les colonnes utilisées par les agrégats.
+
+    Args:
+        row (Base): La ligne source (contrat, événement, client).
+        source (Base): Son modèle.
+
+    Returns:
+        dict: Les clés étrangères et montants de la ligne.
+    """
+    names = set()
+    for rollup in ROLLUPS:
+        if rollup.source is source:
+            names.add(rollup.foreign_key)
+            if rollup.summed:
+                names.add(rollup.summed)
+    return {name: getattr(row, name) for name in names}
+
+
+def track_change(
+    session: Executor,
+    source: Any,
+    old: Optional[Mapping[str, Any]],
+    new: Optional[Mapping[str, Any]],
+) -> None:
+    """
+    Répercute sur les colonnes dénormalisées la création, la modification ou la
+    suppression d'une ligne source, dans la transaction en cours.
+
+    Les écarts sont additionnés par ligne cible puis appliqués par un UPDATE
+    relatif (colonne = colonne + écart) : deux transactions concurrentes ne
+    peuvent pas s'écraser, et rien n'est écrit si aucun agrégat ne change.
+
+    Args:
+        session (Session): La session de l'unité de travail en cours.
+        source (Base): Le modèle de la ligne modifiée.
+        old (dict, optional): Ses valeurs avant l'écriture (None pour une création),
+                              telles que relevées par row_values.
+        new (dict, optional): Ses valeurs après l'écriture (None pour une
+                              suppression).
+    """
+    deltas: Dict[Any, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for rollup in ROLLUPS:
+        if rollup.source is not source:
+            continue
+        for values, sign in ((old, -1), (new, 1)):
+            target_id = values.get(rollup.foreign_key) if values else None
+            if target_id is not None:
+                delta = sign * rollup.contribution(values)
+                deltas[(rollup.target, int(target_id))][rollup.column] += delta
+    for (target, target_id), columns in deltas.items():
+        values = {
+            column: getattr(target, column) + delta
+            for column, delta in columns.items()
+            if delta
+        }
+        if values:
+            session.execute(
+                update(target).where(target.id == target_id).values(**values)
+            )
+
+
+def update_tracked(
+    model: Any, object_id: Any, new_values: Mapping[str, Any], session: DbSession
+) -> Optional[Changes]:
+    """
+    Met à jour une ligne comme update_by_id, puis répercute sur les agrégats un
+    changement de clé étrangère ou de montant.
+
+    Args:
+        model (Base): La classe du modèle.
+        object_id: L'identifiant de la ligne.
+        new_values (dict): Les valeurs saisies, par nom d'attribut.
+        session (Session): La session de l'unité de travail en cours.
+
+    Returns:
+        dict: Les colonnes modifiées (vide si rien n'a changé), ou None si la
+              ligne n'existe pas.
+    """
+    primary_key = inspect(model).primary_key[0]
+    # Déjà chargée, la ligne est relue dans la session par update_by_id.
+    current = session.get(model, coerce_value(primary_key, object_id))
+    old = row_values(current, model) if current is not None else None
+    changes = update_by_id(model, object_id, new_values, session)
+    if changes and old is not None and set(changes) & set(old):
+        track_change(session, model, old, row_values(current, model))
+    return changes
+
+
+def _target_ids(
+    session: DbSession, source: Any, ids: Sequence[Any]
+) -> Dict[Any, Set[int]]:
+    rollups = [rollup for rollup in ROLLUPS if rollup.source is source]
+    columns = sorted({rollup.foreign_key for rollup in rollups})
+    found: Dict[str, Set[int]] = defaultdict(set)
+    for start in range(0, len(ids), IN_CLAUSE_SIZE):
+        rows = session.execute(
+            select(*[getattr(source, name) for name in columns]).where(
+                source.id.in_(ids[start : start + IN_CLAUSE_SIZE])
+            )
+        )
+        for row in rows:
+            for name, value in zip(columns, row):
+                if value is not None:
+                    found[name].add(value)
+    targets: Dict[Any, Set[int]] = defaultdict(set)
+    for rollup in rollups:
+        targets[rollup.target] |= found[rollup.foreign_key]
+    return targets
+
+
+def bulk_update_tracked(
+    model: Any, changes_by_id: Mapping[Any, Mapping[str, Any]], session: DbSession
+) -> int:
+    """
+    Applique plusieurs mises à jour partielles comme bulk_update, puis recalcule
+    les agrégats des lignes cibles concernées, avant comme après.
+
+    Args:
+        model (Base): La classe du modèle.
+        changes_by_id (dict): Les valeurs saisies, par identifiant de ligne.
+        session (Session): La session de l'unité de travail en cours.
+
+    Returns:
+        int: Le nombre de lignes effectivement modifiées.
+    """
+    tracked = set()
+    for rollup in ROLLUPS:
+        if rollup.source is model:
+            tracked.update(filter(None, (rollup.foreign_key, rollup.summed)))
+    if not any(set(values) & tracked for values in changes_by_id.values()):
+        return bulk_update(model, changes_by_id, session)
+    primary_key = inspect(model).primary_key[0]
+    ids = [coerce_value(primary_key, object_id) for object_id in changes_by_id]
+    before = _target_ids(session, model, ids)
+    updated = bulk_update(model, changes_by_id, session)
+    if updated:
+        after = _target_ids(session, model, ids)
+        for target in set(before) | set(after):
+            refresh_rollups(
+                session,
+                target,
+                sorted(before.get(target, set()) | after.get(target, set())),
+                sources=[model],
+            )
+    return updated
+
+
+def _targets(sources: Optional[Iterable[Any]]) -> Dict[Any, List[Rollup]]:
+    by_target: Dict[Any, List[Rollup]] = defaultdict(list)
+    for rollup in ROLLUPS:
+        if sources is None or rollup.source in sources:
+            by_target[rollup.target].append(rollup)
+    return by_target
+
+
+def refresh_rollups(
+    session: Executor,
+    target: Any,
+    ids: Optional[Sequence[int]] = None,
+    sources: Optional[Iterable[Any]] = None,
+) -> int:
+    """
+    Recalcule les colonnes dénormalisées d'un modèle par des sous-requêtes
+    corrélées, en une requête (par tranche d'identifiants si `ids` est donné).
+
+    Seules les lignes en écart sont réécrites ; dans une session, les objets
+    déjà chargés sont rafraîchis.
+
+    Args:
+        session (Session): La session ou la connexion à utiliser.
+        target (Base): Le modèle portant les colonnes (Client, Collaborateur).
+        ids (list, optional): Restreint le recalcul à ces lignes.
+        sources (list, optional): Ne recalcule que les agrégats de ces modèles.
+
+    Returns:
+        int: Le nombre de lignes réécrites.
+    """
+    rollups = _targets(sources).get(target, [])
+    if not rollups:
+        return 0
+    if ids is not None:
+        ids = list(ids)
+        return sum(
+            _refresh(session, target, rollups, ids[start : start + IN_CLAUSE_SIZE])
+            for start in range(0, len(ids), IN_CLAUSE_SIZE)
+        )
+    return _refresh(session, target, rollups, None)
+
+
+def _refresh(
+    session: Executor,
+    target: Any,
+    rollups: List[Rollup],
+    ids: Optional[List[int]],
+) -> int:
+    statement = (
+        update(target)
+        .where(
+            or_(
+                *[
+                    getattr(target, rollup.column) != rollup.expected()
+                    for rollup in rollups
+                ]
+            )
+        )
+        .values({rollup.column: rollup.expected() for rollup in rollups})
+        .execution_options(
+            synchronize_session="fetch" if isinstance(session, DbSession) else False
+        )
+    )
+    if ids is not None:
+        statement = statement.where(target.id.in_(ids))
+    return session.execute(statement).rowcount
+
+
+def rollup_drift(
+    session: Executor, sources: Optional[Iterable[Any]] = None
+) -> Dict[str, int]:
+    """
+    Compte, pour chaque colonne dénormalisée, les lignes dont la valeur diffère
+    du recalcul, en une requête par table.
+
+    Args:
+        session (Session): La session ou la connexion à utiliser.
+        sources (list, optional): Ne contrôle que les agrégats de ces modèles.
+
+    Returns:
+        dict: Le nombre de lignes en écart, par « table.colonne ».
+    """
+    drift = {}
+    for target, rollups in _targets(sources).items():
+        counts = session.execute(
+            select(
+                *[
+                    func.coalesce(
+                        func.sum(
+                            case(
+                                (
+                                    getattr(target, rollup.column) != rollup.expected(),
+                                    1,
+                                ),
+                                else_=0,
+                            )
+                        ),
+                        0,
+                    )
+                    for rollup in rollups
+                ]
+            )
+        ).one()
+        for rollup, count in zip(rollups, counts):
+            drift[f"{target.__tablename__}.{rollup.column}"] = int(count)
+    return drift
+
+
+def reconcile_rollups(
+    session: Executor, fix: bool = True, sources: Optional[Iterable[Any]] = None
+) -> Dict[str, int]:
+    """
+    Contrôle toutes les colonnes dénormalisées et corrige les écarts.
+
+    Args:
+        session (Session): La session ou la connexion à utiliser.
+        fix (bool): Si False, les écarts sont seulement comptés.
+        sources (list, optional): Ne traite que les agrégats de ces modèles.
+
+    Returns:
+        dict: Le nombre de lignes en écart avant correction, par « table.colonne ».
+    """
+    drift = rollup_drift(session, sources)
+    if fix and any(drift.values()):
+        for target in _targets(sources):
+            refresh_rollups(session, target, sources=sources)
+    return drift
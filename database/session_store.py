@@ -0,0 +1,285 @@
+import datetime
+import hashlib
+import secrets
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Set
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session as DbSession
+from database import db_config
+from database.db_config import on_commit, session_scope
+from database.updates import IN_CLAUSE_SIZE
+from models.collaborateur import Collaborateur
+from models.collaborateur_session import CollaborateurSession
+
+# Durée de validité d'une session : une journée de travail.
+SESSION_TTL = datetime.timedelta(hours=10)
+# Durée, en secondes, pendant laquelle une session en cache est tenue pour
+# valide sans relecture : borne le retard sur une déconnexion faite par un
+# autre processus.
+CACHE_TTL = 60.0
+# Nombre de sessions expirées supprimées par transaction lors d'une purge.
+SWEEP_BATCH_SIZE = IN_CLAUSE_SIZE
+# Intervalle minimal, en secondes, entre deux purges déclenchées à la connexion.
+SWEEP_INTERVAL = 300.0
+
+
+class SessionIdentity(NamedTuple):
+    """
+    Le collaborateur auquel appartient une session.
+    """
+
+    id: int
+    nom_utilisateur: str
+    role: str
+
+
+class _Entry(NamedTuple):
+    identity: SessionIdentity
+    expires_at: datetime.datetime
+    checked_at: float
+
+
+def hash_token(token: str) -> str:
+    """
+    Renvoie l'empreinte sous laquelle un jeton de session est enregistré.
+
+    Args:
+        token (str): Le jeton remis au collaborateur.
+
+    Returns:
+        str: L'empreinte SHA-256 du jeton, en hexadécimal.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class SessionStore:
+    """
+    Sessions des collaborateurs connectés : une ligne de la table `sessions`
+    par connexion, et un cache en mémoire des sessions déjà résolues.
+
+    Le collaborateur reçoit un jeton opaque ; seule son empreinte est
+    enregistrée. Un jeton se résout par le cache, sinon par la clé primaire de
+    la table : le coût ne dépend pas du nombre de collaborateurs connectés.
+    Les sessions expirées sont ignorées à la lecture, puis supprimées par lots.
+
+    Attributes:
+        ttl (timedelta): La durée de validité d'une session.
+        cache_ttl (float): La durée, en secondes, d'une entrée du cache avant
+                           relecture en base.
+    """
+
+    def __init__(
+        self,
+        ttl: datetime.timedelta = SESSION_TTL,
+        cache_ttl: float = CACHE_TTL,
+    ) -> None:
+        self.ttl = ttl
+        self.cache_ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._by_collaborateur: Dict[int, Set[str]] = {}
+        self._last_sweep = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"SessionStore(en_cache={len(self._entries)!r}, ttl={self.ttl!r})"
+
+    def _remember(
+        self, token_hash: str, identity: SessionIdentity, expires_at: datetime.datetime
+    ) -> None:
+        with self._lock:
+            self._entries[token_hash] = _Entry(identity, expires_at, time.monotonic())
+            self._by_collaborateur.setdefault(identity.id, set()).add(token_hash)
+
+    def _forget(self, token_hash: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(token_hash, None)
+            if entry is not None:
+                hashes = self._by_collaborateur.get(entry.identity.id, set())
+                hashes.discard(token_hash)
+                if not hashes:
+                    self._by_collaborateur.pop(entry.identity.id, None)
+
+    def open(self, collaborateur: Collaborateur, session: DbSession) -> str:
+        """
+        Ouvre une session pour un collaborateur authentifié.
+
+        Args:
+            collaborateur (Collaborateur): Le collaborateur.
+            session (Session): La session de l'unité de travail en cours ; la
+                               session n'est mise en cache qu'une fois la
+                               transaction validée.
+
+        Returns:
+            str: Le jeton à présenter pour les requêtes suivantes.
+        """
+        token = secrets.token_urlsafe(32)
+        token_hash = hash_token(token)
+        now = datetime.datetime.now()
+        expires_at = now + self.ttl
+        session.add(
+            CollaborateurSession(
+                token_hash=token_hash,
+                collaborateur_id=collaborateur.id,
+                created_at=now,
+                expires_at=expires_at,
+            )
+        )
+        session.flush()
+        identity = SessionIdentity(
+            collaborateur.id, collaborateur.nom_utilisateur, collaborateur.role
+        )
+        on_commit(session, lambda: self._remember(token_hash, identity, expires_at))
+        return token
+
+    def resolve(
+        self, token: Optional[str], session: Optional[DbSession] = None
+    ) -> Optional[SessionIdentity]:
+        """
+        Renvoie le collaborateur d'une session en cours.
+
+        Args:
+            token (str): Le jeton de la session.
+            session (Session, optional): La session de l'unité de travail en cours.
+
+        Returns:
+            SessionIdentity: Le collaborateur, ou None si le jeton est inconnu,
+                             expiré ou révoqué.
+        """
+        if not token:
+            return None
+        token_hash = hash_token(token)
+        now = datetime.datetime.now()
+        entry = self._entries.get(token_hash)
+        if entry is not None:
+            if entry.expires_at <= now:
+                self._forget(token_hash)
+                return None
+            if time.monotonic() - entry.checked_at < self.cache_ttl:
+                return entry.identity
+        with session_scope(session) as session:
+            row = session.execute(
+                select(
+                    Collaborateur.id,
+                    Collaborateur.nom_utilisateur,
+                    Collaborateur.role,
+                    CollaborateurSession.expires_at,
+                )
+                .join(
+                    Collaborateur,
+                    CollaborateurSession.collaborateur_id == Collaborateur.id,
+                )
+                .where(
+                    CollaborateurSession.token_hash == token_hash,
+                    CollaborateurSession.expires_at > now,
+                )
+            ).first()
+        if row is None:
+            self._forget(token_hash)
+            return None
+        identity = SessionIdentity(row[0], row[1], row[2])
+        self._remember(token_hash, identity, row[3])
+        return identity
+
+    def close(self, token: str, session: Optional[DbSession] = None) -> None:
+        """
+        Ferme une session (déconnexion).
+
+        Args:
+            token (str): Le jeton de la session.
+            session (Session, optional): La session de l'unité de travail en cours.
+        """
+        token_hash = hash_token(token)
+        with session_scope(session) as session:
+            session.execute(
+                delete(CollaborateurSession).where(
+                    CollaborateurSession.token_hash == token_hash
+                )
+            )
+        self._forget(token_hash)
+
+    def close_collaborateur(self, collaborateur_id: int, session: DbSession) -> None:
+        """
+        Ferme toutes les sessions d'un collaborateur, dans la transaction en cours.
+
+        Args:
+            collaborateur_id (int): L'identifiant du collaborateur.
+            session (Session): La session de l'unité de travail en cours.
+        """
+        session.execute(
+            delete(CollaborateurSession).where(
+                CollaborateurSession.collaborateur_id == collaborateur_id
+            )
+        )
+        on_commit(session, lambda: self.forget_collaborateur(collaborateur_id))
+
+    def forget_collaborateur(self, collaborateur_id: Optional[int] = None) -> None:
+        """
+        Retire du cache les sessions d'un collaborateur (toutes si None) : elles
+        seront relues en base, avec son nom et son rôle à jour.
+        """
+        with self._lock:
+            if collaborateur_id is None:
+                self._entries.clear()
+                self._by_collaborateur.clear()
+                return
+            for token_hash in self._by_collaborateur.pop(collaborateur_id, set()):
+                self._entries.pop(token_hash, None)
+
+    def sweep(self, batch_size: int = SWEEP_BATCH_SIZE) -> int:
+        """
+        Supprime les sessions expirées, par lots d'au plus `batch_size` lignes,
+        chacun dans sa propre transaction.
+
+        La purge utilise sa propre session : elle peut être lancée pendant une
+        unité de travail sans s'y mêler.
+
+        Args:
+            batch_size (int): Le nombre de sessions supprimées par transaction.
+
+        Returns:
+            int: Le nombre de sessions supprimées.
+        """
+        now = datetime.datetime.now()
+        self._last_sweep = time.monotonic()
+        with self._lock:
+            expired = [
+                token_hash
+                for token_hash, entry in self._entries.items()
+                if entry.expires_at <= now
+            ]
+        for token_hash in expired:
+            self._forget(token_hash)
+        removed = 0
+        while True:
+            with db_config.Session() as session, session.begin():
+                hashes = list(
+                    session.scalars(
+                        select(CollaborateurSession.token_hash)
+                        .where(CollaborateurSession.expires_at <= now)
+                        .limit(batch_size)
+                    )
+                )
+                if hashes:
+                    session.execute(
+                        delete(CollaborateurSession).where(
+                            CollaborateurSession.token_hash.in_(hashes)
+                        )
+                    )
+            removed += len(hashes)
+            if len(hashes) < batch_size:
+                return removed
+
+    def sweep_if_due(self, interval: float = SWEEP_INTERVAL) -> int:
+        """
+        Lance une purge si la précédente date de plus de `interval` secondes.
+
+        Returns:
+            int: Le nombre de sessions supprimées.
+        """
+        if time.monotonic() - self._last_sweep < interval:
+            return 0
+        return self.sweep()
@@ -0,0 +1,43 @@
+import os
+from typing import Any, Iterator, Optional
+from sqlalchemy.orm import Session as DbSession
+from sqlalchemy.sql import Select
+from database.db_config import Session
+
+STREAM_BATCH_SIZE = int(os.getenv("DB_STREAM_BATCH_SIZE", "1000"))
+
+
+def stream_scalars(
+    statement: Select,
+    batch_size: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> Iterator[Any]:
+    """
+    Exécute une requête et renvoie ses résultats au fil de l'eau, par lots.
+
+    La requête utilise un curseur côté serveur (stream_results) lorsque le pilote
+    le permet, et l'ORM ne matérialise que `batch_size` objets à la fois : la
+    mémoire consommée ne dépend pas de la taille de la table.
+
+    Sans session fournie, une session dédiée est ouverte puis fermée à la fin de
+    l'itération, pour ne pas bloquer la session de l'unité de travail en cours.
+
+    Args:
+        statement (Select): La requête à exécuter.
+        batch_size (int, optional): Le nombre de lignes lues par lot. Par défaut,
+                                    DB_STREAM_BATCH_SIZE (1000).
+        session (Session, optional): La session à utiliser.
+
+    Yields:
+        Les objets renvoyés par la requête, un par un.
+    """
+    batch_size = batch_size or STREAM_BATCH_SIZE
+    statement = statement.execution_options(yield_per=batch_size)
+    if session is not None:
+        yield from session.execute(statement).scalars()
+        return
+    session = Session()
+    try:
+        yield from session.execute(statement).scalars()
+    finally:
+        session.close()
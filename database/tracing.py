@@ -0,0 +1,540 @@
+import atexit
+import contextvars
+import functools
+import inspect
+import json
+import math
+from math import frexp
+import os
+import random
+import secrets
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import sentry_sdk
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Sous-intervalles par puissance de deux des histogrammes : les quantiles sont
+# exacts à 1/64 près en valeur relative.
+HISTOGRAM_PRECISION = 32
+# Nombre de spans conservés en mémoire avant écriture dans le fichier d'export.
+EXPORT_BUFFER_SIZE = 256
+SERVICE_NAME = "epicevents"
+
+# Clé du seau des durées nulles (horloge trop grossière pour les mesurer).
+_ZERO_BUCKET = -(2**31)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def load_tracing_config() -> Dict[str, Any]:
+    """
+    Lit la configuration du traçage depuis les variables d'environnement.
+
+    Variables reconnues : TRACE_SAMPLE_RATE (part des opérations dont les spans
+    sont exportés, 0.01 par défaut) et TRACE_FILE (fichier JSONL d'export ;
+    sans lui, aucun span n'est exporté). Les histogrammes de durées sont
+    alimentés par toutes les opérations, quel que soit l'échantillonnage.
+
+    Returns:
+        dict: La configuration du traceur.
+    """
+    return {
+        "sample_rate": _env_float("TRACE_SAMPLE_RATE", 0.01),
+        "path": os.getenv("TRACE_FILE") or None,
+    }
+
+
+def init_sentry() -> bool:
+    """
+    Initialise Sentry depuis les variables d'environnement.
+
+    Variables reconnues : SENTRY_DSN (sans elle, Sentry n'est pas initialisé et
+    aucune donnée ne quitte le poste), SENTRY_ENVIRONMENT,
+    SENTRY_TRACES_SAMPLE_RATE et SENTRY_PROFILES_SAMPLE_RATE (0 par défaut :
+    seules les erreurs sont remontées).
+
+    Returns:
+        bool: True si Sentry a été initialisé.
+    """
+    dsn = os.getenv("SENTRY_DSN")
+    if not dsn:
+        return False
+    sentry_sdk.init(
+        dsn=dsn,
+        environment=os.getenv("SENTRY_ENVIRONMENT"),
+        traces_sample_rate=_env_float("SENTRY_TRACES_SAMPLE_RATE", 0.0),
+        profiles_sample_rate=_env_float("SENTRY_PROFILES_SAMPLE_RATE", 0.0),
+    )
+    return True
+
+
+class Histogram:
+    """
+    Histogramme de durées à seaux logarithmiques, en millisecondes.
+
+    Chaque puissance de deux est découpée en `precision` seaux : la mémoire ne
+    dépend que de l'étendue des valeurs, et un quantile est connu à
+    1 / (2 * precision) près en valeur relative.
+
+    Attributes:
+        count (int): Le nombre de valeurs enregistrées.
+        total (float): La somme des valeurs.
+        max (float): La plus grande valeur.
+    """
+
+    def __init__(self, precision: int = HISTOGRAM_PRECISION) -> None:
+        self.precision = precision
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count!r}, max={self.max!r})"
+
+    def _value(self, key: int) -> float:
+        if key == _ZERO_BUCKET:
+            return 0.0
+        exponent, sub = divmod(key, self.precision)
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * self.precision), exponent)
+
+    def record(self, value: float) -> None:
+        """
+        Enregistre une durée, en millisecondes.
+        """
+        if value > 0:
+            mantissa, exponent = frexp(value)
+            precision = self.precision
+            key = exponent * precision + int((mantissa - 0.5) * 2 * precision)
+        else:
+            key = _ZERO_BUCKET
+        with self._lock:
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Renvoie le quantile `q` (entre 0 et 1) des durées enregistrées.
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(q * self.count))
+            seen = 0
+            for key in sorted(self._buckets):
+                seen += self._buckets[key]
+                if seen >= rank:
+                    return min(self._value(key), self.max)
+            return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Renvoie le nombre de mesures, la moyenne, les quantiles 50, 90 et 99 et
+        le maximum, en millisecondes.
+        """
+        count = self.count
+        return {
+            "count": count,
+            "mean_ms": round(self.total / count, 3) if count else 0.0,
+            "p50_ms": round(self.quantile(0.5), 3),
+            "p90_ms": round(self.quantile(0.9), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+            "max_ms": round(self.max, 3),
+        }
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    """
+    Une opération échantillonnée, exportée à sa fin.
+
+    Attributes:
+        name (str): Le nom de l'opération.
+        trace_id (str): L'identifiant de la trace, partagé par les spans imbriqués.
+        span_id (str): L'identifiant du span.
+        parent_id (str): L'identifiant du span parent, ou None.
+        attributes (dict): Les attributs du span.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = attributes or {}
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.error: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"Span(name={self.name!r}, span_id={self.span_id!r})"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Renvoie le span au format JSON d'OpenTelemetry (OTLP).
+        """
+        status = {"code": "STATUS_CODE_OK"}
+        if self.error is not None:
+            status = {"code": "STATUS_CODE_ERROR", "message": self.error}
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": "SPAN_KIND_INTERNAL",
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                _attribute(key, value) for key, value in self.attributes.items()
+            ],
+            "status": status,
+            "resource": {"service.name": SERVICE_NAME},
+        }
+
+
+class JsonlExporter:
+    """
+    Écrit les spans dans un fichier local, un objet JSON par ligne.
+
+    Les spans sont regroupés en mémoire et écrits par paquets : l'export ne
+    coûte une écriture disque que tous les `buffer_size` spans.
+
+    Attributes:
+        path (str): Le chemin du fichier, complété à chaque écriture.
+    """
+
+    def __init__(self, path: str, buffer_size: int = EXPORT_BUFFER_SIZE) -> None:
+        self.path = path
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+
+    def __repr__(self) -> str:
+        return f"JsonlExporter(path={self.path!r})"
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) < self.buffer_size:
+                return
+            lines, self._buffer = self._buffer, []
+        self._write(lines)
+
+    def flush(self) -> None:
+        """
+        Écrit les spans en attente.
+        """
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        self._write(lines)
+
+    def _write(self, lines: List[str]) -> None:
+        if lines:
+            with open(self.path, "a", encoding="utf-8") as output:
+                output.write("\n".join(lines) + "\n")
+
+
+# Opération en cours dans le thread (ou la tâche) courant : son nom et son span
+# (None si la trace n'est pas échantillonnée).
+_active: contextvars.ContextVar[Optional[Tuple[str, Optional[Span]]]] = (
+    contextvars.ContextVar("tracing_active", default=None)
+)
+
+
+class _Scope:
+    """
+    Mesure d'une opération, de start() à finish() ; utilisable avec `with`.
+    """
+
+    __slots__ = ("tracer", "name", "span", "token", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        parent = _active.get()
+        self.span = None
+        if parent is None:
+            # La décision d'échantillonnage est prise à la racine de la trace
+            # et suivie par toutes les opérations imbriquées.
+            if tracer.exporter is not None and random.random() < tracer.sample_rate:
+                self.span = Span(name, secrets.token_hex(16), None, attributes)
+        elif parent[1] is not None:
+            self.span = Span(name, parent[1].trace_id, parent[1].span_id, attributes)
+        self.token = _active.set((name, self.span))
+        self.start = time.perf_counter()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        elapsed = (time.perf_counter() - self.start) * 1000
+        _active.reset(self.token)
+        histogram = self.tracer._histograms.get(self.name)
+        if histogram is None:
+            histogram = self.tracer.histogram(self.name)
+        histogram.record(elapsed)
+        if self.span is not None:
+            self.span.end_ns = self.span.start_ns + int(elapsed * 1_000_000)
+            if error is not None:
+                self.span.error = type(error).__name__
+            self.tracer.exporter.export(self.span)
+
+    def __enter__(self) -> Optional[Span]:
+        return self.span
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self.finish(exc)
+        return False
+
+
+class Tracer:
+    """
+    Traceur des opérations de l'application.
+
+    Chaque opération alimente l'histogramme des durées de son nom. Une part
+    `sample_rate` des opérations racines est en plus exportée avec toutes ses
+    opérations imbriquées, sous forme de spans.
+
+    Attributes:
+        sample_rate (float): La part des traces exportées, entre 0 et 1.
+        exporter (JsonlExporter): La destination des spans, ou None.
+    """
+
+    def __init__(
+        self, sample_rate: float = 0.0, exporter: Optional[JsonlExporter] = None
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+
+    def __repr__(self) -> str:
+        return f"Tracer(sample_rate={self.sample_rate!r}, exporter={self.exporter!r})"
+
+    def histogram(self, name: str) -> Histogram:
+        """
+        Renvoie l'histogramme des durées d'une opération, créé au besoin.
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram())
+        return histogram
+
+    def start(self, name: str, **attributes: Any) -> _Scope:
+        """
+        Commence la mesure d'une opération ; à terminer par finish(), ou à
+        utiliser avec `with`, qui renvoie le span (None si non échantillonné).
+
+        Args:
+            name (str): Le nom de l'opération.
+            **attributes: Les attributs du span, s'il est échantillonné.
+        """
+        return _Scope(self, name, attributes)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Renvoie le résumé des durées de chaque opération, par nom.
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {name: histograms[name].summary() for name in sorted(histograms)}
+
+    def reset(self) -> None:
+        """
+        Oublie les durées enregistrées.
+        """
+        with self._lock:
+            self._histograms = {}
+
+    def flush(self) -> None:
+        """
+        Écrit les spans en attente d'export.
+        """
+        if self.exporter is not None:
+            self.exporter.flush()
+
+
+def build_tracer(config: Optional[Dict[str, Any]] = None) -> Tracer:
+    """
+    Crée un traceur à partir de la configuration donnée.
+
+    Args:
+        config (dict, optional): La configuration du traceur. Par défaut, celle
+                                 lue par load_tracing_config().
+
+    Returns:
+        Tracer: Le traceur configuré.
+    """
+    config = {**load_tracing_config(), **(config or {})}
+    exporter = JsonlExporter(config["path"]) if config["path"] else None
+    return Tracer(config["sample_rate"], exporter)
+
+
+tracer = build_tracer()
+
+
+def configure_tracing(**overrides: Any) -> Tracer:
+    """
+    Remplace le traceur par un autre, construit avec d'autres paramètres.
+
+    Args:
+        **overrides: Les clés de configuration à remplacer (sample_rate, path).
+
+    Returns:
+        Tracer: Le nouveau traceur.
+    """
+    global tracer
+    tracer.flush()
+    tracer = build_tracer(overrides)
+    return tracer
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    tracer.flush()
+
+
+def span(name: str, **attributes: Any) -> _Scope:
+    """
+    Mesure le bloc `with` qui l'utilise comme une opération du traceur courant.
+
+    Args:
+        name (str): Le nom de l'opération.
+        **attributes: Les attributs du span, s'il est échantillonné.
+    """
+    return tracer.start(name, **attributes)
+
+
+def current_operation() -> Optional[str]:
+    """
+    Renvoie le nom de l'opération la plus imbriquée en cours, ou None.
+    """
+    active = _active.get()
+    return active[0] if active is not None else None
+
+
+def current_span() -> Optional[Span]:
+    """
+    Renvoie le span de l'opération en cours, ou None s'il n'est pas échantillonné.
+    """
+    active = _active.get()
+    return active[1] if active is not None else None
+
+
+def get_latency_report() -> Dict[str, Dict[str, float]]:
+    """
+    Renvoie le résumé des durées de chaque opération mesurée par ce processus.
+    """
+    return tracer.report()
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Décorateur : chaque appel de la fonction est mesuré comme une opération.
+
+    Les arguments ne sont pas enregistrés (ils peuvent contenir un mot de passe).
+
+    Args:
+        name (str, optional): Le nom de l'opération. Par défaut,
+                              « module.fonction ».
+    """
+
+    def decorate(function: Callable) -> Callable:
+        label = name or f"{function.__module__.rsplit('.', 1)[-1]}.{function.__name__}"
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with tracer.start(label):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def instrument_module(namespace: Dict[str, Any], exclude: Iterable[str] = ()) -> None:
+    """
+    Mesure les fonctions publiques définies dans un module.
+
+    À appeler à la fin du module, avec globals() : les modules qui importent
+    ses fonctions, et ses propres appels internes, utilisent alors les versions
+    mesurées. Les générateurs ne sont pas mesurés : leur appel ne fait que
+    créer l'itérateur.
+
+    Args:
+        namespace (dict): L'espace de noms du module.
+        exclude (iterable): Les noms des fonctions à ne pas mesurer.
+    """
+    module = namespace["__name__"]
+    excluded = set(exclude)
+    for attribute, value in list(namespace.items()):
+        if (
+            attribute.startswith("_")
+            or attribute in excluded
+            or not inspect.isfunction(value)
+            or value.__module__ != module
+            or inspect.isgeneratorfunction(value)
+        ):
+            continue
+        namespace[attribute] = traced()(value)
+
+
+def summarize_spans(path: str) -> Dict[str, Dict[str, float]]:
+    """
+    Résume les durées des spans d'un fichier d'export, par nom d'opération.
+
+    Args:
+        path (str): Le fichier JSONL écrit par JsonlExporter.
+
+    Returns:
+        dict: Le résumé des durées de chaque opération.
+    """
+    histograms: Dict[str, Histogram] = {}
+    with open(path, encoding="utf-8") as spans:
+        for line in spans:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            elapsed = (
+                int(record["endTimeUnixNano"]) - int(record["startTimeUnixNano"])
+            ) / 1_000_000
+            histograms.setdefault(record["name"], Histogram()).record(elapsed)
+    return {name: histograms[name].summary() for name in sorted(histograms)}
@@ -0,0 +1,240 @@
+import heapq
+import math
+import threading
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# Nombre de candidats proposés par défaut.
+TOP_K = 8
+# Part minimale des trigrammes de la saisie retrouvés dans un champ.
+MIN_SIMILARITY = 0.5
+# Part d'entrées périmées au-delà de laquelle les tableaux sont reconstruits.
+STALE_RATIO = 0.25
+
+
+def normalize(value: Optional[str]) -> str:
+    """
+    Met une chaîne en minuscules, sans accents ni ponctuation.
+
+    Args:
+        value (str): La chaîne à normaliser.
+
+    Returns:
+        str: Les mots de la chaîne séparés par une espace.
+    """
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    letters = (
+        char if char.isalnum() else " "
+        for char in decomposed
+        if not unicodedata.combining(char)
+    )
+    return " ".join("".join(letters).split())
+
+
+def _word_trigrams(normalized: str) -> FrozenSet[str]:
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def trigrams(value: Optional[str]) -> FrozenSet[str]:
+    """
+    Découpe une chaîne en trigrammes de caractères, mot par mot.
+
+    Chaque mot est encadré d'espaces (« dupont » donne « ␣␣d », « ␣du », « dup »,
+    ..., « nt␣ ») : les débuts et fins de mots pèsent ainsi davantage, et un mot
+    d'une ou deux lettres produit tout de même des trigrammes.
+
+    Args:
+        value (str): La chaîne à découper.
+
+    Returns:
+        frozenset: Les trigrammes distincts de la chaîne normalisée.
+    """
+    return _word_trigrams(normalize(value))
+
+
+class TrigramIndex:
+    """
+    Index inversé de trigrammes tenu en mémoire, pour retrouver des lignes à
+    partir d'une saisie approximative (fautes de frappe, accents, mot partiel).
+
+    Les clés sont des identifiants entiers. Chaque trigramme pointe vers un
+    tableau compact (array) des identifiants qui le contiennent ; seules les
+    valeurs normalisées des champs sont conservées par ligne.
+
+    L'index se met à jour ligne par ligne, sans reconstruction : une ligne
+    modifiée ou supprimée laisse des entrées périmées dans les tableaux, qui ne
+    faussent pas les résultats (chaque candidat est noté sur ses valeurs
+    actuelles) et sont purgées dès qu'elles dépassent STALE_RATIO des entrées.
+
+    Attributes:
+        ready (bool): Indique si l'index a été alimenté avec toute la table.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[int, Tuple[str, ...]] = {}
+        self._postings: Dict[str, array] = {}
+        self._entries = 0
+        self._stale = 0
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return (
+            f"TrigramIndex(lignes={len(self._values)!r}, "
+            f"trigrammes={len(self._postings)!r}, "
+            f"entrées={self._entries!r}, périmées={self._stale!r})"
+        )
+
+    def _append(self, key: int, values: Tuple[str, ...]) -> None:
+        grams = frozenset().union(*map(_word_trigrams, values))
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array("q")
+            posting.append(key)
+        self._entries += len(grams)
+
+    def _forget(self, key: int) -> None:
+        values = self._values.pop(key, None)
+        if values is not None:
+            self._stale += len(frozenset().union(*map(_word_trigrams, values)))
+            if self._stale > STALE_RATIO * self._entries:
+                self._compact()
+
+    def _compact(self) -> None:
+        self._postings = {}
+        self._entries = 0
+        self._stale = 0
+        for key, values in self._values.items():
+            self._append(key, values)
+
+    def add(self, key: int, values: Iterable[Optional[str]]) -> None:
+        """
+        Indexe une ligne, ou remplace son entrée si elle est déjà indexée.
+
+        Args:
+            key (int): L'identifiant de la ligne.
+            values (list): La valeur de chaque champ indexé.
+        """
+        values = tuple(normalize(value) for value in values)
+        with self._lock:
+            if self._values.get(key) == values:
+                return
+            self._forget(key)
+            self._values[key] = values
+            self._append(key, values)
+
+    def remove(self, key: int) -> None:
+        """
+        Retire une ligne de l'index ; une clé absente est ignorée.
+
+        Args:
+            key (int): L'identifiant de la ligne.
+        """
+        with self._lock:
+            self._forget(key)
+
+    def load(self, rows: Iterable[Tuple[int, Iterable[Optional[str]]]]) -> None:
+        """
+        Remplace le contenu de l'index par les lignes données.
+
+        Args:
+            rows (iterable): Les couples (identifiant, valeurs des champs).
+        """
+        self.clear()
+        with self._lock:
+            for key, values in rows:
+                self._values[key] = tuple(normalize(value) for value in values)
+            self._compact()
+            self.ready = True
+
+    def clear(self) -> None:
+        """
+        Vide l'index, qui devra être rechargé avant la prochaine recherche.
+        """
+        with self._lock:
+            self._values = {}
+            self._postings = {}
+            self._entries = 0
+            self._stale = 0
+            self.ready = False
+
+    def search(
+        self,
+        query: str,
+        limit: int = TOP_K,
+        min_similarity: float = MIN_SIMILARITY,
+        keys: Optional[Set[int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Renvoie les lignes les plus proches d'une saisie.
+
+        Le score d'une ligne est la part des trigrammes de la saisie présents dans
+        son meilleur champ ; à score égal, le champ le plus court l'emporte.
+
+        Une ligne qui atteint le score minimum partage au moins m trigrammes avec
+        la saisie : elle apparaît forcément dans l'un des n - m + 1 tableaux les
+        plus courts parmi les n trigrammes de la saisie. Seuls ces tableaux
+        fournissent des candidats ; ceux des trigrammes fréquents (« cli »,
+        « com ») ne servent qu'à compléter leur décompte. Ce décompte borne le
+        score : les candidats sont notés du plus prometteur au moins prometteur,
+        jusqu'à ce que la borne ne permette plus d'entrer dans les `limit` premiers.
+
+        Args:
+            query (str): La saisie de l'utilisateur.
+            limit (int): Le nombre maximum de lignes renvoyées.
+            min_similarity (float): Le score minimum, entre 0 et 1.
+            keys (set, optional): Restreint la recherche à ces identifiants.
+
+        Returns:
+            list: Les couples (identifiant, score), du plus proche au moins proche.
+        """
+        grams = trigrams(query)
+        if not grams or limit <= 0:
+            return []
+        minimum = max(1, math.ceil(min_similarity * len(grams)))
+        prefix = len(grams) - minimum + 1
+        with self._lock:
+            postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+            shared: Counter = Counter()
+            for posting in postings[:prefix]:
+                shared.update(posting)
+            if keys is not None:
+                shared = Counter({key: shared[key] for key in shared.keys() & keys})
+            for posting in postings[prefix:]:
+                for key in posting:
+                    if key in shared:
+                        shared[key] += 1
+            best: List[Tuple[Tuple[float, int], int]] = []
+            for key, count in shared.most_common():
+                if count < minimum:
+                    break
+                if len(best) == limit and count / len(grams) < best[0][0][0]:
+                    break
+                values = self._values.get(key)
+                if values is None:
+                    continue
+                score = max(
+                    (len(grams & _word_trigrams(value)) / len(grams), -len(value))
+                    for value in values
+                )
+                if score[0] < min_similarity:
+                    continue
+                if len(best) < limit:
+                    heapq.heappush(best, (score, key))
+                elif score > best[0][0]:
+                    heapq.heapreplace(best, (score, key))
+        return [
+            (key, round(score, 3)) for (score, _), key in sorted(best, reverse=True)
+        ]
@@ -0,0 +1,163 @@
+import datetime
+from typing import Any, Dict, List, Mapping, Optional
+from sqlalchemy import inspect, select, update
+from sqlalchemy.orm import Session as DbSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Nombre maximum d'identifiants par clause IN lors des mises à jour groupées.
+IN_CLAUSE_SIZE = 500
+
+Changes = Dict[str, Any]
+
+
+def coerce_value(column: Any, value: Any) -> Any:
+    """
+    Convertit une valeur saisie dans le type Python de la colonne.
+
+    Les vues renvoient des chaînes ; sans conversion, « 3 » et 3 seraient
+    considérés comme différents et provoqueraient une écriture inutile.
+
+    Args:
+        column (Column): La colonne cible.
+        value: La valeur saisie.
+
+    Returns:
+        La valeur convertie. Une chaîne vide devient None pour une colonne
+        non textuelle.
+
+    Raises:
+        ValueError: Si la valeur ne peut pas être convertie.
+    """
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if isinstance(value, str) and python_type is not str:
+        value = value.strip()
+        if value == "":
+            if column.nullable:
+                return None
+            raise ValueError(f"le champ '{column.key}' est obligatoire")
+        try:
+            if python_type is datetime.datetime:
+                return datetime.datetime.fromisoformat(value)
+            if python_type is datetime.date:
+                return datetime.date.fromisoformat(value)
+            if python_type is bool:
+                return value.lower() in ("1", "true", "oui", "vrai")
+            return python_type(value)
+        except ValueError:
+            raise ValueError(f"valeur invalide pour '{column.key}' : {value!r}")
+    if python_type is datetime.date and isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+def diff_values(model: Any, current: Any, new_values: Mapping[str, Any]) -> Changes:
+    """
+    Compare les valeurs saisies aux valeurs actuelles d'une ligne.
+
+    Args:
+        model (Base): La classe du modèle.
+        current (Base): L'objet portant les valeurs actuelles.
+        new_values (dict): Les valeurs saisies, par nom d'attribut.
+
+    Returns:
+        dict: Les seules colonnes modifiées, avec leur nouvelle valeur convertie.
+
+    Raises:
+        ValueError: Si un attribut est inconnu, est la clé primaire, ou si une
+                    valeur ne peut pas être convertie.
+    """
+    columns = inspect(model).columns
+    changes = {}
+    for key, value in new_values.items():
+        if key not in columns or columns[key].primary_key:
+            raise ValueError(f"attribut non modifiable : {key}")
+        value = coerce_value(columns[key], value)
+        if getattr(current, key) != value:
+            changes[key] = value
+    return changes
+
+
+def update_by_id(
+    model: Any, object_id: Any, new_values: Mapping[str, Any], session: DbSession
+) -> Optional[Changes]:
+    """
+    Met à jour une ligne en n'écrivant que les colonnes réellement modifiées.
+
+    La ligne courante est prise dans la session si elle y est déjà chargée (cas
+    des menus, qui l'affichent avant la saisie) ; sinon elle est lue une fois.
+    Aucune requête d'écriture n'est émise si rien n'a changé, et sinon un seul
+    UPDATE ... WHERE id = ... portant sur les colonnes modifiées.
+
+    Args:
+        model (Base): La classe du modèle.
+        object_id: L'identifiant de la ligne.
+        new_values (dict): Les valeurs saisies, par nom d'attribut.
+        session (Session): La session de l'unité de travail en cours.
+
+    Returns:
+        dict: Les colonnes modifiées (vide si rien n'a changé), ou None si la
+              ligne n'existe pas.
+    """
+    primary_key = inspect(model).primary_key[0]
+    current = session.get(model, coerce_value(primary_key, object_id))
+    if current is None:
+        return None
+    changes = diff_values(model, current, new_values)
+    if changes:
+        # synchronize_session met aussi à jour l'objet déjà présent en session.
+        session.execute(
+            update(model)
+            .where(primary_key == getattr(current, primary_key.key))
+            .values(**changes)
+        )
+    return changes
+
+
+def bulk_update(
+    model: Any, changes_by_id: Mapping[Any, Mapping[str, Any]], session: DbSession
+) -> int:
+    """
+    Applique plusieurs mises à jour partielles dans la même transaction.
+
+    Les lignes concernées sont lues par tranches de IN_CLAUSE_SIZE, les lignes
+    inchangées sont ignorées, puis les UPDATE sont envoyés en executemany,
+    regroupés par ensemble de colonnes modifiées.
+
+    Args:
+        model (Base): La classe du modèle.
+        changes_by_id (dict): Les valeurs saisies, par identifiant de ligne.
+        session (Session): La session de l'unité de travail en cours.
+
+    Returns:
+        int: Le nombre de lignes effectivement modifiées. Les identifiants
+             inexistants sont ignorés.
+    """
+    primary_key = inspect(model).primary_key[0]
+    new_values_by_id = {
+        coerce_value(primary_key, object_id): new_values
+        for object_id, new_values in changes_by_id.items()
+    }
+    ids = list(new_values_by_id)
+    rows: List[Changes] = []
+    updated = []
+    for start in range(0, len(ids), IN_CLAUSE_SIZE):
+        for current in session.scalars(
+            select(model).where(primary_key.in_(ids[start : start + IN_CLAUSE_SIZE]))
+        ):
+            object_id = getattr(current, primary_key.key)
+            changes = diff_values(model, current, new_values_by_id[object_id])
+            if changes:
+                rows.append({primary_key.key: object_id, **changes})
+                updated.append((current, changes))
+    if not rows:
+        return 0
+    # Des lignes consécutives ayant les mêmes colonnes partagent un executemany.
+    rows.sort(key=lambda row: sorted(row))
+    session.execute(update(model), rows)
+    # La mise à jour par clé primaire ne rafraîchit pas les objets en session.
+    for current, changes in updated:
+        for key, value in changes.items():
+            set_committed_value(current, key, value)
+    return len(rows)
@@ -0,0 +1,93 @@
+import datetime
+import threading
+import time
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+# Nombre de jours à venir conservés par défaut.
+WINDOW_DAYS = 30
+# Durée de validité d'une fenêtre chargée, en secondes : borne le retard sur les
+# écritures faites par un autre processus, que l'invalidation ne voit pas.
+WINDOW_TTL = 300.0
+
+Loader = Callable[[datetime.date, datetime.date], Sequence[Any]]
+
+
+class WindowCache:
+    """
+    Cache en mémoire des lignes d'une fenêtre de dates glissante, du jour
+    courant (inclus) à `days` jours plus tard (exclu).
+
+    La fenêtre est chargée à la première lecture, puis rechargée quand le jour
+    change, quand elle a expiré ou après une invalidation. Une invalidation
+    survenue pendant un chargement empêche d'en conserver le résultat, qui
+    pourrait ne pas refléter l'écriture.
+
+    Attributes:
+        days (int): La largeur de la fenêtre, en jours.
+        ttl (float): La durée de validité d'un chargement, en secondes.
+        hits (int): Le nombre de lectures servies depuis la mémoire.
+        misses (int): Le nombre de lectures ayant déclenché un chargement.
+    """
+
+    def __init__(self, days: int = WINDOW_DAYS, ttl: float = WINDOW_TTL) -> None:
+        self.days = days
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._start: Optional[datetime.date] = None
+        self._loaded_at = 0.0
+        self._rows: Tuple[Any, ...] = ()
+
+    def __repr__(self) -> str:
+        return (
+            f"WindowCache(début={self._start!r}, jours={self.days!r}, "
+            f"lignes={len(self._rows)!r}, hits={self.hits!r}, misses={self.misses!r})"
+        )
+
+    def bounds(self, today: datetime.date) -> Tuple[datetime.date, datetime.date]:
+        """
+        Renvoie les bornes de la fenêtre commençant à `today` : début inclus,
+        fin exclue.
+        """
+        return today, today + datetime.timedelta(days=self.days)
+
+    def get(self, today: datetime.date, load: Loader) -> Tuple[Any, ...]:
+        """
+        Renvoie les lignes de la fenêtre commençant à `today`.
+
+        Args:
+            today (date): Le premier jour de la fenêtre.
+            load (callable): Fonction (début, fin exclue) renvoyant les lignes de
+                             la fenêtre, appelée hors verrou s'il faut charger.
+
+        Returns:
+            tuple: Les lignes, dans l'ordre renvoyé par `load`. Elles sont
+                   partagées entre appelants et ne doivent pas être modifiées.
+        """
+        with self._lock:
+            if (
+                self._start == today
+                and time.monotonic() - self._loaded_at < self.ttl
+            ):
+                self.hits += 1
+                return self._rows
+            self.misses += 1
+            generation = self._generation
+        rows = tuple(load(*self.bounds(today)))
+        with self._lock:
+            if self._generation == generation:
+                self._start = today
+                self._loaded_at = time.monotonic()
+                self._rows = rows
+        return rows
+
+    def invalidate(self) -> None:
+        """
+        Oublie la fenêtre chargée ; la prochaine lecture la recharge.
+        """
+        with self._lock:
+            self._generation += 1
+            self._start = None
+            self._rows = ()
@@ -3,6 +3,7 @@ import sentry_sdk
 from controllers.collaborateur_controlleur import (
     create_collaborateur,
     authenticate_collaborateur,
+    disconnection_collaborateur,
 )
 
 from views.menu_view import display_menu, display_menu_start, handle_menu_options
@@ -12,22 +13,15 @@ from views.collaborateur_view import (
     get_role,
     get_password,
 )
+from database.tracing import init_sentry
 from views.main_view import (
     display_success_message,
     display_error_message,
     display_welcome_message,
 )
 
-sentry_sdk.init(
-    dsn="https://10f5a086eadb50756921d93e4c02e773@o4506824189739008.ingest.sentry.io/4506824191377408",
-    # Set traces_sample_rate to 1.0 to capture 100%
-    # of transactions for performance monitoring.
-    traces_sample_rate=1.0,
-    # Set profiles_sample_rate to 1.0 to profile 100%
-    # of sampled transactions.
-    # We recommend adjusting this value in production.
-    profiles_sample_rate=1.0,
-)
+# Sentry n'est initialisé que si SENTRY_DSN est défini (voir init_sentry).
+init_sentry()
 
 
 def main() -> None:
@@ -62,6 +56,10 @@ def main() -> None:
         sentry_sdk.capture_exception(e)
         print("Une erreur s'est produite. Veuillez contacter le support.")
         sys.exit(1)
+    finally:
+        # Session encore ouverte si le menu s'est interrompu (erreur, Ctrl+C) :
+        # elle est fermée tant que le pool de connexions est disponible.
+        disconnection_collaborateur()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+import argparse
+import sys
+
+# Toutes les classes du modèle doivent être chargées avant la première requête
+# pour que SQLAlchemy puisse résoudre les relations entre elles.
+from models import (  # noqa: F401
+    client,
+    collaborateur,
+    collaborateur_session,
+    contract,
+    event,
+)
+from controllers.import_controller import (
+    IMPORT_CHUNK_SIZE,
+    ImportReport,
+    import_clients,
+    import_contracts,
+    import_events,
+)
+from controllers.collaborateur_controlleur import sweep_expired_sessions
+from database.db_config import session_scope
+from database.migrations import migrate, pending_migrations
+from database.rollups import reconcile_rollups
+from database.tracing import summarize_spans
+from views.database_view import display_latency_report
+from views.main_view import display_error_message, display_success_message
+
+
+def display_import_report(report: ImportReport, max_errors: int = 20) -> None:
+    """
+    Affiche le bilan d'un import en masse.
+
+    Args:
+        report (ImportReport): Le bilan à afficher.
+        max_errors (int): Le nombre maximum d'erreurs détaillées.
+    """
+    display_success_message(f"{report.inserted} ligne(s) importée(s).")
+    if report.errors:
+        display_error_message(f"{len(report.errors)} ligne(s) rejetée(s) :")
+        for line_number, message in report.errors[:max_errors]:
+            display_error_message(f"  ligne {line_number} : {message}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Commandes d'administration d'Epic Events."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    clients = commands.add_parser(
+        "import-clients", help="Importer des clients depuis un fichier CSV ou JSONL."
+    )
+    clients.add_argument("path", help="Fichier .csv ou .jsonl à importer.")
+    clients.add_argument(
+        "--commercial", type=int, required=True, help="ID du commercial propriétaire."
+    )
+    clients.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+
+    for command, label in (
+        ("import-contracts", "contrats"),
+        ("import-events", "événements"),
+    ):
+        bulk = commands.add_parser(
+            command, help=f"Importer des {label} depuis un fichier CSV ou JSONL."
+        )
+        bulk.add_argument("path", help="Fichier .csv ou .jsonl à importer.")
+        bulk.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+        bulk.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Processus de validation (par défaut, selon la taille du fichier).",
+        )
+
+    migrate_parser = commands.add_parser(
+        "migrate", help="Appliquer les migrations de schéma en attente."
+    )
+    migrate_parser.add_argument(
+        "--target", type=int, default=None, help="Version à atteindre."
+    )
+    migrate_parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Lister les migrations en attente sans les appliquer.",
+    )
+    rollups = commands.add_parser(
+        "reconcile-rollups",
+        help="Recalculer les agrégats dénormalisés et signaler les écarts.",
+    )
+    rollups.add_argument(
+        "--check",
+        action="store_true",
+        help="Signaler les écarts sans les corriger.",
+    )
+    commands.add_parser(
+        "sweep-sessions", help="Supprimer les sessions de connexion expirées."
+    )
+    trace_report = commands.add_parser(
+        "trace-report",
+        help="Résumer les temps de réponse d'un fichier de spans (TRACE_FILE).",
+    )
+    trace_report.add_argument("path", help="Fichier JSONL des spans exportés.")
+    return parser
+
+
+def run_reconciliation(check: bool = False) -> int:
+    """
+    Contrôle les agrégats dénormalisés des clients et collaborateurs, et les
+    recalcule en masse s'ils ont dérivé.
+
+    Args:
+        check (bool): Si True, les écarts sont seulement signalés.
+
+    Returns:
+        int: Le nombre total de valeurs en écart.
+    """
+    with session_scope() as session:
+        drift = reconcile_rollups(session, fix=not check)
+    for column, count in drift.items():
+        if count:
+            display_error_message(f"{column} : {count} ligne(s) en écart")
+    total = sum(drift.values())
+    if not total:
+        display_success_message("Aucun écart dans les agrégats.")
+    elif not check:
+        display_success_message("Agrégats recalculés.")
+    return total
+
+
+def run_migrations(target=None, status: bool = False) -> None:
+    """
+    Applique ou liste les migrations de schéma en attente.
+
+    Args:
+        target (int, optional): La version à atteindre. Par défaut, la dernière.
+        status (bool): Si True, liste seulement les migrations en attente.
+    """
+    if status:
+        pending = pending_migrations()
+        if not pending:
+            display_success_message("Le schéma est à jour.")
+        for step in pending:
+            print(f"En attente : {step.version} - {step.name}")
+        return
+    applied = migrate(target)
+    for step in applied:
+        display_success_message(f"Migration {step.version} appliquée : {step.name}")
+    if not applied:
+        display_success_message("Le schéma est déjà à jour.")
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "migrate":
+            run_migrations(args.target, args.status)
+            return 0
+        if args.command == "reconcile-rollups":
+            drift = run_reconciliation(args.check)
+            return 1 if drift and args.check else 0
+        if args.command == "trace-report":
+            display_latency_report(summarize_spans(args.path))
+            return 0
+        if args.command == "sweep-sessions":
+            removed = sweep_expired_sessions()
+            display_success_message(f"{removed} session(s) expirée(s) supprimée(s).")
+            return 0
+        if args.command == "import-clients":
+            report = import_clients(args.path, args.commercial, args.chunk_size)
+        elif args.command == "import-contracts":
+            report = import_contracts(args.path, args.chunk_size, args.workers)
+        else:
+            report = import_events(args.path, args.chunk_size, args.workers)
+        display_import_report(report)
+    except (OSError, ValueError) as e:
+        display_error_message(f"Erreur : {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from models.base import Base
 
@@ -20,11 +20,19 @@ class Client(Base):
         derniere_maj_contact (Date, optional): Dernière mise à jour du contact avec le client.
         
         collaborateur_id (int): Identifiant du collaborateur associé au client.
+        nb_contrats (int): Nombre de contrats du client (agrégat dénormalisé).
+        montant_total_contrats (int): Somme des montants de ses contrats (agrégat dénormalisé).
+        montant_restant_contrats (int): Somme restant à payer sur ses contrats (agrégat dénormalisé).
         events (relationship): Relation avec la table Events.
         contracts (relationship): Relation avec la table Contract.
         collaborateur (relationship): Relation avec la table Collaborateur.
     """
     __tablename__ = "client"
+    __table_args__ = (
+        Index("idx_client_name", "nom_complet"),
+        Index("ix_client_collaborateur_nom", "collaborateur_id", "nom_complet"),
+        Index("ix_client_date_de_creation", "date_de_creation"),
+    )
 
     id = Column(Integer, primary_key=True)
     nom_complet = Column(String(256), nullable=False)
@@ -34,6 +42,10 @@ class Client(Base):
     date_de_creation = Column(DateTime, default=datetime.now)
     derniere_maj_contact = Column(DateTime, nullable=True)
     collaborateur_id = Column(Integer, ForeignKey('collaborateurs.id'))
+    # Agrégats tenus à jour par les contrôleurs (database/rollups.py).
+    nb_contrats = Column(Integer, nullable=False, default=0, server_default="0")
+    montant_total_contrats = Column(Integer, nullable=False, default=0, server_default="0")
+    montant_restant_contrats = Column(Integer, nullable=False, default=0, server_default="0")
 
 
     events = relationship("Events", back_populates="client")
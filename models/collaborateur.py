@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from models.base import Base
 from models.client import Client 
@@ -15,22 +15,37 @@ class Collaborateur(Base):
     Attributes:
         id (int): Identifiant unique du collaborateur.
         nom_utilisateur (str): Nom d'utilisateur du collaborateur.
-        mot_de_passe (str): Mot de passe du collaborateur.
+        mot_de_passe (str): Hachage du mot de passe du collaborateur, avec ses paramètres de coût.
         salt (str): Sel utilisé pour hasher le mot de passe.
         role (str): Rôle du collaborateur.
-        is_connected (bool): Indique si le collaborateur est connecté ou non.
+        is_connected (bool): Ancien indicateur de connexion, remplacé par la table
+                             sessions ; n'est plus ni lu ni écrit.
+        nb_clients (int): Nombre de clients suivis (agrégat dénormalisé).
+        nb_contrats (int): Nombre de contrats rattachés (agrégat dénormalisé).
+        nb_evenements (int): Nombre d'événements pris en charge (agrégat dénormalisé).
         contracts (relationship): Relation avec la table Contract.
         events (relationship): Relation avec la table Events.
         client (relationship): Relation avec la table Client.
     """
     __tablename__ = "collaborateurs"
+    __table_args__ = (
+        Index("ix_collaborateurs_role_nom", "role", "nom_utilisateur"),
+    )
 
     id = Column(Integer, primary_key=True)
     nom_utilisateur = Column(String(256), unique=True, nullable=False)
-    mot_de_passe = Column(String(64), nullable=False)
-    salt = Column(String(16), nullable=False)
+    # « scrypt$n$r$p$empreinte », ou empreinte sha3_256 pour les comptes anciens.
+    mot_de_passe = Column(String(255), nullable=False)
+    salt = Column(String(64), nullable=False)
     role = Column(String(50), nullable=False)
+    # Colonne abandonnée (voir CollaborateurSession), conservée tant que des
+    # versions antérieures de l'application peuvent encore l'écrire : elle sera
+    # supprimée par une migration ultérieure. Son index l'est par la migration 10.
     is_connected = Column(Boolean, default=False)
+    # Agrégats tenus à jour par les contrôleurs (database/rollups.py).
+    nb_clients = Column(Integer, nullable=False, default=0, server_default="0")
+    nb_contrats = Column(Integer, nullable=False, default=0, server_default="0")
+    nb_evenements = Column(Integer, nullable=False, default=0, server_default="0")
 
     contracts = relationship("Contract", back_populates="collaborateur")
     events = relationship("Events", back_populates="collaborateur")
@@ -0,0 +1,32 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Index
+from models.base import Base
+
+
+class CollaborateurSession(Base):
+    """
+    Représente une session ouverte par un collaborateur à sa connexion.
+
+    Attributes:
+        token_hash (str): Empreinte SHA-256 du jeton remis au collaborateur ; le
+                          jeton lui-même n'est pas conservé en base.
+        collaborateur_id (int): Identifiant du collaborateur connecté.
+        created_at (DateTime): Date d'ouverture de la session.
+        expires_at (DateTime): Date d'expiration de la session.
+    """
+    __tablename__ = "sessions"
+    __table_args__ = (
+        Index("ix_sessions_collaborateur_id", "collaborateur_id"),
+        Index("ix_sessions_expires_at", "expires_at"),
+    )
+
+    token_hash = Column(String(64), primary_key=True)
+    collaborateur_id = Column(Integer, ForeignKey("collaborateurs.id"), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    expires_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"CollaborateurSession(collaborateur_id={self.collaborateur_id!r}, "
+            f"expires_at={self.expires_at!r})"
+        )
@@ -1,6 +1,6 @@
 from models.base import Base
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 
 
@@ -21,6 +21,12 @@ class Contract(Base):
         collaborateur (relationship): Relation avec la table Collaborateur.
     """
     __tablename__ = "contract"
+    __table_args__ = (
+        Index("ix_contract_client_id", "client_id"),
+        Index("ix_contract_collaborateur_id", "collaborateur_id"),
+        Index("ix_contract_montant_total", "montant_total"),
+        Index("ix_contract_statut_montant", "statut_contrat", "montant_total"),
+    )
 
     id = Column(Integer, primary_key=True)
     client_id = Column(Integer, ForeignKey("client.id"), nullable=False)
@@ -30,5 +36,6 @@ class Contract(Base):
     montant_restant_a_payer = Column(Integer)
     statut_contrat = Column(String(50), nullable=False)
 
+    events = relationship("Events", back_populates="contract")
     client = relationship("Client", back_populates="contracts")
     collaborateur = relationship("Collaborateur", back_populates="contracts")
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from models.base import Base
 
@@ -12,7 +12,9 @@ class Events(Base):
     Attributes:
         id (int): Identifiant unique de l'événement.
         contract_id (int): Identifiant du contrat associé à l'événement.
-        client_name (str): Nom du client associé à l'événement.
+        client_id (int): Identifiant du client associé à l'événement.
+        client_name (str): Nom du client lors de la création de l'événement, conservé
+                           pour l'affichage ; la référence au client est client_id.
         collaborateur_id (int): Identifiant du collaborateur associé à l'événement.
         date_debut (Date): Date de début de l'événement.
         date_fin (Date): Date de fin de l'événement.
@@ -25,9 +27,19 @@ class Events(Base):
         collaborateur (relationship): Relation avec la table Collaborateur.
     """
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_client_id", "client_id"),
+        Index("ix_events_contract_id", "contract_id"),
+        Index("ix_events_collaborateur_date", "collaborateur_id", "date_debut"),
+        Index("ix_events_date_debut", "date_debut"),
+        # Recherche de chevauchements : date_fin >= début ET date_debut <= fin.
+        Index("ix_events_collaborateur_fin", "collaborateur_id", "date_fin", "date_debut"),
+        Index("ix_events_date_fin", "date_fin", "date_debut"),
+    )
     id = Column(Integer, primary_key=True)
-    contract_id = Column(Integer, nullable=False)
-    client_name = Column(String(256), ForeignKey("client.nom_complet"), nullable=False)
+    contract_id = Column(Integer, ForeignKey("contract.id"), nullable=False)
+    client_id = Column(Integer, ForeignKey("client.id"))
+    client_name = Column(String(256), nullable=False)
     collaborateur_id = Column(Integer, ForeignKey("collaborateurs.id"))
     date_debut = Column(Date, nullable=False)
     date_fin = Column(Date, nullable=False)
@@ -37,5 +49,6 @@ class Events(Base):
     notes = Column(String(2048))
 
    
+    contract = relationship("Contract", back_populates="events")
     client = relationship("Client", back_populates="events")
     collaborateur = relationship("Collaborateur", back_populates="events")
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Configuration commune des tests : chaque test travaille sur sa propre base
+SQLite, dans un répertoire temporaire, migrée à la dernière version.
+"""
+
+import os
+import tempfile
+
+# Le moteur est créé à l'import de database.db_config : la base de test doit
+# être désignée avant tout import de l'application.
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(
+    tempfile.mkdtemp(), "epicevents_test.db"
+)
+
+import pytest  # noqa: E402
+
+from controllers.client_controller import invalidate_client_index  # noqa: E402
+from controllers.collaborateur_controlleur import (  # noqa: E402
+    invalidate_collaborateur_connecte,
+)
+from controllers.event_controller import invalidate_upcoming_events  # noqa: E402
+from database import db_config  # noqa: E402
+from database.migrations import migrate  # noqa: E402
+
+
+@pytest.fixture
+def database(tmp_path):
+    """
+    Rattache l'application à une base SQLite neuve et vide les caches en
+    mémoire, qui survivraient sinon d'un test à l'autre.
+    """
+    engine = db_config.configure_database(url=f"sqlite:///{tmp_path / 'test.db'}")
+    migrate(engine=engine)
+    for invalidate in (
+        invalidate_client_index,
+        invalidate_upcoming_events,
+        invalidate_collaborateur_connecte,
+    ):
+        invalidate()
+    yield engine
+    db_config.ScopedSession.remove()
+    db_config.engine.dispose()
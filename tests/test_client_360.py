@@ -0,0 +1,24 @@
+import contextlib
+import io
+
+import pytest
+
+from benchmarks.common import seed_database, silent_console
+from controllers.client_controller import get_client_360
+from database.db_config import record_queries
+from views.client_view import display_client_360
+
+
+@pytest.mark.parametrize("contracts, events", [(0, 0), (1, 1), (10, 5), (50, 4)])
+def test_client_360_loads_in_at_most_three_queries(database, contracts, events):
+    seed_database(3, contracts_per_client=contracts, events_per_contract=events)
+
+    with record_queries("client_360") as stats:
+        client = get_client_360(2)
+        # L'affichage, après fermeture de la session, ne doit rien recharger.
+        with silent_console(), contextlib.redirect_stdout(io.StringIO()):
+            display_client_360(client)
+
+    assert stats.queries <= 3
+    assert len(client.contracts) == contracts
+    assert len(client.events) == contracts * events
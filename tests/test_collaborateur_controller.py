@@ -0,0 +1,48 @@
+import hashlib
+
+from sqlalchemy import insert, select
+
+from controllers.collaborateur_controlleur import (
+    authenticate_collaborateur,
+    verify_password,
+)
+from database.db_config import session_scope
+from models.collaborateur import Collaborateur
+
+
+def _stored_hash(nom_utilisateur: str) -> str:
+    with session_scope() as session:
+        return session.scalar(
+            select(Collaborateur.mot_de_passe).where(
+                Collaborateur.nom_utilisateur == nom_utilisateur
+            )
+        )
+
+
+def test_a_legacy_sha3_password_is_upgraded_to_scrypt_at_login(database):
+    salt = "0123456789abcdef"
+    legacy = hashlib.sha3_256(("secret" + salt).encode()).hexdigest()
+    with database.begin() as connection:
+        connection.execute(
+            insert(Collaborateur),
+            {
+                "nom_utilisateur": "ancien",
+                "mot_de_passe": legacy,
+                "salt": salt,
+                "role": "gestion",
+                "is_connected": False,
+            },
+        )
+    assert verify_password("secret", legacy, salt)
+
+    assert authenticate_collaborateur("ancien", "mauvais") is None
+    assert _stored_hash("ancien") == legacy
+
+    collaborateur_id = authenticate_collaborateur("ancien", "secret")
+    assert collaborateur_id is not None
+    upgraded = _stored_hash("ancien")
+    assert upgraded.startswith("scrypt$")
+
+    assert authenticate_collaborateur("ancien", "secret") == collaborateur_id
+    assert _stored_hash("ancien") == upgraded
+    assert authenticate_collaborateur("ancien", "mauvais") is None
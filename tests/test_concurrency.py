@@ -0,0 +1,53 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+
+from benchmarks.common import seed_database
+from controllers.event_controller import create_event, get_event_by_id, update_event
+from database.db_config import session_scope
+from database.rollups import rollup_drift
+from models.event import Events
+
+TASKS = 40
+WORKERS = 4
+
+
+def _create_and_update(task_id: int) -> int:
+    # Un contrat par tâche ; les supports sont partagés, les dates disjointes.
+    contract_id = task_id + 1
+    support_id = (contract_id % 10) * 2 + 2
+    start = datetime.date(2026, 1, 1) + datetime.timedelta(days=2 * task_id)
+    event = create_event(
+        contract_id=contract_id,
+        client_name="",
+        date_debut=start,
+        date_fin=start,
+        contact_support=f"support-{support_id}",
+        lieu="Paris",
+        participants=0,
+        notes="initial",
+        collaborateur_id=support_id,
+    )
+    update_event(event.id, {"notes": f"tache-{task_id}", "participants": task_id})
+    reloaded = get_event_by_id(event.id)
+    assert (reloaded.notes, reloaded.participants) == (f"tache-{task_id}", task_id)
+    return event.id
+
+
+def test_concurrent_event_writes_do_not_share_sessions(database):
+    seed_database(TASKS, contracts_per_client=1)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        futures = [executor.submit(_create_and_update, i) for i in range(TASKS)]
+    errors = [future.exception() for future in futures if future.exception()]
+    assert errors == []
+
+    event_ids = [future.result() for future in futures]
+    with session_scope() as session:
+        assert session.scalar(select(func.count()).select_from(Events)) == TASKS
+        notes = dict(session.execute(select(Events.id, Events.notes)).all())
+        assert notes == {
+            event_id: f"tache-{task_id}" for task_id, event_id in enumerate(event_ids)
+        }
+        assert not any(rollup_drift(session).values())
@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import select
+
+from benchmarks.common import seed_database
+from controllers.contract_controller import (
+    delete_contract,
+    get_contract_by_id,
+    update_contract,
+)
+from controllers.event_controller import delete_event
+from database.db_config import session_scope
+from database.rollups import rollup_drift
+from models.event import Events
+
+
+def test_update_contract_reports_changes_and_missing_contracts(database):
+    seed_database(2, contracts_per_client=1)
+
+    assert update_contract(1, {"montant_restant_a_payer": "0"}) == {
+        "montant_restant_a_payer": 0
+    }
+    assert update_contract(1, {"montant_restant_a_payer": "0"}) == {}
+    assert update_contract(99, {"montant_total": "1"}) is None
+
+
+def test_update_contract_errors_roll_back_the_callers_unit_of_work(database):
+    seed_database(2, contracts_per_client=1)
+    before = get_contract_by_id(1)
+
+    with pytest.raises(ValueError):
+        with session_scope() as session:
+            update_contract(2, {"statut_contrat": "signé"}, session=session)
+            update_contract(1, {"montant_total": "abc"}, session=session)
+
+    assert get_contract_by_id(1).montant_total == before.montant_total
+    assert get_contract_by_id(2).statut_contrat != "signé"
+
+
+def test_a_contract_with_events_cannot_be_deleted(database):
+    seed_database(2, contracts_per_client=1, events_per_contract=3)
+
+    with pytest.raises(ValueError, match="contrat lié à 3 événement"):
+        delete_contract(1)
+    assert get_contract_by_id(1) is not None
+
+    with session_scope() as session:
+        event_ids = session.scalars(
+            select(Events.id).where(Events.contract_id == 2)
+        ).all()
+    for event_id in event_ids:
+        delete_event(event_id)
+    delete_contract(2)
+    assert get_contract_by_id(2) is None
+    with session_scope() as session:
+        assert not any(rollup_drift(session).values())
@@ -0,0 +1,99 @@
+import datetime
+
+import pytest
+
+from benchmarks.common import seed_database
+from controllers.event_controller import (
+    EventConflictError,
+    create_event,
+    get_event_by_id,
+    update_event,
+    update_events,
+)
+
+
+def test_moving_an_event_to_another_contract_follows_its_client(database):
+    seed_database(2, contracts_per_client=1)
+    event = create_event(
+        contract_id=1,
+        client_name="",
+        date_debut=datetime.date(2026, 3, 1),
+        date_fin=datetime.date(2026, 3, 1),
+        contact_support="",
+        lieu="Paris",
+        participants=10,
+        notes="",
+        collaborateur_id=None,
+    )
+
+    changes = update_event(event.id, {"contract_id": "2"})
+
+    assert changes == {
+        "contract_id": 2,
+        "client_id": 2,
+        "client_name": "Client 0000002",
+    }
+    moved = get_event_by_id(event.id)
+    assert (moved.client_id, moved.client_name) == (2, "Client 0000002")
+
+
+def test_moving_events_in_a_batch_follows_their_clients(database):
+    seed_database(3, contracts_per_client=1, events_per_contract=1)
+
+    assert update_events({1: {"contract_id": 2}, 2: {"contract_id": "3"}}) == 2
+
+    moved = [get_event_by_id(event_id) for event_id in (1, 2)]
+    assert [(event.client_id, event.client_name) for event in moved] == [
+        (2, "Client 0000002"),
+        (3, "Client 0000003"),
+    ]
+
+
+def test_an_event_must_name_the_client_of_its_contract(database):
+    seed_database(2, contracts_per_client=1)
+    details = dict(
+        contract_id=1,
+        date_debut=datetime.date(2026, 3, 1),
+        date_fin=datetime.date(2026, 3, 1),
+        contact_support="",
+        lieu="Paris",
+        participants=10,
+        notes="",
+        collaborateur_id=None,
+    )
+
+    with pytest.raises(ValueError, match="n'appartient pas au client"):
+        create_event(client_name="Client 0000002", **details)
+
+    event = create_event(client_name="Client 0000001", **details)
+    assert (event.client_id, event.client_name) == (1, "Client 0000001")
+
+
+def test_only_supports_are_checked_for_overlapping_events(database):
+    seed_database(2, contracts_per_client=1)
+    # Le client 1 a pour commercial le collaborateur 3, et pour support le 4.
+    for collaborateur_id in (3, 3, 4):
+        create_event(
+            contract_id=1,
+            client_name="",
+            date_debut=datetime.date(2026, 3, 1),
+            date_fin=datetime.date(2026, 3, 2),
+            contact_support="",
+            lieu="Paris",
+            participants=10,
+            notes="",
+            collaborateur_id=collaborateur_id,
+        )
+
+    with pytest.raises(EventConflictError):
+        create_event(
+            contract_id=1,
+            client_name="",
+            date_debut=datetime.date(2026, 3, 2),
+            date_fin=datetime.date(2026, 3, 3),
+            contact_support="",
+            lieu="Paris",
+            participants=10,
+            notes="",
+            collaborateur_id=4,
+        )
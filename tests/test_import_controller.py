@@ -0,0 +1,86 @@
+import datetime
+import json
+
+from benchmarks.common import seed_database
+from controllers.event_controller import create_event
+from controllers.import_controller import import_events
+
+
+def test_event_import_rejects_overlapping_support_assignments(database, tmp_path):
+    seed_database(1, contracts_per_client=1)
+    # Le client 1 a pour support le collaborateur 4.
+    existing = create_event(
+        contract_id=1,
+        client_name="",
+        date_debut=datetime.date(2026, 3, 1),
+        date_fin=datetime.date(2026, 3, 2),
+        contact_support="support-4",
+        lieu="Paris",
+        participants=10,
+        notes="",
+        collaborateur_id=4,
+    )
+    periods = [
+        ("2026-03-02", "2026-03-03"),  # chevauche l'événement existant
+        ("2026-03-10", "2026-03-12"),
+        ("2026-03-12", "2026-03-12"),  # chevauche la ligne précédente
+        ("2026-03-20", "2026-03-20"),
+        ("2026-03-05", "2026-03-11"),  # chevauche une ligne d'un lot précédent
+    ]
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps(
+                {
+                    "contract_id": 1,
+                    "client_name": "Client 0000001",
+                    "collaborateur_id": 4,
+                    "date_debut": debut,
+                    "date_fin": fin,
+                }
+            )
+            + "\n"
+            for debut, fin in periods
+        ),
+        encoding="utf-8",
+    )
+
+    report = import_events(str(path), chunk_size=2, workers=1)
+
+    assert report.inserted == 2
+    assert [line for line, _ in report.errors] == [1, 3, 5]
+    assert f"l'événement n°{existing.id}" in report.errors[0][1]
+
+
+def test_a_line_refused_by_the_database_does_not_block_later_lines(database, tmp_path):
+    seed_database(1, contracts_per_client=1)
+    with database.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TRIGGER refuse_event BEFORE INSERT ON events "
+            "WHEN NEW.lieu = 'refus' BEGIN SELECT RAISE(ABORT, 'refusé'); END"
+        )
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps(
+                {
+                    "contract_id": 1,
+                    "client_name": "Client 0000001",
+                    "collaborateur_id": 4,
+                    "date_debut": "2026-03-10",
+                    "date_fin": "2026-03-12",
+                    "lieu": lieu,
+                }
+            )
+            + "\n"
+            for lieu in ("refus", "Paris", "Lyon")
+        ),
+        encoding="utf-8",
+    )
+
+    report = import_events(str(path), workers=1)
+
+    assert report.inserted == 1
+    assert [line for line, _ in report.errors] == [1, 3]
+    assert "refusé" in report.errors[0][1]
+    assert "la ligne 2" in report.errors[1][1]
@@ -0,0 +1,48 @@
+import builtins
+import contextlib
+import io
+
+import pytest
+from rich.prompt import Prompt
+
+from benchmarks.common import seed_database
+from controllers.client_controller import get_client_by_id
+from database import db_config
+from views import menu_view
+
+
+def test_no_connection_is_held_while_the_user_types(database, monkeypatch):
+    seed_database(10, contracts_per_client=1, events_per_contract=1)
+    answers = iter(
+        # Création d'un client, puis modification de son téléphone.
+        ["3", "Client Menu", "menu@example.com", "+33 600000001", "Menu SA"]
+        + ["4", "11", "", "", "+33 600000002", ""]
+        # Liste paginée, fiche complète, recherche, puis déconnexion.
+        + ["12", "q", "19", "11", "20", "Client", "exit"]
+    )
+    checked_out = []
+
+    def answer(*args, **kwargs):
+        checked_out.append(db_config.engine.pool.checkedout())
+        return next(answers)
+
+    monkeypatch.setattr(builtins, "input", answer)
+    monkeypatch.setattr(Prompt, "ask", answer)
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(SystemExit):
+        menu_view.handle_menu_options("commercial-0")
+
+    assert checked_out and set(checked_out) == {0}
+    assert get_client_by_id(11).telephone == "+33 600000002"
+
+
+def test_updating_an_unknown_event_reports_it(database, monkeypatch):
+    seed_database(2, contracts_per_client=1, events_per_contract=1)
+    answers = iter(["10", "q", "999", "exit"])
+    monkeypatch.setattr(builtins, "input", lambda *args: next(answers))
+    monkeypatch.setattr(Prompt, "ask", lambda *args, **kwargs: next(answers))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), pytest.raises(SystemExit):
+        menu_view.handle_menu_options("support-0")
+
+    assert "Evènement introuvable." in output.getvalue()
+    assert "not defined" not in output.getvalue()
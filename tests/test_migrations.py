@@ -0,0 +1,109 @@
+from sqlalchemy import create_engine, inspect, text
+
+from database.migrations import MIGRATIONS, migrate
+
+# Schéma des modèles d'origine, avant toute migration : pas de client_id sur
+# events, dont le client n'était désigné que par son nom.
+ORIGINAL_SCHEMA = """
+CREATE TABLE collaborateurs (
+    id INTEGER PRIMARY KEY,
+    nom_utilisateur VARCHAR(256) NOT NULL UNIQUE,
+    mot_de_passe VARCHAR(64) NOT NULL,
+    salt VARCHAR(16) NOT NULL,
+    role VARCHAR(50) NOT NULL,
+    is_connected BOOLEAN
+);
+CREATE TABLE client (
+    id INTEGER PRIMARY KEY,
+    nom_complet VARCHAR(256) NOT NULL,
+    email VARCHAR(256) NOT NULL,
+    telephone VARCHAR(16),
+    nom_entreprise VARCHAR(256),
+    date_de_creation DATETIME,
+    derniere_maj_contact DATETIME,
+    collaborateur_id INTEGER REFERENCES collaborateurs (id)
+);
+CREATE TABLE contract (
+    id INTEGER PRIMARY KEY,
+    client_id INTEGER NOT NULL REFERENCES client (id),
+    contact_commercial VARCHAR(256) NOT NULL,
+    collaborateur_id INTEGER REFERENCES collaborateurs (id),
+    montant_total INTEGER,
+    montant_restant_a_payer INTEGER,
+    statut_contrat VARCHAR(50) NOT NULL
+);
+CREATE TABLE events (
+    id INTEGER PRIMARY KEY,
+    contract_id INTEGER NOT NULL,
+    client_name VARCHAR(256) NOT NULL REFERENCES client (nom_complet),
+    collaborateur_id INTEGER REFERENCES collaborateurs (id),
+    date_debut DATE NOT NULL,
+    date_fin DATE NOT NULL,
+    contact_support VARCHAR(256),
+    lieu VARCHAR(1024),
+    participants INTEGER,
+    notes VARCHAR(2048)
+);
+INSERT INTO collaborateurs VALUES
+    (1, 'commercial', 'x', 'y', 'commercial', 0),
+    (2, 'support', 'x', 'y', 'support', 1);
+INSERT INTO client (id, nom_complet, email, collaborateur_id) VALUES
+    (1, 'Alice Martin', 'alice@example.com', 1),
+    (2, 'Bruno Petit', 'bruno@example.com', 1);
+INSERT INTO contract VALUES
+    (1, 1, 'achats', 1, 1000, 500, 'signé'),
+    (2, 2, 'achats', 1, 3000, 0, 'signé');
+INSERT INTO events (id, contract_id, client_name, collaborateur_id, date_debut,
+                    date_fin, lieu) VALUES
+    (1, 1, 'Alice Martin', 2, '2026-03-01', '2026-03-02', 'Paris'),
+    (2, 2, 'Bruno Petit', 2, '2026-04-01', '2026-04-01', 'Lyon'),
+    (3, 99, 'Bruno Petit', NULL, '2026-05-01', '2026-05-01', 'Nice');
+"""
+
+
+def test_migrating_the_original_schema_backfills_the_new_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'original.db'}")
+    try:
+        with engine.begin() as connection:
+            for statement in ORIGINAL_SCHEMA.split(";"):
+                if statement.strip():
+                    connection.exec_driver_sql(statement)
+
+        applied = migrate(engine=engine)
+
+        assert [step.version for step in applied] == [
+            step.version for step in MIGRATIONS
+        ]
+        with engine.connect() as connection:
+            versions = connection.execute(
+                text("SELECT version FROM schema_version ORDER BY version")
+            ).scalars()
+            assert list(versions) == [step.version for step in MIGRATIONS]
+            # Le client vient du contrat, ou à défaut du nom (contrat 99 absent).
+            client_ids = connection.execute(
+                text("SELECT id, client_id FROM events ORDER BY id")
+            ).all()
+            assert client_ids == [(1, 1), (2, 2), (3, 2)]
+            rollups = connection.execute(
+                text(
+                    "SELECT id, nb_contrats, montant_total_contrats, "
+                    "montant_restant_contrats FROM client ORDER BY id"
+                )
+            ).all()
+            assert rollups == [(1, 1, 1000, 500), (2, 1, 3000, 0)]
+            assert (
+                connection.execute(
+                    text("SELECT nb_evenements FROM collaborateurs WHERE id = 2")
+                ).scalar()
+                == 2
+            )
+            inspector = inspect(connection)
+            assert inspector.has_table("sessions")
+            indexed = {
+                tuple(index["column_names"])
+                for index in inspector.get_indexes("collaborateurs")
+            }
+            assert ("is_connected",) not in indexed
+        assert migrate(engine=engine) == []
+    finally:
+        engine.dispose()
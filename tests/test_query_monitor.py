@@ -0,0 +1,35 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select, text
+
+from benchmarks.common import seed_database
+from database.db_config import record_queries, session_scope
+from models.client import Client
+
+THREADS = 4
+QUERIES_PER_THREAD = 200
+
+
+def _query_clients() -> None:
+    with session_scope() as session:
+        for _ in range(QUERIES_PER_THREAD):
+            session.execute(text("SELECT 1"))
+        session.scalars(select(Client)).all()
+
+
+def test_queries_from_threads_sharing_an_action_are_all_counted(database):
+    seed_database(20)
+
+    with record_queries("partagée") as stats:
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, _query_clients)
+                for _ in range(THREADS)
+            ]
+        for future in futures:
+            future.result()
+
+    assert stats.queries == THREADS * (QUERIES_PER_THREAD + 1)
+    assert stats.statements["SELECT 1"] == THREADS * QUERIES_PER_THREAD
+    assert stats.loaded == THREADS * 20
@@ -0,0 +1,94 @@
+import datetime
+
+from sqlalchemy import update
+
+from benchmarks.common import seed_database
+from controllers.client_controller import create_client, delete_client
+from controllers.contract_controller import (
+    create_contract,
+    delete_contract,
+    update_contract,
+    update_contracts,
+)
+from controllers.event_controller import (
+    create_event,
+    delete_event,
+    update_event,
+    update_events,
+)
+from database.db_config import session_scope
+from database.rollups import reconcile_rollups, rollup_drift
+from models.client import Client
+
+
+def _drift() -> dict:
+    with session_scope() as session:
+        return {
+            column: count for column, count in rollup_drift(session).items() if count
+        }
+
+
+def test_controller_writes_keep_rollups_in_step(database):
+    seed_database(4, contracts_per_client=2, events_per_contract=2)
+    assert _drift() == {}
+
+    now = datetime.datetime(2026, 1, 1)
+    client = create_client(
+        "Client Rollup",
+        "rollup@example.com",
+        "+33 600000000",
+        "Rollup SA",
+        now,
+        now,
+        collaborateur_id=3,
+    )
+    contract = create_contract(
+        client.id, "Service achats", None, 5000, 5000, "en cours", "commercial-1"
+    )
+    event = create_event(
+        contract.id,
+        "",
+        datetime.date(2030, 1, 1),
+        datetime.date(2030, 1, 1),
+        "support-1",
+        "Paris",
+        10,
+        "",
+        4,
+    )
+    update_contract(contract.id, {"montant_restant_a_payer": "1000"})
+    update_contract(1, {"client_id": str(client.id), "montant_total": "7000"})
+    update_contracts({2: {"collaborateur_id": 5}, 3: {"montant_total": 0}})
+    update_event(event.id, {"collaborateur_id": "6"})
+    update_events({1: {"collaborateur_id": None}, 2: {"collaborateur_id": 8}})
+    delete_event(event.id)
+    delete_event(3)
+    spare = create_contract(
+        client.id, "Service achats", None, 10, 10, "en cours", "commercial-1"
+    )
+    delete_contract(spare.id)
+    delete_client(
+        create_client(
+            "Client Supprimé",
+            "x@example.com",
+            "+33 600000009",
+            "X",
+            now,
+            now,
+            collaborateur_id=3,
+        ).id
+    )
+
+    assert _drift() == {}
+
+
+def test_reconcile_rollups_repairs_drift(database):
+    seed_database(4, contracts_per_client=2)
+    with session_scope() as session:
+        session.execute(update(Client).where(Client.id == 2).values(nb_contrats=99))
+
+    with session_scope() as session:
+        assert reconcile_rollups(session, fix=False)["client.nb_contrats"] == 1
+        assert reconcile_rollups(session)["client.nb_contrats"] == 1
+
+    assert _drift() == {}
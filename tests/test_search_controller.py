@@ -0,0 +1,14 @@
+from benchmarks.common import seed_database
+from controllers.search_controller import search_events
+
+
+def test_numbers_match_whole_words_and_longer_words_match_prefixes(database):
+    seed_database(40, contracts_per_client=1, events_per_contract=1)
+
+    # « 3 » ne désigne pas les contrats 30 à 39.
+    found = search_events("contrat 3")
+    assert [event.contract_id for event, _ in found] == [3]
+
+    found = search_events("contr 3")
+    assert [event.contract_id for event, _ in found] == [3]
+    assert len(search_events("Par", limit=100)) == 40
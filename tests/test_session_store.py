@@ -0,0 +1,74 @@
+import datetime
+
+import pytest
+from sqlalchemy import func, select, update
+
+from benchmarks.common import seed_database
+from database.db_config import session_scope
+from database.session_store import SessionStore
+from models.collaborateur import Collaborateur
+from models.collaborateur_session import CollaborateurSession
+
+HOUR = datetime.timedelta(hours=1)
+
+
+def _open(store: SessionStore, collaborateur_id: int = 1) -> str:
+    with session_scope() as session:
+        return store.open(session.get(Collaborateur, collaborateur_id), session)
+
+
+def _session_count() -> int:
+    with session_scope() as session:
+        return session.scalar(select(func.count()).select_from(CollaborateurSession))
+
+
+def test_sessions_expire_after_their_ttl(database):
+    seed_database(0, commerciaux=1)
+    expired = _open(SessionStore(ttl=-HOUR))
+    assert SessionStore().resolve(expired) is None
+
+    # Expirée en base alors qu'elle est encore en cache : relue faute de cache.
+    store = SessionStore(ttl=HOUR, cache_ttl=0)
+    token = _open(store)
+    assert store.resolve(token).nom_utilisateur == "commercial-0"
+    with session_scope() as session:
+        session.execute(
+            update(CollaborateurSession).values(
+                expires_at=datetime.datetime.now() - HOUR
+            )
+        )
+    assert store.resolve(token) is None
+
+
+def test_sweep_deletes_expired_sessions_in_batches(database):
+    seed_database(0, commerciaux=1)
+    expired_store = SessionStore(ttl=-HOUR)
+    for _ in range(7):
+        _open(expired_store)
+    store = SessionStore(ttl=HOUR)
+    token = _open(store)
+
+    assert store.sweep(batch_size=3) == 7
+    assert _session_count() == 1
+    assert store.resolve(token) is not None
+    assert store.sweep(batch_size=3) == 0
+
+
+def test_closing_a_collaborators_sessions_clears_the_cache_on_commit(database):
+    seed_database(0, commerciaux=1)
+    store = SessionStore(ttl=HOUR, cache_ttl=3600)
+    token = _open(store)
+    assert store.resolve(token) is not None
+
+    with pytest.raises(RuntimeError):
+        with session_scope() as session:
+            store.close_collaborateur(1, session)
+            raise RuntimeError
+    assert store.resolve(token) is not None
+    assert len(store) == 1
+
+    with session_scope() as session:
+        store.close_collaborateur(1, session)
+    assert len(store) == 0
+    assert store.resolve(token) is None
+    assert _session_count() == 0
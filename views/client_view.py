@@ -1,14 +1,13 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session as DbSession
 from controllers.client_controller import (
-    get_clients_filter_by_collaborateur,
+    find_clients,
+    get_clients_with_commercial,
     get_client_by_id,
 )
 from datetime import datetime
 from rich.table import Table
-from controllers.collaborateur_controlleur import (
-    get_collaborateur_id_connected,
-    get_collaborateur_name_by_id,
-)
+from controllers.collaborateur_controlleur import get_collaborateur_id_connected
 from models.client import Client
 from models.collaborateur import Collaborateur
 from views.main_view import console
@@ -16,7 +15,7 @@ import datetime
 
 
 def get_client_details(
-    nom_utilisateur,
+    nom_utilisateur, session: Optional[DbSession] = None
 ) -> Tuple[str, str, str, str, datetime.date, datetime.date, int]:
     nom_complet = input("Entrez le nom complet du client : ")
     email = input("Entrez l'email du client : ")
@@ -24,7 +23,7 @@ def get_client_details(
     nom_entreprise = input("Entrez le nom de l'entreprise du client : ")
     date_de_creation = datetime.date.today()
     derniere_maj_contact = datetime.date.today()
-    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur)
+    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur, session=session)
     return (
         nom_complet,
         email,
@@ -75,12 +74,13 @@ def update_client_view(client_id: int, current_values: Any) -> Dict[str, str]:
     return new_values
 
 
-def display_list_of_clients(clients: List[Client]) -> None:
+def display_list_of_clients(clients: List[Tuple[Client, Optional[str]]]) -> None:
     """
     Affiche la liste des clients.
 
     Args:
-        clients (list): La liste des clients à afficher.
+        clients (list): La liste des couples (client, nom du commercial) à afficher,
+                        telle que renvoyée par get_clients_with_commercial.
     """
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID")
@@ -92,11 +92,10 @@ def display_list_of_clients(clients: List[Client]) -> None:
     table.add_column("Dernière mise à jour du contact")
     table.add_column("Nom du commercial")
     table.add_column("ID du commercial")
+    table.add_column("Contrats", justify="right")
+    table.add_column("Reste à payer", justify="right")
 
-    for client in clients:
-        nom_utilisateur_commercial = get_collaborateur_name_by_id(
-            client.collaborateur_id
-        )
+    for client, nom_utilisateur_commercial in clients:
         table.add_row(
             str(client.id),
             client.nom_complet,
@@ -105,22 +104,95 @@ def display_list_of_clients(clients: List[Client]) -> None:
             client.nom_entreprise,
             str(client.date_de_creation),
             str(client.derniere_maj_contact),
-            nom_utilisateur_commercial,
+            nom_utilisateur_commercial or "Inconnu",
             str(client.collaborateur_id),
+            str(client.nb_contrats),
+            str(client.montant_restant_contrats),
         )
     print("Voici la liste des clients chez Epicevents: ")
     console.print(table)
 
 
-def display_clients_of_collaborateur_connected(nom_utilisateur) -> None:
+def display_client_candidates(
+    candidates: List[Tuple[Client, Optional[str], float]],
+) -> None:
+    """
+    Affiche les clients proposés par une recherche approximative.
+
+    Args:
+        candidates (list): Les triplets (client, nom du commercial, score) renvoyés
+                           par find_clients.
+    """
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("ID")
+    table.add_column("Nom complet")
+    table.add_column("Entreprise")
+    table.add_column("Email")
+    table.add_column("Commercial")
+    table.add_column("Score", justify="right")
+    for client, nom_utilisateur_commercial, score in candidates:
+        table.add_row(
+            str(client.id),
+            client.nom_complet,
+            str(client.nom_entreprise or ""),
+            client.email,
+            nom_utilisateur_commercial or "Inconnu",
+            f"{score:.2f}",
+        )
+    console.print(table)
+
+
+def prompt_client_id(
+    message: str,
+    collaborateur_id: Optional[int] = None,
+    session: Optional[DbSession] = None,
+) -> str:
+    """
+    Demande un client par une recherche approximative plutôt que d'afficher la
+    liste complète des clients.
+
+    L'utilisateur saisit un nom, une entreprise ou un email (ou directement un
+    ID) ; quelques candidats sont affichés, puis l'ID retenu est demandé.
+
+    Args:
+        message (str): La question posée pour obtenir l'ID du client.
+        collaborateur_id (int, optional): Restreint la recherche aux clients de ce
+                                          commercial.
+        session (Session, optional): La session de l'unité de travail en cours.
+
+    Returns:
+        str: L'ID saisi par l'utilisateur.
+    """
+    while True:
+        query = input("Rechercher un client (nom, entreprise, email) ou son ID : ")
+        if query.strip().isdigit():
+            return query.strip()
+        candidates = find_clients(
+            query, collaborateur_id=collaborateur_id, session=session
+        )
+        if candidates:
+            display_client_candidates(candidates)
+            return input(message)
+        print("Aucun client ne correspond à cette recherche.")
+
+
+def display_clients_of_collaborateur_connected(
+    nom_utilisateur, session: Optional[DbSession] = None
+) -> None:
     """
     Affiche les clients du collaborateur connecté.
+
+    Args:
+        nom_utilisateur (str): Le nom d'utilisateur du collaborateur connecté.
+        session (Session, optional): La session de l'unité de travail en cours.
     """
     collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-        nom_utilisateur
+        nom_utilisateur, session=session
     )
     if collaborateur_id:
-        clients = get_clients_filter_by_collaborateur(collaborateur_id)
+        clients = get_clients_with_commercial(
+            collaborateur_id=collaborateur_id, session=session
+        )
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("ID du client")
         table.add_column("Nom complet du client")
@@ -131,10 +203,7 @@ def display_clients_of_collaborateur_connected(nom_utilisateur) -> None:
         table.add_column("Dernière mise à jour de la fiche client")
         table.add_column("Nom du contact commercial chez Epicevents")
         table.add_column("ID du commercial")
-        for client in clients:
-            nom_utilisateur_commercial = get_collaborateur_name_by_id(
-                client.collaborateur_id
-            )
+        for client, nom_utilisateur_commercial in clients:
             table.add_row(
                 str(client.id),
                 client.nom_complet,
@@ -143,10 +212,79 @@ def display_clients_of_collaborateur_connected(nom_utilisateur) -> None:
                 client.nom_entreprise,
                 client.date_de_creation.strftime("%Y-%m-%d"),
                 client.derniere_maj_contact.strftime("%Y-%m-%d"),
-                nom_utilisateur_commercial,
+                nom_utilisateur_commercial or "Inconnu",
                 str(client.collaborateur_id),
             )
         print("Liste de vos clients: ")
         console.print(table)
     else:
         print("aucun collaborateur connecté")
+
+
+def display_client_360(client: Optional[Client]) -> None:
+    """
+    Affiche la fiche complète d'un client : ses informations, son commercial,
+    ses contrats et ses événements.
+
+    Args:
+        client (Client): Le client chargé par get_client_360, ou None.
+    """
+    if client is None:
+        print("Client introuvable.")
+        return
+
+    fiche = Table(show_header=False, title=f"Fiche client n°{client.id}")
+    fiche.add_row("Nom complet", client.nom_complet)
+    fiche.add_row("Email", client.email)
+    fiche.add_row("Téléphone", str(client.telephone))
+    fiche.add_row("Entreprise", str(client.nom_entreprise))
+    fiche.add_row("Date de création", str(client.date_de_creation))
+    fiche.add_row("Dernière mise à jour du contact", str(client.derniere_maj_contact))
+    fiche.add_row(
+        "Commercial",
+        client.collaborateur.nom_utilisateur if client.collaborateur else "Inconnu",
+    )
+    fiche.add_row("Nombre de contrats", str(client.nb_contrats))
+    fiche.add_row("Montant total des contrats", str(client.montant_total_contrats))
+    fiche.add_row("Reste à payer", str(client.montant_restant_contrats))
+    console.print(fiche)
+
+    contracts = Table(
+        show_header=True, header_style="bold cyan", title="Contrats du client"
+    )
+    contracts.add_column("ID du contrat")
+    contracts.add_column("Contact commercial")
+    contracts.add_column("Montant total")
+    contracts.add_column("Montant restant à payer")
+    contracts.add_column("Statut")
+    for contract in sorted(client.contracts, key=lambda contract: contract.id):
+        contracts.add_row(
+            str(contract.id),
+            contract.contact_commercial,
+            str(contract.montant_total),
+            str(contract.montant_restant_a_payer),
+            contract.statut_contrat,
+        )
+    console.print(contracts)
+
+    events = Table(
+        show_header=True, header_style="bold cyan", title="Événements du client"
+    )
+    events.add_column("ID de l'événement")
+    events.add_column("ID du contrat")
+    events.add_column("Date de début")
+    events.add_column("Date de fin")
+    events.add_column("Support")
+    events.add_column("Lieu")
+    events.add_column("Participants")
+    for event in sorted(client.events, key=lambda event: (event.date_debut, event.id)):
+        events.add_row(
+            str(event.id),
+            str(event.contract_id),
+            str(event.date_debut),
+            str(event.date_fin),
+            event.collaborateur.nom_utilisateur if event.collaborateur else "Aucun",
+            str(event.lieu),
+            str(event.participants),
+        )
+    console.print(events)
@@ -1,6 +1,7 @@
 import getpass
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session as DbSession
 from rich.table import Table
 from models.collaborateur import Collaborateur
 from views.main_view import console
@@ -80,22 +81,31 @@ def display_list_of_collaborateurs(collaborateurs: List[Collaborateur]) -> None:
     table.add_column("ID utilisateur")
     table.add_column("Nom d'utilisateur")
     table.add_column("Rôle")
+    table.add_column("Clients", justify="right")
+    table.add_column("Contrats", justify="right")
+    table.add_column("Événements", justify="right")
 
     for collaborateur in collaborateurs:
         table.add_row(
             str(collaborateur.id),
             collaborateur.nom_utilisateur,
             collaborateur.role,
+            str(collaborateur.nb_clients),
+            str(collaborateur.nb_contrats),
+            str(collaborateur.nb_evenements),
         )
     print("Voici la liste des collaborateurs chez Epicevents: ")
     console.print(table)
 
 
-def display_list_of_commercial() -> None:
+def display_list_of_commercial(session: Optional[DbSession] = None) -> None:
     """
     Affiche la liste de tous les commerciaux disponibles.
+
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
     """
-    commercials = get_all_commercial()
+    commercials = get_all_commercial(session=session) or []
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID commercial")
     table.add_column("Nom d'utilisateur du commercial")
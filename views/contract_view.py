@@ -1,10 +1,11 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session as DbSession
 from controllers.client_controller import get_client_by_id
-from controllers.collaborateur_controlleur import (
-    get_collaborateur_id_connected,
-    get_support_name,
+from controllers.collaborateur_controlleur import get_collaborateur_id_connected
+from controllers.contract_controller import (
+    ContractRow,
+    get_contracts_filter_by_collaborateur,
 )
-from controllers.contract_controller import get_contracts_filter_by_collaborateur
 import datetime
 from rich.table import Table
 from models.contract import Contract
@@ -13,22 +14,26 @@ from views.collaborateur_view import display_list_of_commercial
 
 
 def get_contract_details(
-    client_id: int, nom_utilisateur: str
+    client_id: int, nom_utilisateur: str, session: Optional[DbSession] = None
 ) -> Tuple[int, int, int, str, str, str]:
     """
     Récupère automatiquement les détails du contrat en fonction de l'ID du client et du collaborateur connecté.
 
     Args:
         client_id (int): L'identifiant du client associé au contrat.
+        nom_utilisateur (str): Le nom d'utilisateur du collaborateur connecté.
+        session (Session, optional): La session de l'unité de travail en cours.
 
     Returns:
         tuple: Les détails du contrat.
     """
-    collaborateur_id, _ = get_collaborateur_id_connected(nom_utilisateur)
-    client = get_client_by_id(client_id)
+    collaborateur_id, _ = get_collaborateur_id_connected(
+        nom_utilisateur, session=session
+    )
+    client = get_client_by_id(client_id, session=session)
 
     if client and collaborateur_id:
-        display_list_of_commercial()
+        display_list_of_commercial(session=session)
         contact_commercial = input(
             "Entrez l'id du commercial auquel sera rattacher le contrat"
         )
@@ -94,15 +99,17 @@ def update_contract_view(contract_id: int, current_values: Any) -> Dict[str, str
     return new_values
 
 
-def display_list_of_contracts(contracts: List[Contract]) -> None:
+def display_list_of_contracts(contracts: List[ContractRow]) -> None:
     """
     Affiche la liste des contrats.
 
     Args:
-        contrats (list): La liste des contrats à afficher.
+        contrats (list): La liste des triplets (contrat, nom du support, nom du client)
+                         à afficher.
     """
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID du client concerné")
+    table.add_column("Nom du client")
     table.add_column("Nom du contact commercial")
     table.add_column("Nom du support")
     table.add_column("ID du contrat")
@@ -110,14 +117,12 @@ def display_list_of_contracts(contracts: List[Contract]) -> None:
     table.add_column("Montant restant à payer en €")
     table.add_column("Statut du contrat")
 
-    for contract in contracts:
-
-        support_name = get_support_name(contract.collaborateur_id)
-
+    for contract, support_name, client_name in contracts:
         table.add_row(
             str(contract.client_id),
+            client_name or "Client introuvable",
             contract.contact_commercial,
-            support_name,
+            support_name or "Support introuvable",
             str(contract.id),
             f"{str(contract.montant_total)} €",
             f"{str(contract.montant_restant_a_payer)} €",
@@ -127,12 +132,18 @@ def display_list_of_contracts(contracts: List[Contract]) -> None:
     console.print(table)
 
 
-def display_contracts_of_collaborateur_connected(nom_utilisateur) -> List[Contract]:
+def display_contracts_of_collaborateur_connected(
+    nom_utilisateur, session: Optional[DbSession] = None
+) -> List[Contract]:
     """
     Affiche les contrats du collaborateur connecté.
+
+    Args:
+        nom_utilisateur (str): Le nom d'utilisateur du collaborateur connecté.
+        session (Session, optional): La session de l'unité de travail en cours.
     """
-    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur)
-    contracts = get_contracts_filter_by_collaborateur(collaborateur_id)
+    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur, session=session)
+    contracts = get_contracts_filter_by_collaborateur(collaborateur_id, session=session)
     print(collaborateur_id)
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID du contrat")
@@ -142,7 +153,7 @@ def display_contracts_of_collaborateur_connected(nom_utilisateur) -> List[Contra
     table.add_column("Montant total")
     table.add_column("Montant restant à payer")
     table.add_column("Statut du contrat")
-    for contract in contracts:
+    for contract, _, _ in contracts:
         table.add_row(
             str(contract.id),
             str(contract.client_id),
@@ -0,0 +1,96 @@
+from rich.table import Table
+from typing import Dict, Optional
+from database.db_config import get_pool_metrics, query_monitor
+from database.tracing import get_latency_report
+from views.main_view import console
+
+
+def display_pool_metrics() -> None:
+    """
+    Affiche les métriques du pool de connexions à la base de données.
+    """
+    metrics = get_pool_metrics()
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Métrique")
+    table.add_column("Valeur")
+    for name, value in metrics.items():
+        table.add_row(name, str(value))
+    print("Etat du pool de connexions : ")
+    console.print(table)
+
+
+def display_latency_report(
+    report: Optional[Dict[str, Dict[str, float]]] = None,
+) -> None:
+    """
+    Affiche le nombre d'appels et les temps de réponse de chaque opération.
+
+    Args:
+        report (dict, optional): Le résumé des durées par opération. Par défaut,
+                                 celui des opérations mesurées par ce processus.
+    """
+    report = get_latency_report() if report is None else report
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Opération", overflow="fold")
+    for column in ("Appels", "Moyenne", "p50", "p90", "p99", "Max"):
+        table.add_column(column, justify="right")
+    for name, summary in report.items():
+        table.add_row(
+            name,
+            str(summary["count"]),
+            *(
+                f"{summary[key]:.2f} ms"
+                for key in ("mean_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms")
+            ),
+        )
+    print("Temps de réponse par opération : ")
+    console.print(table)
+
+
+def display_query_metrics() -> None:
+    """
+    Affiche les requêtes SQL de chaque action, puis les dernières requêtes
+    lentes et répétées.
+    """
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Action", overflow="fold")
+    for column in ("Exécutions", "Requêtes", "Max", "Lignes", "Objets", "SQL", "N+1"):
+        table.add_column(column, justify="right")
+    for name, totals in query_monitor.report().items():
+        table.add_row(
+            name,
+            str(totals["actions"]),
+            str(totals["queries"]),
+            str(totals["max_queries"]),
+            str(totals["rows"]),
+            str(totals["loaded"]),
+            f"{totals['sql_ms']:.1f} ms",
+            str(totals["repeated"]),
+        )
+    print("Requêtes SQL par action : ")
+    console.print(table)
+
+    slow = Table(show_header=True, header_style="bold cyan")
+    slow.add_column("Durée", justify="right")
+    slow.add_column("Opération", overflow="fold")
+    slow.add_column("Requête et paramètres", overflow="fold")
+    for query in query_monitor.slow_queries:
+        slow.add_row(
+            f"{query['elapsed_ms']:.1f} ms",
+            query["operation"],
+            f"{query['statement']} {query['parameters']}",
+        )
+    print(f"Requêtes de plus de {query_monitor.slow_query_ms:g} ms : ")
+    console.print(slow)
+
+    repeated = Table(show_header=True, header_style="bold cyan")
+    repeated.add_column("Action", overflow="fold")
+    repeated.add_column("Fois", justify="right")
+    repeated.add_column("Requête", overflow="fold")
+    for query in query_monitor.repeated:
+        repeated.add_row(query["action"], str(query["count"]), query["statement"])
+    print(
+        f"Requêtes répétées au moins {query_monitor.repeated_statements} fois "
+        "dans une action : "
+    )
+    console.print(repeated)
@@ -1,29 +1,35 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session as DbSession
 from controllers.collaborateur_controlleur import (
     get_only_id_collaborateur,
     get_collaborateur_id_connected,
 )
-from controllers.event_controller import (
-    get_events_filter_by_collaborateur,
-    get_events_filter_by_date_passed,
-    get_events_filter_by_date_future,
-)
+from controllers.event_controller import get_events_filter_by_collaborateur
 import datetime
 from rich.table import Table
 from models.event import Events
 from views.main_view import console
-from datetime import datetime
+from datetime import date, datetime
 
 
-def get_event_details() -> Tuple[str, str, int, str, str, str, str, str]:
+def get_event_details(
+    session: Optional[DbSession] = None, token: Optional[str] = None
+) -> Tuple[str, str, int, str, str, str, str, str]:
     """
     Demande et renvoie les détails de l'événement saisis par l'utilisateur.
 
+    Args:
+        session (Session, optional): La session de l'unité de travail en cours.
+        token (str, optional): Le jeton de session du collaborateur qui saisit
+                               l'événement. Par défaut, celui de ce processus.
+
     Returns:
         tuple: Les détails de l'événement saisis par l'utilisateur.
     """
     contract_id = input("Entrez l'identifiant contrat: ")
-    client_name = input("Entrez le nom du client associé au contrat: ")
+    client_name = input(
+        "Entrez le nom du client associé au contrat (vide pour celui du contrat): "
+    )
 
     date_debut = input("Entrez la date du début de l'évènement: ")
     date_fin = input("Entrez la date de fin de l'évènement: ")
@@ -31,7 +37,7 @@ def get_event_details() -> Tuple[str, str, int, str, str, str, str, str]:
     lieu = input("Entrez le lieu de l'évenement: ")
     participants = input("Renseignez le nombre de participants: ")
     notes = input("Informations supplémentaires: ")
-    collaborateur_id = get_only_id_collaborateur()
+    collaborateur_id = get_only_id_collaborateur(session=session, token=token)
 
     return (
         contract_id,
@@ -46,6 +52,24 @@ def get_event_details() -> Tuple[str, str, int, str, str, str, str, str]:
     )
 
 
+def get_events_period() -> Tuple[date, date]:
+    """
+    Demande la période dont on veut connaître les événements.
+
+    Returns:
+        tuple: Les dates de début et de fin, incluses.
+
+    Raises:
+        ValueError: Si une date n'est pas au format AAAA-MM-JJ.
+    """
+    start = input("Date de début (AAAA-MM-JJ) : ")
+    end = input("Date de fin (AAAA-MM-JJ) : ")
+    return (
+        datetime.strptime(start.strip(), "%Y-%m-%d").date(),
+        datetime.strptime(end.strip(), "%Y-%m-%d").date(),
+    )
+
+
 def update_event_view(event_id: int, current_values: Dict[str, Any]) -> Dict[str, Any]:
     """
     Affiche la vue de mise à jour de l'événement.
@@ -96,6 +120,16 @@ def update_event_view(event_id: int, current_values: Dict[str, Any]) -> Dict[str
     return new_values
 
 
+def client_name_of(event: Events) -> str:
+    """
+    Renvoie le nom actuel du client de l'événement, chargé par jointure sur
+    client_id, ou à défaut le nom saisi à la création de l'événement.
+    """
+    if event.client is not None:
+        return event.client.nom_complet
+    return event.client_name
+
+
 def display_list_of_events(events: List[Dict[str, Any]]) -> List[Events]:
     """
     Affiche la liste des événements.
@@ -116,7 +150,7 @@ def display_list_of_events(events: List[Dict[str, Any]]) -> List[Events]:
     for event in events:
         table.add_row(
             str(event.contract_id),
-            event.client_name,
+            client_name_of(event),
             str(event.collaborateur_id),
             event.date_debut.strftime("%Y-%m-%d"),
             event.date_fin.strftime("%Y-%m-%d"),
@@ -130,12 +164,18 @@ def display_list_of_events(events: List[Dict[str, Any]]) -> List[Events]:
     console.print(table)
 
 
-def display_events_of_collaborateur_connected(nom_utilisateur) -> List[Events]:
+def display_events_of_collaborateur_connected(
+    nom_utilisateur, session: Optional[DbSession] = None
+) -> List[Events]:
     """
     Affiche les événements du collaborateur connecté.
+
+    Args:
+        nom_utilisateur (str): Le nom d'utilisateur du collaborateur connecté.
+        session (Session, optional): La session de l'unité de travail en cours.
     """
-    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur)
-    events = get_events_filter_by_collaborateur(collaborateur_id)
+    collaborateur_id = get_collaborateur_id_connected(nom_utilisateur, session=session)
+    events = get_events_filter_by_collaborateur(collaborateur_id, session=session)
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID de l'évenement")
     table.add_column("Nom complet du client")
@@ -162,11 +202,13 @@ def display_events_of_collaborateur_connected(nom_utilisateur) -> List[Events]:
     console.print(table)
 
 
-def display_events_passed() -> List[Events]:
+def display_events_passed(past_events: List[Events]) -> None:
     """
-    Affiche les événements passés.
+    Affiche une page d'événements passés.
+
+    Args:
+        past_events (list): Les événements passés, des plus récents aux plus anciens.
     """
-    past_events = get_events_filter_by_date_passed()
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID de l'événement")
     table.add_column("Nom complet du client")
@@ -180,7 +222,7 @@ def display_events_passed() -> List[Events]:
     for event in past_events:
         table.add_row(
             str(event.id),
-            str(event.contract_id),
+            client_name_of(event),
             str(event.collaborateur_id),
             event.date_debut.strftime("%Y-%m-%d %H:%M:%S"),
             event.date_fin.strftime("%Y-%m-%d %H:%M:%S"),
@@ -193,11 +235,13 @@ def display_events_passed() -> List[Events]:
     console.print(table)
 
 
-def display_events_future():
+def display_events_future(upcoming_events: List[Events]) -> None:
     """
-    Affiche les événements à venir.
+    Affiche une page d'événements à venir.
+
+    Args:
+        upcoming_events (list): Les événements à venir, par date de début.
     """
-    past_events = get_events_filter_by_date_future()
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("ID de l'événement")
     table.add_column("Nom complet du client")
@@ -208,10 +252,10 @@ def display_events_future():
     table.add_column("Lieu de l'événement")
     table.add_column("Nombre de participants")
     table.add_column("Notes")
-    for event in past_events:
+    for event in upcoming_events:
         table.add_row(
             str(event.id),
-            str(event.client_name),
+            client_name_of(event),
             str(event.collaborateur_id),
             event.date_debut.strftime("%Y-%m-%d %H:%M:%S"),
             event.date_fin.strftime("%Y-%m-%d %H:%M:%S"),
@@ -2,13 +2,15 @@ from views.main_view import console
 from rich.prompt import Prompt
 import sys
 import sentry_sdk
+from database.db_config import record_queries, session_scope
+from database.tracing import span
 from controllers.client_controller import (
     create_client,
     get_client_by_id,
+    get_client_360,
     update_client,
     delete_client,
-    get_clients_filtered,
-    get_clients,
+    get_clients_page,
 )
 
 from controllers.contract_controller import (
@@ -16,8 +18,8 @@ from controllers.contract_controller import (
     get_contract_by_id,
     update_contract,
     delete_contract,
-    get_contracts_filter_by_price,
-    get_all_contracts,
+    get_contracts_by_price_page,
+    get_all_contracts_page,
 )
 from controllers.collaborateur_controlleur import (
     create_collaborateur,
@@ -25,24 +27,27 @@ from controllers.collaborateur_controlleur import (
     get_collaborateur_by_id,
     update_collaborateur,
     delete_collaborateur,
-    get_collaborateurs_filtered,
+    get_collaborateurs_page,
     get_collaborateur_id_connected,
     disconnection_collaborateur,
 )
 from controllers.event_controller import (
     create_event,
     get_event_by_id,
-    get_events_filter_by_date,
+    get_events_between,
+    get_events_page,
     update_event,
     delete_event,
     get_events_filter_by_date_passed,
-    get_all_events,
+    get_past_events_page,
+    get_upcoming_events_page,
 )
 
 from views.client_view import (
-    display_clients_of_collaborateur_connected,
+    display_client_360,
     display_list_of_clients,
     get_client_details,
+    prompt_client_id,
     update_client_view,
 )
 from views.collaborateur_view import (
@@ -65,7 +70,16 @@ from views.event_view import (
     display_events_passed,
     display_events_future,
     display_events_of_collaborateur_connected,
+    get_events_period,
 )
+from views.database_view import (
+    display_latency_report,
+    display_pool_metrics,
+    display_query_metrics,
+)
+from views.pagination_view import browse_pages
+from views.report_view import display_revenue_report, get_report_period
+from views.search_view import display_search_results
 from views.main_view import (
     display_success_message,
     display_error_message,
@@ -119,274 +133,402 @@ def display_menu() -> str:
     console.print("15. Afficher la liste de tous les événements classés par date")
     console.print("16. Afficher la liste de tous les événements passés")
     console.print("17. Afficher la liste de tous les événements à venir")
+    console.print("18. Afficher les métriques du pool de connexions")
+    console.print("19. Afficher la fiche complète d'un client")
+    console.print("20. Rechercher un client ou un événement")
+    console.print("21. Afficher le rapport de chiffre d'affaires")
+    console.print("22. Afficher les événements entre deux dates")
+    console.print("23. Afficher les temps de réponse par opération")
+    console.print("24. Afficher les requêtes SQL par action")
     console.print("[red]exit. Quitter")
     console.rule(style="bright_yellow")
     return Prompt.ask("Entrez votre choix ")
 
 
+# Nombre d'options du menu : les autres saisies sont mesurées sous un même nom.
+MENU_OPTIONS = 24
+
+
+def _menu_operation(action: str) -> str:
+    if action.isdigit() and 1 <= int(action) <= MENU_OPTIONS:
+        return f"menu.option_{action}"
+    return "menu.option_invalide"
+
+
 def handle_menu_options(nom_utilisateur):
+    """
+    Boucle principale du menu pour le collaborateur connecté.
+
+    Chaque action est mesurée comme une opération du traceur (saisies de
+    l'utilisateur comprises) et ses requêtes SQL sont comptées. Les saisies se
+    font hors de toute transaction : les lectures qui les précèdent ouvrent
+    chacune une unité de travail brève, et l'écriture finale ouvre la sienne
+    autour des seuls appels aux contrôleurs. Aucune connexion ni aucun verrou
+    n'est ainsi gardé pendant que l'utilisateur tape.
+
+    Args:
+        nom_utilisateur (str): Le nom d'utilisateur du collaborateur connecté.
+    """
     while True:
         action = display_menu()
-        if action == "1":
-            collaborateur_id = input("Entrez votre identifiant d'utilisateur : ")
-            current_collaborateur = get_collaborateur_by_id(collaborateur_id)
-            if current_collaborateur:
-                new_values = update_collaborateur_view(
-                    collaborateur_id, current_collaborateur
-                )
-                try:
-                    update_collaborateur(collaborateur_id, new_values)
-                    display_success_message(
-                        "Identifiant utilisateur modifié avec succès !"
-                    )
-                except:
-                    display_error_message(
-                        "Erreur lors de la modification de l'identifiant utilisateur."
-                    )
-            else:
-                display_error_message("Utilisateur non trouvé.")
-        elif action == "2":
-            get_collaborateur_id_connected(nom_utilisateur)
-            print(nom_utilisateur)
-
-            confirm = input(
-                "Êtes-vous sûr de vouloir supprimer votre compte utilisateur? (oui/non) : "
-            )
-            if confirm.lower() == "oui":
-                try:
-                    delete_collaborateur(nom_utilisateur)
-                    display_success_message("Collaborateur supprimé avec succès !")
-                except:
-                    display_error_message(
-                        "Erreur lors de la suppression du collaborateur."
-                    )
-            else:
-                display_error_message("Suppression annulée.")
-        elif action == "3":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            try:
-                if (
-                    collaborateur_id and collaborateur_role == "commercial"
-                ):  # Vérifiez si le collaborateur a un rôle commercial
-                    client_details = get_client_details()
-                    create_client(
-                        *client_details[:-1],
-                        collaborateur_id=collaborateur_id,
-                    )  # Passez collaborateur_id explicitement
-                    display_success_message("Client ajouté avec succès !")
-                else:
-                    print(
-                        "Vous n'avez pas les droits pour créer une fiche client ou votre rôle n'est pas 'commercial'."
+        if action == "exit":
+            print("Déconnexion en cours...")
+            disconnection_collaborateur()
+            print("Au revoir !")
+            sys.exit()
+        operation = _menu_operation(action)
+        with span(operation), record_queries(operation):
+            if action == "1":
+                collaborateur_id = input("Entrez votre identifiant d'utilisateur : ")
+                current_collaborateur = get_collaborateur_by_id(collaborateur_id)
+                if current_collaborateur:
+                    new_values = update_collaborateur_view(
+                        collaborateur_id, current_collaborateur
                     )
-            except Exception as e:
-                display_error_message(f"Erreur lors de l'ajout du client : {str(e)}")
-        elif action == "4":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "commercial":
-                display_clients_of_collaborateur_connected(nom_utilisateur)
-                client_id = input(
-                    "Entrez l'ID du client que vous souhaitez mettre à jour : "
-                )
-
-                current_client = get_client_by_id(client_id)
-                if current_client:
-                    new_values = update_client_view(client_id, current_client)
                     try:
-                        update_client(client_id, new_values)
-                        display_success_message("Client modifié avec succès !")
-                    except Exception as e:
-                        sentry_sdk.capture_exception(e)
+                        with session_scope() as session:
+                            updated = update_collaborateur(
+                                collaborateur_id, new_values, session=session
+                            )
+                    except Exception:
                         display_error_message(
-                            f"Erreur lors de la modification du client: {str(e)}"
+                            "Erreur lors de la modification de l'identifiant utilisateur."
                         )
+                    else:
+                        if updated:
+                            display_success_message(
+                                "Identifiant utilisateur modifié avec succès !"
+                            )
+                        else:
+                            display_success_message("Aucune modification.")
                 else:
-                    display_error_message("Client non trouvé.")
-            else:
-                display_error_message(
-                    "Vous devez être un commercial pour modifier un client."
-                )
-        elif action == "5":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "commercial":
-                display_clients_of_collaborateur_connected(nom_utilisateur)
-                client_id = input(
-                    "Entrez l'ID du client que vous souhaitez supprimer : "
-                )
+                    display_error_message("Utilisateur non trouvé.")
+            elif action == "2":
+                get_collaborateur_id_connected(nom_utilisateur)
+                print(nom_utilisateur)
+
                 confirm = input(
-                    "Êtes-vous sûr de vouloir supprimer ce client? (oui/non) : "
+                    "Êtes-vous sûr de vouloir supprimer votre compte utilisateur? (oui/non) : "
                 )
                 if confirm.lower() == "oui":
                     try:
-                        delete_client(client_id)
-                        display_success_message("Client supprimé avec succès !")
-                    except:
+                        with session_scope() as session:
+                            delete_collaborateur(nom_utilisateur, session=session)
+                    except Exception:
                         display_error_message(
-                            "Erreur lors de la suppression du client."
+                            "Erreur lors de la suppression du collaborateur."
                         )
+                    else:
+                        display_success_message("Collaborateur supprimé avec succès !")
                 else:
                     display_error_message("Suppression annulée.")
-            else:
-                display_error_message(
-                    "Vous devez être un commercial pour supprimer un client."
+            elif action == "3":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-        elif action == "6":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "gestion":
-                clients = get_clients()
-                display_list_of_clients(clients)
-                client_id = input("Entrez l'identifiant du client : ")
                 try:
-                    contract_details = get_contract_details(client_id)
-                    create_contract(*contract_details)
-                    display_success_message("Contrat créé avec succès !")
+                    if (
+                        collaborateur_id and collaborateur_role == "commercial"
+                    ):  # Vérifiez si le collaborateur a un rôle commercial
+                        client_details = get_client_details(nom_utilisateur)
+                        with session_scope() as session:
+                            create_client(
+                                *client_details[:-1],
+                                collaborateur_id=collaborateur_id,
+                                session=session,
+                            )  # Passez collaborateur_id explicitement
+                        display_success_message("Client ajouté avec succès !")
+                    else:
+                        print(
+                            "Vous n'avez pas les droits pour créer une fiche client ou votre rôle n'est pas 'commercial'."
+                        )
                 except Exception as e:
-                    display_error_message(f"Erreur lors de l'ajout du contrat : {e}")
-            else:
-                display_error_message(
-                    "Vous devez être un gestionnaire pour créer un contrat."
-                )
-        elif action == "7":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "gestion" or collaborateur_role == "commercial":
-                display_contracts_of_collaborateur_connected(nom_utilisateur)
-                contract_id = input(
-                    "Entrez l'ID du contrat que vous souhaitez mettre à jour :"
-                )
-                current_contract = get_contract_by_id(contract_id)
-                if current_contract:
-                    new_values_contract = update_contract_view(
-                        contract_id, current_contract
+                    display_error_message(
+                        f"Erreur lors de l'ajout du client : {str(e)}"
                     )
-                try:
-                    update_contract(contract_id, new_values_contract)
-                    display_success_message("Contrat modifié avec succès !")
-                except:
-                    display_error_message(f"Erreur lors de la modification du contrat.")
-            else:
-                display_error_message(
-                    "Vous devez être un gestionnaire ou un commercial pour modifier un contrat."
+            elif action == "4":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-        elif action == "8":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "gestion":
-                display_contracts_of_collaborateur_connected(nom_utilisateur)
-                contract_id = input(
-                    "Entrez l'ID du contrat que vous souhaitez supprimer : "
+                if collaborateur_role == "commercial":
+                    client_id = prompt_client_id(
+                        "Entrez l'ID du client que vous souhaitez mettre à jour : ",
+                        collaborateur_id=collaborateur_id,
+                    )
+
+                    current_client = get_client_by_id(client_id)
+                    if current_client:
+                        new_values = update_client_view(client_id, current_client)
+                        try:
+                            with session_scope() as session:
+                                updated = update_client(
+                                    client_id, new_values, session=session
+                                )
+                        except Exception as e:
+                            sentry_sdk.capture_exception(e)
+                            display_error_message(
+                                f"Erreur lors de la modification du client: {str(e)}"
+                            )
+                        else:
+                            if updated:
+                                display_success_message("Client modifié avec succès !")
+                            else:
+                                display_success_message("Aucune modification.")
+                    else:
+                        display_error_message("Client non trouvé.")
+                else:
+                    display_error_message(
+                        "Vous devez être un commercial pour modifier un client."
+                    )
+            elif action == "5":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-                confirm = input(
-                    "Êtes-vous sûr de vouloir supprimer ce contrat ? (oui/non) : "
+                if collaborateur_role == "commercial":
+                    client_id = prompt_client_id(
+                        "Entrez l'ID du client que vous souhaitez supprimer : ",
+                        collaborateur_id=collaborateur_id,
+                    )
+                    confirm = input(
+                        "Êtes-vous sûr de vouloir supprimer ce client? (oui/non) : "
+                    )
+                    if confirm.lower() == "oui":
+                        try:
+                            with session_scope() as session:
+                                delete_client(client_id, session=session)
+                        except Exception:
+                            display_error_message(
+                                "Erreur lors de la suppression du client."
+                            )
+                        else:
+                            display_success_message("Client supprimé avec succès !")
+                    else:
+                        display_error_message("Suppression annulée.")
+                else:
+                    display_error_message(
+                        "Vous devez être un commercial pour supprimer un client."
+                    )
+            elif action == "6":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-                if confirm.lower() == "oui":
+                if collaborateur_role == "gestion":
+                    client_id = prompt_client_id("Entrez l'identifiant du client : ")
                     try:
-                        delete_contract(contract_id)
-                        display_success_message("Contrat supprimé avec succès !")
-                    except:
+                        contract_details = get_contract_details(
+                            client_id, nom_utilisateur
+                        )
+                        with session_scope() as session:
+                            create_contract(
+                                *contract_details, nom_utilisateur, session=session
+                            )
+                        display_success_message("Contrat créé avec succès !")
+                    except Exception as e:
                         display_error_message(
-                            "Erreur lors de la suppression du contrat."
+                            f"Erreur lors de l'ajout du contrat : {e}"
                         )
                 else:
-                    display_error_message("Suppression annulée.")
-            else:
-                display_error_message(
-                    "Vous devez être un gestionnaire pour supprimer un contrat."
+                    display_error_message(
+                        "Vous devez être un gestionnaire pour créer un contrat."
+                    )
+            elif action == "7":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-        elif action == "9":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "commercial":
-                contracts = get_all_contracts()
-                display_list_of_contracts(contracts)
-                event_details = get_event_details()
-                print(event_details)
-                try:
-                    create_event(*event_details)
-                    display_success_message("Evenement créer avec succès!")
-                except Exception as e:
-                    display_error_message(f"Erreur lors de l'ajout de l'évenement: {e}")
-            else:
-                display_error_message(
-                    "Vous devez être un commercial pour créer un évenement."
+                if (
+                    collaborateur_role == "gestion"
+                    or collaborateur_role == "commercial"
+                ):
+                    display_contracts_of_collaborateur_connected(nom_utilisateur)
+                    contract_id = input(
+                        "Entrez l'ID du contrat que vous souhaitez mettre à jour :"
+                    )
+                    current_contract = get_contract_by_id(contract_id)
+                    if current_contract:
+                        new_values_contract = update_contract_view(
+                            contract_id, current_contract
+                        )
+                        try:
+                            with session_scope() as session:
+                                updated = update_contract(
+                                    contract_id, new_values_contract, session=session
+                                )
+                        except Exception as e:
+                            display_error_message(
+                                f"Erreur lors de la modification du contrat : {e}"
+                            )
+                        else:
+                            if updated:
+                                display_success_message("Contrat modifié avec succès !")
+                            else:
+                                display_success_message("Aucune modification.")
+                    else:
+                        display_error_message("Contrat non trouvé.")
+                else:
+                    display_error_message(
+                        "Vous devez être un gestionnaire ou un commercial pour modifier un contrat."
+                    )
+            elif action == "8":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-        elif action == "10":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "support":
-                events = get_all_events()
-                display_list_of_events(events)
-                event_id = input(
-                    "Entrez l'ID de l'évenement que vous souhaitez mettre à jour :"
+                if collaborateur_role == "gestion":
+                    display_contracts_of_collaborateur_connected(nom_utilisateur)
+                    contract_id = input(
+                        "Entrez l'ID du contrat que vous souhaitez supprimer : "
+                    )
+                    confirm = input(
+                        "Êtes-vous sûr de vouloir supprimer ce contrat ? (oui/non) : "
+                    )
+                    if confirm.lower() == "oui":
+                        try:
+                            with session_scope() as session:
+                                delete_contract(contract_id, session=session)
+                        except ValueError as e:
+                            display_error_message(
+                                f"Suppression du contrat impossible : {e}"
+                            )
+                        except Exception:
+                            display_error_message(
+                                "Erreur lors de la suppression du contrat."
+                            )
+                        else:
+                            display_success_message("Contrat supprimé avec succès !")
+                    else:
+                        display_error_message("Suppression annulée.")
+                else:
+                    display_error_message(
+                        "Vous devez être un gestionnaire pour supprimer un contrat."
+                    )
+            elif action == "9":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-                current_event = get_event_by_id(event_id)
-                if current_event:
-                    new_values_event = update_event_view(event_id, current_event)
-                try:
-                    update_event(event_id, new_values_event)
-                    display_success_message("Evenement modifié avec succès !")
-                except:
+                if collaborateur_role == "commercial":
+                    browse_pages(get_all_contracts_page, display_list_of_contracts)
+                    event_details = get_event_details()
+                    print(event_details)
+                    try:
+                        with session_scope() as session:
+                            create_event(*event_details, session=session)
+                        display_success_message("Evenement créer avec succès!")
+                    except Exception as e:
+                        display_error_message(
+                            f"Erreur lors de l'ajout de l'évenement: {e}"
+                        )
+                else:
                     display_error_message(
-                        f"Erreur lors de la modification de l'evenement."
+                        "Vous devez être un commercial pour créer un évenement."
                     )
-            else:
-                display_error_message(
-                    "Vous devez être un membre du département support pour modifier un évenement."
+            elif action == "10":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-        elif action == "11":
-            collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
-                nom_utilisateur
-            )
-            if collaborateur_role == "support":
-                events = get_all_events()
-                display_list_of_events(events)
-                event_id = input(
-                    "Entrez l'ID de l'évenement que vous souhaitez supprimer : "
+                if collaborateur_role == "support":
+                    browse_pages(get_events_page, display_list_of_events)
+                    event_id = input(
+                        "Entrez l'ID de l'évenement que vous souhaitez mettre à jour :"
+                    )
+                    current_event = get_event_by_id(event_id)
+                    if current_event:
+                        new_values_event = update_event_view(event_id, current_event)
+                        try:
+                            with session_scope() as session:
+                                updated = update_event(
+                                    event_id, new_values_event, session=session
+                                )
+                        except Exception as e:
+                            display_error_message(
+                                f"Erreur lors de la modification de l'evenement: {e}"
+                            )
+                        else:
+                            if updated:
+                                display_success_message(
+                                    "Evenement modifié avec succès !"
+                                )
+                            else:
+                                display_success_message("Aucune modification.")
+                    else:
+                        display_error_message("Evènement introuvable.")
+                else:
+                    display_error_message(
+                        "Vous devez être un membre du département support pour modifier un évenement."
+                    )
+            elif action == "11":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
                 )
-                confirm = input(
-                    "Êtes-vous sûr de vouloir supprimer cet évenement ? (oui/non) : "
+                if collaborateur_role == "support":
+                    browse_pages(get_events_page, display_list_of_events)
+                    event_id = input(
+                        "Entrez l'ID de l'évenement que vous souhaitez supprimer : "
+                    )
+                    confirm = input(
+                        "Êtes-vous sûr de vouloir supprimer cet évenement ? (oui/non) : "
+                    )
+                    if confirm.lower() == "oui":
+                        try:
+                            with session_scope() as session:
+                                delete_event(event_id, session=session)
+                        except Exception:
+                            display_error_message(
+                                "Erreur lors de la suppression de l'évenement."
+                            )
+                        else:
+                            display_success_message("Evenement supprimé avec succès !")
+                    else:
+                        display_error_message("Suppression annulée.")
+            elif action == "12":
+                browse_pages(get_clients_page, display_list_of_clients)
+            elif action == "13":
+                browse_pages(get_collaborateurs_page, display_list_of_collaborateurs)
+            elif action == "14":
+                browse_pages(get_contracts_by_price_page, display_list_of_contracts)
+            elif action == "15":
+                browse_pages(get_events_page, display_list_of_events)
+            elif action == "16":
+                browse_pages(get_past_events_page, display_events_passed)
+            elif action == "17":
+                browse_pages(get_upcoming_events_page, display_events_future)
+            elif action == "18":
+                display_pool_metrics()
+            elif action == "19":
+                client_id = input("Entrez l'ID du client : ")
+                display_client_360(get_client_360(client_id))
+            elif action == "20":
+                query = input(
+                    "Mots recherchés (nom, email, entreprise, lieu, notes) : "
                 )
-                if confirm.lower() == "oui":
+                with session_scope() as session:
+                    display_search_results(query, session=session)
+            elif action == "21":
+                collaborateur_id, collaborateur_role = get_collaborateur_id_connected(
+                    nom_utilisateur
+                )
+                if collaborateur_role == "gestion":
                     try:
-                        delete_event(event_id)
-                        display_success_message("Evenement supprimé avec succès !")
-                    except:
+                        since, until = get_report_period()
+                    except ValueError:
                         display_error_message(
-                            "Erreur lors de la suppression de l'évenement."
+                            "Date invalide, format attendu AAAA-MM-JJ."
                         )
+                    else:
+                        with session_scope() as session:
+                            display_revenue_report(since, until, session=session)
                 else:
-                    display_error_message("Suppression annulée.")
-        elif action == "12":
-            clients = get_clients_filtered()
-            display_list_of_clients(clients)
-        elif action == "13":
-            collaborateurs = get_collaborateurs_filtered()
-            display_list_of_collaborateurs(collaborateurs)
-        elif action == "14":
-            contracts = get_contracts_filter_by_price()
-            display_list_of_contracts(contracts)
-        elif action == "15":
-            events = get_events_filter_by_date()
-            display_list_of_events(events)
-        elif action == "16":
-            display_events_passed()
-        elif action == "17":
-            display_events_future()
-        elif action == "exit":
-            print("Déconnexion en cours...")
-            disconnection_collaborateur()
-            print("Au revoir !")
-            sys.exit()
-        else:
-            display_error_message("Option non valide. Veuillez réessayer.")
+                    display_error_message(
+                        "Vous devez être un gestionnaire pour consulter ce rapport."
+                    )
+            elif action == "22":
+                try:
+                    start, end = get_events_period()
+                except ValueError:
+                    display_error_message("Date invalide, format attendu AAAA-MM-JJ.")
+                else:
+                    display_list_of_events(get_events_between(start, end))
+            elif action == "23":
+                display_latency_report()
+            elif action == "24":
+                display_query_metrics()
+            else:
+                display_error_message("Option non valide. Veuillez réessayer.")
@@ -0,0 +1,46 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+from rich.prompt import Prompt
+from database.pagination import Cursor, Page
+
+# Un seul thread suffit : on ne précharge jamais que la page suivante.
+_prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+
+def browse_pages(
+    fetch_page: Callable[[Optional[Cursor]], Page],
+    display_page: Callable[[List[Any]], None],
+) -> None:
+    """
+    Affiche une liste page par page en préchargeant la page suivante.
+
+    Pendant que l'utilisateur lit une page, la suivante est récupérée en
+    arrière-plan dans un autre thread, avec sa propre session.
+
+    Args:
+        fetch_page (callable): Fonction renvoyant la page qui suit le curseur donné
+                               (None pour la première page).
+        display_page (callable): Fonction affichant les lignes d'une page.
+    """
+    page = fetch_page(None)
+    number = 1
+    while True:
+        next_page = None
+        if page.has_next:
+            # Le contexte est copié : la requête reste rattachée à l'action en
+            # cours (traçage, comptage des requêtes).
+            next_page = _prefetcher.submit(
+                contextvars.copy_context().run, fetch_page, page.next_cursor
+            )
+        display_page(page.items)
+        if next_page is None:
+            return
+        choice = Prompt.ask(
+            f"Page {number} - [s]uivante ou [q]uitter", choices=["s", "q"], default="s"
+        )
+        if choice == "q":
+            next_page.cancel()
+            return
+        page = next_page.result()
+        number += 1
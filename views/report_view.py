@@ -0,0 +1,96 @@
+import datetime
+from typing import List, Optional, Tuple
+from rich.table import Table
+from sqlalchemy.orm import Session as DbSession
+from controllers.report_controller import (
+    RevenueLine,
+    revenue_by_client,
+    revenue_by_commercial,
+    revenue_by_statut,
+    revenue_totals,
+)
+from views.main_view import console
+
+
+def get_report_period() -> Tuple[Optional[datetime.date], Optional[datetime.date]]:
+    """
+    Demande la période du rapport, sur la date de création des clients.
+
+    Returns:
+        tuple: Les dates de début et de fin incluses, None si laissées vides.
+
+    Raises:
+        ValueError: Si une date n'est pas au format AAAA-MM-JJ.
+    """
+    dates = []
+    for label in ("début", "fin"):
+        value = input(f"Date de {label} (AAAA-MM-JJ, vide pour ne pas borner) : ")
+        dates.append(datetime.date.fromisoformat(value.strip()) if value else None)
+    return dates[0], dates[1]
+
+
+def _revenue_table(title: str, heading: str, lines: List[RevenueLine]) -> Table:
+    table = Table(show_header=True, header_style="bold cyan", title=title)
+    table.add_column(heading)
+    table.add_column("Contrats", justify="right")
+    table.add_column("Montant total", justify="right")
+    table.add_column("Encaissé", justify="right")
+    table.add_column("Reste à payer", justify="right")
+    table.add_column("Contrats non soldés", justify="right")
+    for line in lines:
+        table.add_row(
+            line.label,
+            str(line.contracts),
+            str(line.montant_total),
+            str(line.montant_encaisse),
+            str(line.montant_restant),
+            str(line.unpaid_contracts),
+        )
+    return table
+
+
+def display_revenue_report(
+    since: Optional[datetime.date] = None,
+    until: Optional[datetime.date] = None,
+    session: Optional[DbSession] = None,
+) -> None:
+    """
+    Affiche le chiffre d'affaires et l'encours : total, par commercial, par
+    statut de contrat et pour les plus gros clients.
+
+    Chaque tableau provient d'une requête agrégée : aucun contrat n'est chargé.
+
+    Args:
+        since (date, optional): Première date de création des clients retenus.
+        until (date, optional): Dernière date de création des clients retenus.
+        session (Session, optional): La session de l'unité de travail en cours.
+    """
+    period = f"clients créés du {since or 'début'} au {until or 'aujourd’hui'}"
+    console.print(
+        _revenue_table(
+            f"Chiffre d'affaires ({period})",
+            "Période",
+            [revenue_totals(since, until, session=session)],
+        )
+    )
+    console.print(
+        _revenue_table(
+            "Par commercial",
+            "Commercial",
+            revenue_by_commercial(since, until, session=session),
+        )
+    )
+    console.print(
+        _revenue_table(
+            "Par statut de contrat",
+            "Statut",
+            revenue_by_statut(since, until, session=session),
+        )
+    )
+    console.print(
+        _revenue_table(
+            "Clients au plus gros chiffre d'affaires",
+            "Client",
+            revenue_by_client(since, until, session=session),
+        )
+    )
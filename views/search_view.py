@@ -0,0 +1,56 @@
+from typing import Optional
+from sqlalchemy.orm import Session as DbSession
+from rich.table import Table
+from controllers.search_controller import search_clients, search_events
+from views.event_view import client_name_of
+from views.main_view import console
+
+
+def display_search_results(query: str, session: Optional[DbSession] = None) -> None:
+    """
+    Affiche les clients et les événements correspondant à une recherche libre,
+    les plus pertinents en premier.
+
+    Args:
+        query (str): Les mots recherchés.
+        session (Session, optional): La session de l'unité de travail en cours.
+    """
+    clients = search_clients(query, session=session)
+    table = Table(show_header=True, header_style="bold cyan", title="Clients")
+    table.add_column("ID")
+    table.add_column("Nom complet")
+    table.add_column("Email")
+    table.add_column("Nom de l'entreprise")
+    table.add_column("Nom du commercial")
+    table.add_column("Score")
+    for client, score in clients:
+        table.add_row(
+            str(client.id),
+            client.nom_complet,
+            client.email,
+            str(client.nom_entreprise),
+            client.collaborateur.nom_utilisateur if client.collaborateur else "Inconnu",
+            f"{score:.2f}",
+        )
+    console.print(table)
+
+    events = search_events(query, session=session)
+    table = Table(show_header=True, header_style="bold cyan", title="Événements")
+    table.add_column("ID")
+    table.add_column("Nom du client")
+    table.add_column("Date de début")
+    table.add_column("Lieu")
+    table.add_column("Notes")
+    table.add_column("Score")
+    for event, score in events:
+        table.add_row(
+            str(event.id),
+            client_name_of(event),
+            str(event.date_debut),
+            str(event.lieu),
+            str(event.notes),
+            f"{score:.2f}",
+        )
+    console.print(table)
+    if not clients and not events:
+        print("Aucun résultat.")